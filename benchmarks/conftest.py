@@ -0,0 +1,19 @@
+import asyncio
+from typing import Iterator
+
+import pytest
+
+from eyepop.testing import MockServer, MockServerThread
+
+
+@pytest.fixture
+def mock_server() -> Iterator[MockServer]:
+    with MockServerThread(MockServer(frames_per_video=1)) as server:
+        yield server
+
+
+@pytest.fixture
+def loop() -> Iterator[asyncio.AbstractEventLoop]:
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
@@ -0,0 +1,20 @@
+import asyncio
+from typing import Any, Awaitable, Callable
+
+SECRET_KEY = 'benchmark secret key'
+TEST_IMAGE = 'tests/test.jpg'
+
+
+def run_rounds(benchmark: Any, loop: asyncio.AbstractEventLoop, workload: Callable[[], Awaitable[Any]],
+               units: int, unit: str, rounds: int = 5) -> None:
+    """Time `workload` on `loop` and record its throughput as `{unit}_per_sec` in the results."""
+    benchmark.pedantic(lambda: loop.run_until_complete(workload()), rounds=rounds, warmup_rounds=1)
+    record_rate(benchmark, units, unit)
+
+
+def record_rate(benchmark: Any, units: int, unit: str) -> None:
+    """Store the units per round and their rate at the mean round time with the results."""
+    benchmark.extra_info[unit] = units
+    if benchmark.disabled:
+        return
+    benchmark.extra_info[f'{unit}_per_sec'] = units / benchmark.stats.stats.mean
@@ -0,0 +1,56 @@
+import asyncio
+import io
+from typing import cast
+
+import pyarrow as pa
+import pytest
+
+from benchmarks.support import SECRET_KEY, run_rounds
+from eyepop import EyePopSdk
+from eyepop.data.arrow.eyepop.assets import eyepop_assets_from_table, table_from_eyepop_assets
+from eyepop.data.data_endpoint import DataEndpoint
+from eyepop.data.data_types import Asset
+from eyepop.testing import MockServer
+
+NUM_ROWS = 20_000
+
+
+def _connect(loop: asyncio.AbstractEventLoop, server: MockServer) -> DataEndpoint:
+    endpoint = cast(DataEndpoint, EyePopSdk.dataEndpoint(eyepop_url=server.url, secret_key=SECRET_KEY,
+                                                         is_async=True, disable_ws=True))
+    loop.run_until_complete(endpoint.connect())
+    return endpoint
+
+
+@pytest.mark.benchmark(group='arrow')
+def test_export_assets(benchmark, loop, mock_server):
+    mock_server.num_assets = NUM_ROWS
+    endpoint = _connect(loop, mock_server)
+
+    async def export() -> None:
+        stream = await endpoint.export_assets(dataset_uuid='dataset')
+        table = pa.ipc.open_file(pa.BufferReader(await stream.read())).read_all()
+        assert len(eyepop_assets_from_table(table)) == NUM_ROWS
+
+    try:
+        run_rounds(benchmark, loop, export, NUM_ROWS, 'rows')
+    finally:
+        loop.run_until_complete(endpoint.disconnect())
+
+
+@pytest.mark.benchmark(group='arrow')
+def test_import_assets(benchmark, loop, mock_server):
+    assets = [Asset(uuid=f'asset-{i}', mime_type='image/jpeg') for i in range(NUM_ROWS)]
+    endpoint = _connect(loop, mock_server)
+
+    async def import_table() -> None:
+        table = table_from_eyepop_assets(assets)
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+        await endpoint.import_assets(io.BytesIO(sink.getvalue().to_pybytes()), dataset_uuid='dataset')
+
+    try:
+        run_rounds(benchmark, loop, import_table, NUM_ROWS, 'rows')
+    finally:
+        loop.run_until_complete(endpoint.disconnect())
@@ -0,0 +1,101 @@
+import asyncio
+
+import pytest
+
+from benchmarks.support import SECRET_KEY, TEST_IMAGE, record_rate, run_rounds
+from eyepop import EyePopSdk
+from eyepop.testing import MockServer
+from eyepop.worker.worker_endpoint import WorkerEndpoint
+
+NUM_IMAGES = 64
+
+
+def _connect(loop: asyncio.AbstractEventLoop, server: MockServer, **kwargs) -> WorkerEndpoint:
+    endpoint = EyePopSdk.async_worker(eyepop_url=server.url, secret_key=SECRET_KEY, pop_id='transient', **kwargs)
+    loop.run_until_complete(endpoint.connect())
+    return endpoint
+
+
+async def _drain(job) -> int:
+    results = 0
+    while await job.predict() is not None:
+        results += 1
+    return results
+
+
+async def _upload_images(endpoint: WorkerEndpoint, count: int) -> None:
+    jobs = [await endpoint.upload(TEST_IMAGE) for _ in range(count)]
+    await asyncio.gather(*[_drain(job) for job in jobs])
+
+
+@pytest.mark.benchmark(group='upload')
+@pytest.mark.parametrize('concurrency', [1, 8, 32])
+def test_upload_throughput(benchmark, loop, mock_server, concurrency):
+    endpoint = _connect(loop, mock_server, job_queue_length=concurrency)
+    try:
+        run_rounds(benchmark, loop, lambda: _upload_images(endpoint, NUM_IMAGES), NUM_IMAGES, 'images')
+    finally:
+        loop.run_until_complete(endpoint.disconnect())
+
+
+@pytest.mark.benchmark(group='video')
+def test_video_predictions(benchmark, loop, mock_server):
+    mock_server.frames_per_video = 5000
+    endpoint = _connect(loop, mock_server)
+
+    async def stream_video() -> None:
+        job = await endpoint.load_from('http://media.test/clip.mp4')
+        assert await _drain(job) == mock_server.frames_per_video
+
+    try:
+        run_rounds(benchmark, loop, stream_video, mock_server.frames_per_video, 'predictions')
+    finally:
+        loop.run_until_complete(endpoint.disconnect())
+
+
+@pytest.mark.benchmark(group='facade')
+@pytest.mark.parametrize('facade', ['async', 'sync'])
+def test_facade(benchmark, loop, mock_server, facade):
+    if facade == 'async':
+        endpoint = _connect(loop, mock_server)
+        try:
+            run_rounds(benchmark, loop, lambda: _upload_images(endpoint, NUM_IMAGES), NUM_IMAGES, 'images')
+        finally:
+            loop.run_until_complete(endpoint.disconnect())
+        return
+
+    def upload_images() -> None:
+        jobs = [sync_endpoint.upload(TEST_IMAGE) for _ in range(NUM_IMAGES)]
+        for job in jobs:
+            while job.predict() is not None:
+                pass
+
+    sync_endpoint = EyePopSdk.sync_worker(eyepop_url=mock_server.url, secret_key=SECRET_KEY, pop_id='transient')
+    with sync_endpoint:
+        benchmark.pedantic(upload_images, rounds=5, warmup_rounds=1)
+    record_rate(benchmark, NUM_IMAGES, 'images')
+
+
+@pytest.mark.benchmark(group='load_from')
+@pytest.mark.parametrize('fan_out', [16, 128])
+def test_load_from_fan_out(benchmark, loop, mock_server, fan_out):
+    endpoint = _connect(loop, mock_server)
+
+    async def load_all() -> None:
+        jobs = [await endpoint.load_from(f'http://media.test/image-{i}.jpg') for i in range(fan_out)]
+        await asyncio.gather(*[_drain(job) for job in jobs])
+
+    try:
+        run_rounds(benchmark, loop, load_all, fan_out, 'jobs')
+    finally:
+        loop.run_until_complete(endpoint.disconnect())
+
+
+@pytest.mark.benchmark(group='request_tracer')
+@pytest.mark.parametrize('tracer', ['on', 'off'])
+def test_request_tracer_overhead(benchmark, loop, mock_server, tracer):
+    endpoint = _connect(loop, mock_server, request_tracer_max_buffer=1204 if tracer == 'on' else 0)
+    try:
+        run_rounds(benchmark, loop, lambda: _upload_images(endpoint, NUM_IMAGES), NUM_IMAGES, 'images')
+    finally:
+        loop.run_until_complete(endpoint.disconnect())
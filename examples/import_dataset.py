@@ -78,19 +78,21 @@ async def auto_annotate_with_test_classes(
         source: str
 ) -> int:
     assets = await endpoint.list_assets(dataset_uuid=dataset.uuid)
-    for asset in assets:
-        await endpoint.add_asset_annotation(
-            asset_uuid=asset.uuid,
-            auto_annotate=auto_annotate,
-            source=source,
-            predictions=(Prediction(
-                source_width=1.0,
-                source_height=1.0,
-                classes=[PredictedClass(
-                    classLabel="test_class"
-                )]
-            ),),
-        )
+    predictions = (Prediction(
+        source_width=1.0,
+        source_height=1.0,
+        classes=[PredictedClass(
+            classLabel="test_class"
+        )]
+    ),)
+    results = await endpoint.add_asset_annotations(
+        {asset.uuid: predictions for asset in assets},
+        auto_annotate=auto_annotate,
+        source=source,
+    )
+    for asset_uuid, error in results.items():
+        if error is not None:
+            log.warning("failed to annotate asset %s: %s", asset_uuid, error)
     return len(assets)
 
 async def approve_auto_annotate(
@@ -100,13 +102,15 @@ async def approve_auto_annotate(
         source: str
 ) -> int:
     assets = await endpoint.list_assets(dataset_uuid=dataset.uuid)
-    for asset in assets:
-        await endpoint.update_asset_annotation_approval(
-            asset_uuid=asset.uuid,
-            auto_annotate=auto_annotate,
-            source=source,
-            user_review=UserReview.approved,
-        )
+    results = await endpoint.update_asset_annotation_approvals(
+        [asset.uuid for asset in assets],
+        auto_annotate=auto_annotate,
+        source=source,
+        user_review=UserReview.approved,
+    )
+    for asset_uuid, error in results.items():
+        if error is not None:
+            log.warning("failed to approve annotation of asset %s: %s", asset_uuid, error)
     return len(assets)
 
 parser = argparse.ArgumentParser(
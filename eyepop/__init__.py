@@ -3,11 +3,36 @@ try:
 except ImportError:
     __version__ = "0.0.0+unknown"
 
+import importlib
+from typing import TYPE_CHECKING
+
 import eyepop.logging
-from eyepop import eyepopsdk
-from eyepop.worker import worker_jobs
-from eyepop import visualize
 
-EyePopSdk = eyepopsdk.EyePopSdk
-Job = worker_jobs.WorkerJob
-Plot = visualize.EyePopPlot
+if TYPE_CHECKING:
+    from eyepop.eyepopsdk import EyePopSdk
+    from eyepop.visualize import EyePopPlot as Plot
+    from eyepop.worker.worker_jobs import WorkerJob as Job
+
+# resolved on first access, `import eyepop` stays free of pyarrow, pandas and matplotlib
+_LAZY_ATTRIBUTES = {
+    "EyePopSdk": ("eyepop.eyepopsdk", "EyePopSdk"),
+    "Job": ("eyepop.worker.worker_jobs", "WorkerJob"),
+    "Plot": ("eyepop.visualize", "EyePopPlot"),
+}
+_LAZY_SUBMODULES = ("data", "eyepopsdk", "visualize", "worker")
+
+
+def __getattr__(name: str):
+    if name in _LAZY_SUBMODULES:
+        return importlib.import_module(f"eyepop.{name}")
+    target = _LAZY_ATTRIBUTES.get(name)
+    if target is None:
+        raise AttributeError(f"module 'eyepop' has no attribute '{name}'")
+    module_name, attribute = target
+    value = getattr(importlib.import_module(module_name), attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_LAZY_ATTRIBUTES, *_LAZY_SUBMODULES])
@@ -0,0 +1,299 @@
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import sys
+import time
+from collections import Counter
+from enum import StrEnum
+from typing import Any, Iterator, cast
+
+import aiohttp
+
+from eyepop.metrics import LatencyHistogram
+from eyepop.worker.worker_endpoint import WorkerEndpoint
+from eyepop.worker.worker_jobs import WorkerJob
+
+log = logging.getLogger('eyepop.bench')
+
+MEDIA_KINDS = ('image', 'group', 'video', 'url')
+PERCENTILES = (50.0, 95.0, 99.0)
+
+
+class Arrival(StrEnum):
+    """How job arrivals are spaced at a mean `rate` per second."""
+    constant = "constant"
+    poisson = "poisson"
+    burst = "burst"
+
+
+def arrival_gaps(arrival: Arrival, rate: float, burst_size: int = 1,
+                 rng: random.Random | None = None) -> Iterator[float]:
+    """Seconds before each next job arrives, the first job arrives at 0.
+
+    `constant` spaces jobs evenly, `poisson` draws exponential gaps and `burst` submits
+    `burst_size` jobs at once every `burst_size / rate` seconds.
+    """
+    if rate <= 0.0:
+        raise ValueError("rate must be positive")
+    rng = rng or random.Random()
+    yield 0.0
+    n = 1
+    while True:
+        if arrival == Arrival.constant:
+            yield 1.0 / rate
+        elif arrival == Arrival.poisson:
+            yield rng.expovariate(rate)
+        else:
+            yield burst_size / rate if n % burst_size == 0 else 0.0
+        n += 1
+
+
+def parse_mix(text: str) -> dict[str, float]:
+    """Parse a media mix like `image=3,url=1` into weights by media kind."""
+    mix: dict[str, float] = {}
+    for item in text.split(','):
+        kind, _, weight = item.strip().partition('=')
+        if kind not in MEDIA_KINDS:
+            raise ValueError(f"unknown media kind '{kind}', expected one of {', '.join(MEDIA_KINDS)}")
+        mix[kind] = float(weight) if weight else 1.0
+        if mix[kind] < 0.0:
+            raise ValueError(f"negative weight for '{kind}'")
+    if sum(mix.values()) <= 0.0:
+        raise ValueError("media mix needs a positive weight")
+    return mix
+
+
+class Media:
+    """The local files and URLs jobs are drawn from, by media kind."""
+
+    def __init__(self, images: list[str] | None = None, videos: list[str] | None = None,
+                 urls: list[str] | None = None, group_size: int = 4):
+        self.images = images or []
+        self.videos = videos or []
+        self.urls = urls or []
+        self.group_size = group_size
+
+    def check(self, mix: dict[str, float]) -> None:
+        required = {'image': (self.images, '--image'), 'group': (self.images, '--image'),
+                    'video': (self.videos, '--video'), 'url': (self.urls, '--url')}
+        for kind, weight in mix.items():
+            sources, option = required[kind]
+            if weight > 0.0 and not sources:
+                raise ValueError(f"media kind '{kind}' requires {option}")
+
+    async def submit(self, endpoint: WorkerEndpoint, kind: str, rng: random.Random) -> WorkerJob:
+        if kind == 'image':
+            return await endpoint.upload(rng.choice(self.images))
+        if kind == 'group':
+            return await endpoint.upload_group([rng.choice(self.images) for _ in range(self.group_size)])
+        if kind == 'video':
+            return await endpoint.upload(rng.choice(self.videos))
+        return await endpoint.load_from(rng.choice(self.urls))
+
+
+class LoadReport:
+    """Outcome of a load run.
+
+    Job latencies count from the scheduled arrival, so they include client-side queueing when
+    the endpoint is saturated.
+    """
+
+    def __init__(self):
+        self.submitted: Counter[str] = Counter()
+        self.completed: Counter[str] = Counter()
+        self.errors: Counter[str] = Counter()
+        self.results = 0
+        self.time_to_first_result = LatencyHistogram()
+        self.time_to_drain = LatencyHistogram()
+        self.duration_secs = 0.0
+
+    def summary(self, ps: tuple[float, ...] = PERCENTILES) -> dict[str, Any]:
+        duration = self.duration_secs or float('inf')
+        completed = sum(self.completed.values())
+        return {
+            'duration_secs': self.duration_secs,
+            'submitted': dict(self.submitted),
+            'completed': dict(self.completed),
+            'failed': sum(self.errors.values()),
+            'errors': dict(self.errors),
+            'jobs_per_sec': completed / duration,
+            'results_per_sec': self.results / duration,
+            'time_to_first_result': {f'p{p:g}': self.time_to_first_result.percentile(p) for p in ps},
+            'time_to_drain': {f'p{p:g}': self.time_to_drain.percentile(p) for p in ps},
+        }
+
+    def format(self) -> str:
+        summary = self.summary()
+        lines = [
+            f"duration         {summary['duration_secs']:.2f} s",
+            f"submitted        {sum(self.submitted.values())} {dict(self.submitted)}",
+            f"completed        {sum(self.completed.values())} {dict(self.completed)}",
+            f"throughput       {summary['jobs_per_sec']:.2f} jobs/s, {summary['results_per_sec']:.2f} results/s",
+        ]
+        for name in ('time_to_first_result', 'time_to_drain'):
+            latencies = ', '.join(f'{p} {secs * 1000:.1f} ms' for p, secs in summary[name].items())
+            lines.append(f"{name:16s} {latencies}")
+        lines.append(f"failed           {summary['failed']}")
+        for error, count in self.errors.most_common():
+            lines.append(f"  {error:14s} {count}")
+        return '\n'.join(lines)
+
+
+def describe_error(e: BaseException) -> str:
+    if isinstance(e, aiohttp.ClientResponseError):
+        return f'HTTP {e.status}'
+    return type(e).__name__
+
+
+async def run_load(
+        endpoint: WorkerEndpoint,
+        media: Media,
+        mix: dict[str, float],
+        arrival: Arrival = Arrival.constant,
+        rate: float = 10.0,
+        jobs: int | None = 100,
+        duration_secs: float | None = None,
+        burst_size: int = 10,
+        seed: int | None = None,
+) -> LoadReport:
+    """Submit jobs on the arrival schedule and report how they completed.
+
+    Jobs are submitted until `jobs` were submitted or `duration_secs` passed, then the run waits
+    until all of them are drained.
+    """
+    if jobs is None and duration_secs is None:
+        raise ValueError("either jobs or duration_secs is required")
+    media.check(mix)
+    rng = random.Random(seed)
+    kinds = list(mix)
+    weights = [mix[kind] for kind in kinds]
+    report = LoadReport()
+    tasks: set[asyncio.Task] = set()
+
+    async def run_job(kind: str, scheduled: float) -> None:
+        try:
+            job = await media.submit(endpoint, kind, rng)
+            result = await job.predict()
+            report.time_to_first_result.record(time.monotonic() - scheduled)
+            while result is not None:
+                report.results += 1
+                result = await job.predict()
+            report.time_to_drain.record(time.monotonic() - scheduled)
+            report.completed[kind] += 1
+        except Exception as e:
+            report.errors[describe_error(e)] += 1
+            log.debug('%s job failed', kind, exc_info=True)
+
+    start = time.monotonic()
+    scheduled = start
+    submitted = 0
+    for gap in arrival_gaps(arrival, rate, burst_size, rng):
+        scheduled += gap
+        if jobs is not None and submitted >= jobs:
+            break
+        if duration_secs is not None and scheduled - start >= duration_secs:
+            break
+        delay = scheduled - time.monotonic()
+        if delay > 0.0:
+            await asyncio.sleep(delay)
+        kind = rng.choices(kinds, weights)[0]
+        report.submitted[kind] += 1
+        submitted += 1
+        task = asyncio.create_task(run_job(kind, scheduled))
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+    if tasks:
+        await asyncio.gather(*tasks)
+    report.duration_secs = time.monotonic() - start
+    return report
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog='eyepop-bench',
+        description="Drive a worker endpoint with a configurable arrival process and media mix, "
+                    "and report throughput, time to first result and errors.",
+    )
+    target = parser.add_argument_group('target')
+    target.add_argument("--eyepop-url", default=os.getenv("EYEPOP_URL"), help="Defaults to EYEPOP_URL.")
+    target.add_argument("--secret-key", default=None, help="Defaults to EYEPOP_SECRET_KEY.")
+    target.add_argument("--api-key", default=None, help="Defaults to EYEPOP_API_KEY.")
+    target.add_argument("--pop-id", default=None, help="Defaults to EYEPOP_POP_ID or a transient pop.")
+    target.add_argument("--mock", action="store_true", help="Target a local eyepop.testing.MockServer.")
+    target.add_argument("--mock-latency", type=float, default=0.0, help="Mock seconds per job request.")
+    target.add_argument("--mock-jitter", type=float, default=0.0, help="Mock uniform +/- seconds of latency.")
+    target.add_argument("--mock-error-rate", type=float, default=0.0, help="Mock failure rate of job requests.")
+    target.add_argument("--mock-error-status", type=int, default=503)
+    target.add_argument("--mock-frames-per-video", type=int, default=30)
+    load = parser.add_argument_group('load')
+    load.add_argument("--arrival", type=Arrival, choices=list(Arrival), default=Arrival.constant)
+    load.add_argument("--rate", type=float, default=10.0, help="Mean job arrivals per second.")
+    load.add_argument("--burst-size", type=int, default=10, help="Jobs per burst with --arrival burst.")
+    load.add_argument("--jobs", type=int, default=100, help="Jobs to submit.")
+    load.add_argument("--duration", type=float, default=None,
+                      help="Seconds to submit jobs for, instead of --jobs.")
+    load.add_argument("--concurrency", type=int, default=32, help="Job queue length of the endpoint.")
+    load.add_argument("--mix", default="image=1", help="Media kind weights, e.g. image=3,group=1,video=1,url=1.")
+    load.add_argument("--image", action="append", default=[], help="Local image, repeatable.")
+    load.add_argument("--video", action="append", default=[], help="Local video, repeatable.")
+    load.add_argument("--url", action="append", default=[], help="Image or video URL, repeatable.")
+    load.add_argument("--group-size", type=int, default=4, help="Images per group job.")
+    load.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--json", default=None, help="Write the summary as JSON to this file.")
+    return parser.parse_args(argv)
+
+
+async def run(args: argparse.Namespace, media: Media, mix: dict[str, float],
+              eyepop_url: str | None, secret_key: str | None) -> LoadReport:
+    from eyepop import EyePopSdk
+
+    async with EyePopSdk.async_worker(
+            eyepop_url=eyepop_url,
+            secret_key=secret_key,
+            api_key=args.api_key,
+            pop_id=args.pop_id,
+            job_queue_length=args.concurrency,
+    ) as endpoint:
+        return await run_load(
+            cast(WorkerEndpoint, endpoint), media, mix,
+            arrival=args.arrival,
+            rate=args.rate,
+            jobs=None if args.duration is not None else args.jobs,
+            duration_secs=args.duration,
+            burst_size=args.burst_size,
+            seed=args.seed,
+        )
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    media = Media(images=args.image, videos=args.video, urls=args.url, group_size=args.group_size)
+    try:
+        mix = parse_mix(args.mix)
+        media.check(mix)
+    except ValueError as e:
+        print(f"eyepop-bench: {e}", file=sys.stderr)
+        return 2
+    if args.mock:
+        from eyepop.testing import MockServer, MockServerThread, RouteBehavior
+
+        behavior = RouteBehavior(latency_secs=args.mock_latency, jitter_secs=args.mock_jitter,
+                                 error_rate=args.mock_error_rate, error_status=args.mock_error_status)
+        server = MockServer(routes={'source': behavior, 'prepare_source': behavior},
+                            frames_per_video=args.mock_frames_per_video, seed=args.seed)
+        with MockServerThread(server):
+            report = asyncio.run(run(args, media, mix, server.url, 'mock secret key'))
+    else:
+        report = asyncio.run(run(args, media, mix, args.eyepop_url, args.secret_key))
+    print(report.format())
+    if args.json is not None:
+        with open(args.json, 'w') as f:
+            json.dump(report.summary(), f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -12,6 +12,8 @@ from eyepop.exceptions import ComputeSessionException, ComputeTokenException
 
 log = logging.getLogger("eyepop.compute")
 
+_SESSION_RESPONSE_ADAPTER = TypeAdapter(ComputeApiSessionResponse)
+
 
 async def fetch_session_endpoint(
     compute_ctx: ComputeContext,
@@ -130,7 +132,7 @@ async def fetch_new_compute_session(
 
 def _compute_context_from_response(compute_ctx: ComputeContext, res: dict | None | Any):
     try:
-        session_response = TypeAdapter(ComputeApiSessionResponse).validate_python(res)
+        session_response = _SESSION_RESPONSE_ADAPTER.validate_python(res)
     except Exception as e:
         raise ComputeSessionException(f"Invalid session response format: {str(e)}") from e
 
@@ -0,0 +1,149 @@
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Iterable
+
+from eyepop.data.types.enums import ChangeType
+from eyepop.data.types.events import ChangeEvent
+
+MISSING = object()
+
+ALIASES_TAG = "aliases"
+MODELS_TAG = "models"
+
+
+def dataset_tag(dataset_uuid: str) -> str:
+    return f"dataset:{dataset_uuid}"
+
+
+def model_tag(model_uuid: str) -> str:
+    return f"model:{model_uuid}"
+
+
+def dataset_stats_tag(dataset_uuid: str) -> str:
+    return f"dataset_stats:{dataset_uuid}"
+
+
+class MetadataCache:
+    """In-memory read-through cache for dataset, model and alias metadata of a DataEndpoint.
+
+    Entries expire after `ttl_secs` and are invalidated by tag, either by change events received
+    over the endpoint's websocket or by mutations made through the same endpoint. Cached values
+    are shared between callers and must not be modified.
+    """
+    ttl_secs: float
+    max_entries: int
+    hits: int
+    misses: int
+    generation: int
+
+    def __init__(self, ttl_secs: float, max_entries: int = 4096):
+        self.ttl_secs = ttl_secs
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.generation = 0
+        self._entries: OrderedDict[Hashable, tuple[float, Any, tuple[str, ...]]] = OrderedDict()
+        self._tag_to_keys: dict[str, set[Hashable]] = {}
+        self._tag_invalidated_at: dict[str, int] = {}
+        self._cleared_at = 0
+
+    def __len__(self) -> int:
+        """Number of cached entries, including expired ones not evicted yet."""
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return MISSING
+        expires_at, value, _ = entry
+        if expires_at < time.monotonic():
+            self._remove(key)
+            self.misses += 1
+            return MISSING
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: Hashable, value: Any, tags: Iterable[str], generation: int) -> None:
+        """Store a value fetched while the cache was at `generation`.
+
+        The value is dropped if one of its tags was invalidated since, it might predate that change.
+        """
+        tags = tuple(tags)
+        if self._cleared_at > generation:
+            return
+        if any(self._tag_invalidated_at.get(tag, 0) > generation for tag in tags):
+            return
+        self._remove(key)
+        self._entries[key] = (time.monotonic() + self.ttl_secs, value, tags)
+        for tag in tags:
+            self._tag_to_keys.setdefault(tag, set()).add(key)
+        while len(self._entries) > self.max_entries:
+            self._remove(next(iter(self._entries)))
+
+    def invalidate(self, *tags: str) -> None:
+        self.generation += 1
+        for tag in tags:
+            self._tag_invalidated_at[tag] = self.generation
+            for key in list(self._tag_to_keys.get(tag, ())):
+                self._remove(key)
+
+    def clear(self) -> None:
+        self.generation += 1
+        self._cleared_at = self.generation
+        self._entries.clear()
+        self._tag_to_keys.clear()
+        self._tag_invalidated_at.clear()
+
+    def on_change_event(self, change_event: ChangeEvent) -> None:
+        change_type = change_event.change_type
+        if change_type == ChangeType.events_lost:
+            self.clear()
+            return
+        tags = []
+        if change_event.dataset_uuid is not None:
+            if change_type in _DATASET_CHANGE_TYPES:
+                tags.append(dataset_tag(change_event.dataset_uuid))
+            elif change_type in _ASSET_CHANGE_TYPES:
+                tags.append(dataset_stats_tag(change_event.dataset_uuid))
+        if change_type in _MODEL_CHANGE_TYPES:
+            if change_event.mdl_uuid is not None:
+                tags.append(model_tag(change_event.mdl_uuid))
+            tags.append(MODELS_TAG)
+            tags.append(ALIASES_TAG)
+        if len(tags) > 0:
+            self.invalidate(*tags)
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for tag in entry[2]:
+            keys = self._tag_to_keys.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if len(keys) == 0:
+                    del self._tag_to_keys[tag]
+
+
+_DATASET_CHANGE_TYPES = {
+    ChangeType.dataset_added,
+    ChangeType.dataset_removed,
+    ChangeType.dataset_modified,
+    ChangeType.dataset_version_modified,
+}
+
+_ASSET_CHANGE_TYPES = {
+    ChangeType.asset_added,
+    ChangeType.asset_removed,
+    ChangeType.asset_status_modified,
+    ChangeType.asset_annotation_modified,
+}
+
+_MODEL_CHANGE_TYPES = {
+    ChangeType.model_added,
+    ChangeType.model_removed,
+    ChangeType.model_modified,
+    ChangeType.model_status_modified,
+}
@@ -0,0 +1,121 @@
+import asyncio
+import logging
+from collections import deque
+from typing import Any
+
+from eyepop.client_session import ClientSession
+
+log = logging.getLogger('eyepop.requests')
+
+
+class _PendingRequest:
+    def __init__(
+            self,
+            session: ClientSession,
+            status_path: str,
+            extra_headers: dict[str, str] | None,
+            future: asyncio.Future,
+    ):
+        self.session = session
+        self.status_path = status_path
+        self.extra_headers = extra_headers
+        self.future = future
+
+
+class CompletionTracker:
+    """Waits for the results of accepted asynchronous VLM requests, e.g. inference and evaluation.
+
+    Up to `max_pollers` pending requests each get their own long poll, so their results are picked
+    up as soon as the server has them, and open status requests are `min(pending, max_pollers)`.
+    Beyond that the pollers check the pending requests round-robin: a poller long polls while it
+    has no other request to check and falls back to short polls when requests are queued behind
+    it. That trades detection speed for the bound, completions are then seen at about
+    `max_pollers / short_poll_secs` per second. `max_pollers=None` long polls every pending
+    request, with one open status request each.
+    """
+    max_pollers: int | None
+    long_poll_secs: int
+    short_poll_secs: int
+
+    def __init__(self, max_pollers: int | None = 64, long_poll_secs: int = 20, short_poll_secs: int = 1):
+        self.max_pollers = max_pollers
+        self.long_poll_secs = long_poll_secs
+        self.short_poll_secs = short_poll_secs
+        self._pending: deque[_PendingRequest] = deque()
+        self._pollers: set[asyncio.Task] = set()
+
+    @property
+    def num_pending(self) -> int:
+        return len(self._pending)
+
+    @property
+    def num_pollers(self) -> int:
+        return len(self._pollers)
+
+    async def wait(
+            self,
+            session: ClientSession,
+            status_path: str,
+            extra_headers: dict[str, str] | None = None,
+            timeout: float | None = None,
+    ) -> Any:
+        """Return the json body of the first 200 response of `GET {status_path}?timeout=...`.
+
+        Raises `TimeoutError` if the request did not complete within `timeout` seconds.
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append(_PendingRequest(session, status_path, extra_headers, future))
+        if self.max_pollers is None or len(self._pollers) < self.max_pollers:
+            poller = asyncio.create_task(self._poll())
+            self._pollers.add(poller)
+        return await asyncio.wait_for(future, timeout)
+
+    async def close(self) -> None:
+        pollers = list(self._pollers)
+        for poller in pollers:
+            poller.cancel()
+        await asyncio.gather(*pollers, return_exceptions=True)
+        while len(self._pending) > 0:
+            future = self._pending.popleft().future
+            if not future.done():
+                future.set_exception(ConnectionError("endpoint disconnected"))
+
+    async def _poll(self) -> None:
+        try:
+            while len(self._pending) > 0:
+                await self._poll_next()
+        finally:
+            # leave the pool in the same step the queue was seen empty, so new requests get a poller
+            self._pollers.discard(asyncio.current_task())  # type: ignore[arg-type]
+
+    async def _poll_next(self) -> None:
+        pending = self._pending.popleft()
+        if pending.future.done():
+            # timed out or canceled by the waiting job
+            return
+        if self.max_pollers is None or len(self._pending) < len(self._pollers):
+            poll_secs = self.long_poll_secs
+        else:
+            poll_secs = self.short_poll_secs
+        try:
+            async with await pending.session.request_with_retry(
+                    method="GET",
+                    url=f"{pending.status_path}?timeout={poll_secs}",
+                    extra_headers=pending.extra_headers,
+            ) as resp:
+                if resp.status == 202:
+                    self._pending.append(pending)
+                elif resp.status == 200:
+                    result = await resp.json()
+                    if not pending.future.done():
+                        pending.future.set_result(result)
+                else:
+                    raise ValueError(f"Unexpected status code: {resp.status}")
+        except asyncio.CancelledError:
+            if not pending.future.done():
+                pending.future.set_exception(ConnectionError("endpoint disconnected"))
+            raise
+        except Exception as e:
+            log.debug("status request for %s failed: %s", pending.status_path, e)
+            if not pending.future.done():
+                pending.future.set_exception(e)
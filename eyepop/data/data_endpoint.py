@@ -1,28 +1,81 @@
 import asyncio
+import functools
 import json
+import os
+import time
 import warnings
 from asyncio import StreamReader
-from typing import Any, AsyncIterable, BinaryIO, Callable, Mapping, Sequence
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    BinaryIO,
+    Callable,
+    Hashable,
+    Iterable,
+    Mapping,
+    Sequence,
+    cast,
+)
 from urllib.parse import quote_plus, urlencode, urljoin
 
 import aiohttp
 import websockets
 from pydantic import TypeAdapter
-from pydantic.tools import parse_obj_as
 from websockets.asyncio.client import ClientConnection
 
 from eyepop.client_session import ClientSession
-from eyepop.data.arrow.schema import MIME_TYPE_APACHE_ARROW_FILE_VERSIONED
-from eyepop.data.data_jobs import DataJob, EvaluateJob, InferJob, _ImportFromJob, _UploadStreamJob
+from eyepop.data.data_cache import (
+    ALIASES_TAG,
+    MISSING,
+    MODELS_TAG,
+    MetadataCache,
+    dataset_stats_tag,
+    dataset_tag,
+    model_tag,
+)
+from eyepop.data.data_completion import CompletionTracker
+from eyepop.data.data_events import (
+    EventDispatcher,
+    EventHandlerStats,
+    EventOrdering,
+    EventOverflowPolicy,
+)
+from eyepop.data.data_export import (
+    ExportFileFormat,
+    ExportManifest,
+    ExportShard,
+    ExportShardStatus,
+    plan_manifest,
+    write_manifest,
+)
+from eyepop.data.data_import import (
+    ImportChunkFailure,
+    ImportResult,
+)
+from eyepop.data.data_infer_cache import InferCache
+from eyepop.data.data_jobs import (
+    DataJob,
+    EvaluateJob,
+    InferAssetsJob,
+    InferJob,
+    _ImportFromJob,
+    _UploadStreamJob,
+)
 from eyepop.data.data_types import (
     APPLICATION_JSON,
     AliasResolution,
     AnnotationInclusionMode,
+    AnnotationType,
     ArgoWorkflowPhase,
     ArtifactType,
     Asset,
+    AssetAnnotation,
     AssetImport,
     AssetInclusionMode,
+    AssetResultFormat,
     AssetUrlType,
     AutoAnnotate,
     ChangeEvent,
@@ -64,10 +117,36 @@ from eyepop.data.data_types import (
     VlmAbilityResponse,
     VlmAbilityUpdate,
 )
+from eyepop.data.data_upload import (
+    FileOpener,
+    UploadFailure,
+    UploadResult,
+    append_upload_journal,
+    file_sha256,
+    guess_mime_type,
+    open_upload_journal,
+    read_journaled_paths,
+    read_upload_journal,
+)
 from eyepop.data.types.vlm import AutoPromptConfig, AutoTask
 from eyepop.endpoint import Endpoint, log_requests
 from eyepop.settings import settings
 
+if TYPE_CHECKING:
+    # pyarrow is imported by the Arrow im- and export methods on first use
+    import pyarrow as pa
+
+
+@functools.cache
+def _adapter(response_type: Any) -> TypeAdapter:
+    """Validator per response type, built once; `parse_obj_as` rebuilt it on every call."""
+    return TypeAdapter(response_type)
+
+
+_EXPORT_WRITE_BUFFER_SIZE = 4 * 1024 * 1024
+
+_TRANSIENT_ERRORS = (aiohttp.ClientPayloadError, aiohttp.ClientConnectionError, asyncio.TimeoutError)
+
 WS_INITIAL_RECONNECT_DELAY = 1.0
 WS_MAX_RECONNECT_DELAY = 60.0
 
@@ -107,6 +186,10 @@ class DataEndpoint(Endpoint):
     ws_current_reconnect_delay: float | None
     account_event_handlers: set[EventHandler]
     dataset_uuid_to_event_handlers: dict[str, set[EventHandler]]
+    metadata_cache: MetadataCache | None
+    event_dispatcher: EventDispatcher
+    completion_tracker: CompletionTracker
+    infer_cache: InferCache | None
 
     def __init__(
             self,
@@ -117,7 +200,13 @@ class DataEndpoint(Endpoint):
             job_queue_length: int,
             request_tracer_max_buffer: int,
             disable_ws: bool = True,
-            api_key: str | None = None
+            api_key: str | None = None,
+            metadata_cache_ttl_secs: float | None = None,
+            event_queue_size: int = 1024,
+            event_overflow_policy: EventOverflowPolicy = EventOverflowPolicy.block,
+            event_ordering: EventOrdering = EventOrdering.handler,
+            completion_pollers: int | None = 64,
+            infer_cache: InferCache | None = None,
     ):
         super().__init__(
             secret_key=secret_key,
@@ -136,6 +225,14 @@ class DataEndpoint(Endpoint):
         self.ws_current_reconnect_delay = None
         self.account_event_handlers = set()
         self.dataset_uuid_to_event_handlers = dict()
+        self.event_dispatcher = EventDispatcher(
+            queue_size=event_queue_size,
+            overflow_policy=event_overflow_policy,
+            ordering=event_ordering,
+        )
+        self.metadata_cache = MetadataCache(metadata_cache_ttl_secs) if metadata_cache_ttl_secs is not None else None
+        self.completion_tracker = CompletionTracker(max_pollers=completion_pollers)
+        self.infer_cache = infer_cache
 
         self.add_retry_handler(404, self._retry_404)
 
@@ -149,6 +246,8 @@ class DataEndpoint(Endpoint):
 
     async def _disconnect(self, timeout: float | None = None):
         await self._ws_disconnect()
+        await self.event_dispatcher.close()
+        await self.completion_tracker.close()
 
     async def _reconnect(self):
         if self.dataset_api_url is not None:
@@ -164,8 +263,9 @@ class DataEndpoint(Endpoint):
                 config_url = f'{self.eyepop_url}/configs?account_uuid={self.account_uuid}'
             else:
                 config_url = f'{self.eyepop_url}/configs'
-        async with await self.request_with_retry("GET", config_url) as resp:
-            public_config = await resp.json()
+        with self._start_span('eyepop.reconnect'):
+            async with await self.request_with_retry("GET", config_url) as resp:
+                public_config = await resp.json()
         data_url = public_config.get('dataset_api_url', None)
         if data_url is not None:
             self.dataset_api_url = data_url
@@ -211,6 +311,9 @@ class DataEndpoint(Endpoint):
             await ws.send(message)
             log_requests.debug("ws send: %s", message)
 
+        if self.metadata_cache is not None:
+            # change events may have been missed while disconnected
+            self.metadata_cache.clear()
         self.ws_current_reconnect_delay = WS_INITIAL_RECONNECT_DELAY
         ws_reader_task = asyncio.create_task(self._ws_reader(ws))
 
@@ -229,11 +332,15 @@ class DataEndpoint(Endpoint):
         try:
             async for message in ws:
                 log_requests.debug("ws received %s", message)
+                # skip other messages without parsing them
+                if isinstance(message, str):
+                    if '"change_type"' not in message:
+                        continue
+                elif b'"change_type"' not in message:
+                    continue
                 try:
-                    data = json.loads(message)
-                    if "change_type" in data:
-                        change_event = ChangeEvent(**data)
-                        await self._dispatch_change_event(change_event)
+                    change_event = ChangeEvent.model_validate_json(message)
+                    await self._dispatch_change_event(change_event)
                 except Exception as e:
                     log_requests.exception(e)
         except websockets.ConnectionClosed:
@@ -278,18 +385,32 @@ class DataEndpoint(Endpoint):
     }
 
     async def _dispatch_change_event(self, change_event: ChangeEvent) -> None:
-        if change_event.change_type in self.account_event_handlers:
-            account_event_handlers = self.account_event_handlers.copy()
-            for handler in account_event_handlers:
-                await handler(change_event)
-        if change_event.change_type in self.dataset_event_handlers:
-            dataset_uuid = change_event.dataset_uuid
-            if dataset_uuid is not None:
-                event_handlers = self.dataset_uuid_to_event_handlers.get(dataset_uuid, None)
-                if event_handlers is not None:
-                    event_handlers = event_handlers.copy()
-                    for handler in event_handlers:
-                        await handler(change_event)
+        if self.metadata_cache is not None:
+            self.metadata_cache.on_change_event(change_event)
+        await self.event_dispatcher.dispatch(
+            change_event,
+            to_account=change_event.change_type in self.account_event_types,
+            to_dataset=change_event.change_type in self.dataset_event_handlers,
+        )
+
+    async def event_handler_stats(self) -> list[EventHandlerStats]:
+        return self.event_dispatcher.stats()
+
+    async def _cached(self, key: Hashable, tags: Sequence[str], fetch: Callable[[], Awaitable[Any]]) -> Any:
+        cache = self.metadata_cache
+        if cache is None:
+            return await fetch()
+        value = cache.get(key)
+        if value is not MISSING:
+            return value
+        generation = cache.generation
+        value = await fetch()
+        cache.put(key, value, tags, generation)
+        return value
+
+    def _invalidate_cached(self, *tags: str) -> None:
+        if self.metadata_cache is not None:
+            self.metadata_cache.invalidate(*tags)
 
     async def data_base_url(self) -> str:
         if self.dataset_api_url is None:
@@ -311,9 +432,11 @@ class DataEndpoint(Endpoint):
             raise ValueError("event handlers disabled, create endpoint with disable_ws=False "
                              "to register event handlers")
         self.account_event_handlers.add(event_handler)
+        await self.event_dispatcher.set_account_handlers(self.account_event_handlers)
 
     async def remove_account_event_handler(self, event_handler: EventHandler):
         self.account_event_handlers.discard(event_handler)
+        await self.event_dispatcher.set_account_handlers(self.account_event_handlers)
 
     async def add_dataset_event_handler(self, dataset_uuid: str, event_handler: EventHandler):
         if self.disable_ws:
@@ -334,11 +457,13 @@ class DataEndpoint(Endpoint):
                 log_requests.debug("ws send: %s", message)
 
         event_handlers.add(event_handler)
+        await self.event_dispatcher.set_dataset_handlers(dataset_uuid, event_handlers)
 
     async def remove_dataset_event_handler(self, dataset_uuid: str, event_handler: EventHandler):
         event_handlers = self.dataset_uuid_to_event_handlers.get(dataset_uuid, None)
         if event_handlers is not None:
             event_handlers.discard(event_handler)
+            await self.event_dispatcher.set_dataset_handlers(dataset_uuid, event_handlers)
             if len(event_handlers) == 0:
                 del self.dataset_uuid_to_event_handlers[dataset_uuid]
                 ws = self.ws
@@ -355,6 +480,7 @@ class DataEndpoint(Endpoint):
         event_handlers = self.dataset_uuid_to_event_handlers.get(dataset_uuid, None)
         if event_handlers is not None:
             del self.dataset_uuid_to_event_handlers[dataset_uuid]
+            await self.event_dispatcher.set_dataset_handlers(dataset_uuid, ())
             ws = self.ws
             if ws:
                 message = json.dumps({
@@ -380,7 +506,7 @@ class DataEndpoint(Endpoint):
         modifiable_version_only_query = f'&modifiable_version_only={modifiable_version_only}' if modifiable_version_only is not None else ''
         get_url = f'{await self.data_base_url()}/datasets?account_uuid={account_uuid}&include_hero_asset={include_hero_asset}{modifiable_version_only_query}'
         async with await self.request_with_retry("GET", get_url) as resp:
-            return TypeAdapter(list[Dataset]).validate_python(await resp.json())   # type: ignore [no-any-return]
+            return _adapter(list[Dataset]).validate_json(await resp.read())   # type: ignore [no-any-return]
 
     async def create_dataset(self, dataset: DatasetCreate, account_uuid: str | None = None) -> Dataset:
         if account_uuid is None:
@@ -390,7 +516,7 @@ class DataEndpoint(Endpoint):
         post_url = f'{await self.data_base_url()}/datasets?account_uuid={account_uuid}'
         async with await self.request_with_retry("POST", post_url, content_type=APPLICATION_JSON,
                                                  data=dataset.model_dump_json(exclude_unset=True)) as resp:
-            return TypeAdapter(Dataset).validate_python(await resp.json()) # type: ignore [no-any-return]
+            return _adapter(Dataset).validate_json(await resp.read()) # type: ignore [no-any-return]
 
     async def get_dataset(
             self,
@@ -399,23 +525,34 @@ class DataEndpoint(Endpoint):
             include_stats: bool = False,
             modifiable_version_only: bool | None = None
     ) -> Dataset:
-        version_query = f'&dataset_version={dataset_version}' if dataset_version is not None else ''
-        modifiable_version_only_query = f'&modifiable_version_only={modifiable_version_only}' if modifiable_version_only is not None else ''
-        get_url = f'{await self.data_base_url()}/datasets/{dataset_uuid}?include_stats={include_stats}{version_query}{modifiable_version_only_query}'
-        async with await self.request_with_retry("GET", get_url) as resp:
-            return TypeAdapter(Dataset).validate_python(await resp.json()) # type: ignore [no-any-return]
+        async def fetch() -> Dataset:
+            version_query = f'&dataset_version={dataset_version}' if dataset_version is not None else ''
+            modifiable_version_only_query = f'&modifiable_version_only={modifiable_version_only}' if modifiable_version_only is not None else ''
+            get_url = f'{await self.data_base_url()}/datasets/{dataset_uuid}?include_stats={include_stats}{version_query}{modifiable_version_only_query}'
+            async with await self.request_with_retry("GET", get_url) as resp:
+                return _adapter(Dataset).validate_json(await resp.read()) # type: ignore [no-any-return]
+
+        tags = [dataset_tag(dataset_uuid)]
+        if include_stats:
+            tags.append(dataset_stats_tag(dataset_uuid))
+        return await self._cached(  # type: ignore [no-any-return]
+            ("dataset", dataset_uuid, dataset_version, include_stats, modifiable_version_only), tags, fetch
+        )
 
     async def update_dataset(self, dataset_uuid: str, dataset: DatasetUpdate, start_auto_annotate: bool = True) -> Dataset:
         patch_url = f'{await self.data_base_url()}/datasets/{dataset_uuid}?start_auto_annotate={start_auto_annotate}'
         log_requests.debug('update_dataset: %s', dataset.model_dump_json())
         async with await self.request_with_retry("PATCH", patch_url, content_type=APPLICATION_JSON,
                                                  data=dataset.model_dump_json(exclude_unset=True, exclude_none=True)) as resp:
-            return TypeAdapter(Dataset).validate_python(await resp.json()) # type: ignore [no-any-return]
+            result = _adapter(Dataset).validate_json(await resp.read())
+        self._invalidate_cached(dataset_tag(dataset_uuid))
+        return result
 
     async def delete_dataset(self, dataset_uuid: str) -> None:
         delete_url = f'{await self.data_base_url()}/datasets/{dataset_uuid}'
         async with await self.request_with_retry("DELETE", delete_url):
-            return
+            pass
+        self._invalidate_cached(dataset_tag(dataset_uuid))
 
     async def analyze_dataset_version(self, dataset_uuid: str, dataset_version: int | None = None) -> None:
         version_query = f'&dataset_version={dataset_version}' if dataset_version is not None else ''
@@ -434,12 +571,16 @@ class DataEndpoint(Endpoint):
         version_query = f'&dataset_version={dataset_version}' if dataset_version is not None else ''
         post_url = f'{await self.data_base_url()}/datasets/{dataset_uuid}/freeze?{version_query}'
         async with await self.request_with_retry("POST", post_url) as resp:
-            return parse_obj_as(Dataset, await resp.json())  # type: ignore [no-any-return]
+            result = _adapter(Dataset).validate_json(await resp.read())
+        self._invalidate_cached(dataset_tag(dataset_uuid))
+        return result
 
     async def delete_dataset_version(self, dataset_uuid: str, dataset_version: int) -> Dataset:
         delete_url = f'{await self.data_base_url()}/datasets/{dataset_uuid}/versions?dataset_version={dataset_version}'
         async with await self.request_with_retry("DELETE", delete_url) as resp:
-            return parse_obj_as(Dataset, await resp.json())  # type: ignore [no-any-return]
+            result = _adapter(Dataset).validate_json(await resp.read())
+        self._invalidate_cached(dataset_tag(dataset_uuid))
+        return result
 
     async def delete_annotations(
             self,
@@ -453,7 +594,8 @@ class DataEndpoint(Endpoint):
         delete_url = (f'{await self.data_base_url()}/datasets/{dataset_uuid}/annotations'
                     f'?dataset_version={dataset_version}{user_reviews_query}')
         async with await self.request_with_retry("DELETE", delete_url):
-            return
+            pass
+        self._invalidate_cached(dataset_stats_tag(dataset_uuid))
 
     async def create_dataset_auto_annotate(
             self,
@@ -497,7 +639,7 @@ class DataEndpoint(Endpoint):
         source_query = f'source={quote_plus(source)}&' if source is not None else ''
         get_url = f'{await self.data_base_url()}/datasets/{dataset_uuid}/auto_annotates?{version_query}{auto_annotate_query}{source_query}'
         async with await self.request_with_retry("GET", get_url) as resp:
-            return TypeAdapter(list[DatasetAutoAnnotate]).validate_python(await resp.json()) # type: ignore [no-any-return]
+            return _adapter(list[DatasetAutoAnnotate]).validate_json(await resp.read()) # type: ignore [no-any-return]
 
     """ [EXPERIMENTAL] """
 
@@ -510,7 +652,8 @@ class DataEndpoint(Endpoint):
         job = EvaluateJob(
             evaluate_request=evaluate_request,
             session=session,
-            callback=self.metrics_collector,
+            callback=self.job_callback,
+            completion_tracker=self.completion_tracker,
         )
         await self._task_start(job.execute())
         return job
@@ -540,7 +683,7 @@ class DataEndpoint(Endpoint):
             no_transform=no_transform,
             session=session,
             on_ready=on_ready,
-            callback=self.metrics_collector,
+            callback=self.job_callback,
             timeout=timeout
         )
         await self._task_start(job.execute())
@@ -569,12 +712,121 @@ class DataEndpoint(Endpoint):
             session=session,
             partition=partition,
             on_ready=on_ready,
-            callback=self.metrics_collector,
+            callback=self.job_callback,
             timeout=timeout
         )
         await self._task_start(job.execute())
         return job
 
+    async def upload_assets(
+            self,
+            paths: Sequence[str],
+            dataset_uuid: str,
+            dataset_version: int | None = None,
+            concurrency: int = 8,
+            journal_path: str | None = None,
+            mime_type: str | None = None,
+            sync_transform: bool | None = None,
+            no_transform: bool | None = None,
+            max_retries: int = 3,
+            timeout: aiohttp.ClientTimeout | None = aiohttp.ClientTimeout(total=None, sock_read=600),
+            external_ids: Mapping[str, str] | None = None,
+            dedup_by_hash: bool = False,
+    ) -> UploadResult:
+        """Upload local files to a dataset, `concurrency` files at a time, skipping known files.
+
+        A file is uploaded with its `external_ids[path]` as `external_id`, or with the sha256 of its
+        content if `dedup_by_hash` is set and the caller supplied none. By default, with
+        `dedup_by_hash=False` and no `external_ids`, no file is deduplicated by content; only paths
+        already in the journal are skipped. Files whose external id
+        already is in the dataset, or in the journal at `journal_path`, or that duplicate another
+        file of this call, are skipped; so are paths already in the journal. Each successful upload
+        is appended to the journal, so an interrupted call can simply be repeated. Transient failures
+        are retried up to `max_retries` times, files that still fail are reported in `failed` of the
+        result.
+        """
+        start_time = time.time()
+        assets = await self.list_assets(
+            dataset_uuid=dataset_uuid,
+            dataset_version=dataset_version,
+            inclusion_mode=AssetInclusionMode.all_assets,
+        )
+        known_external_ids = {asset.external_id for asset in assets if asset.external_id is not None}
+        journaled_paths: set[str] = set()
+        journal = None
+        if journal_path is not None:
+            known_external_ids.update(await asyncio.to_thread(read_upload_journal, journal_path))
+            journaled_paths = await asyncio.to_thread(read_journaled_paths, journal_path)
+            journal = await asyncio.to_thread(open_upload_journal, journal_path)
+
+        result = UploadResult()
+        sem = asyncio.Semaphore(concurrency)
+
+        async def upload(path: str) -> None:
+            async with sem:
+                external_id = external_ids.get(path) if external_ids is not None else None
+                try:
+                    if path in journaled_paths:
+                        result.skipped.append(path)
+                        return
+                    if external_id is None and dedup_by_hash:
+                        external_id = await asyncio.to_thread(file_sha256, path)
+                    if external_id is not None:
+                        if external_id in known_external_ids:
+                            result.skipped.append(path)
+                            return
+                        known_external_ids.add(external_id)
+                    asset = await self._upload_file_with_retry(
+                        path=path,
+                        mime_type=mime_type if mime_type is not None else guess_mime_type(path),
+                        dataset_uuid=dataset_uuid,
+                        dataset_version=dataset_version,
+                        external_id=external_id,
+                        sync_transform=sync_transform,
+                        no_transform=no_transform,
+                        max_retries=max_retries,
+                        timeout=timeout,
+                    )
+                    result.uploaded[path] = asset.uuid
+                    result.num_bytes += asset.file_size_bytes or os.path.getsize(path)
+                    if journal is not None:
+                        await asyncio.to_thread(append_upload_journal, journal, path, external_id, asset.uuid)
+                except Exception as e:
+                    if external_id is not None:
+                        known_external_ids.discard(external_id)
+                    result.failed.append(UploadFailure(path=path, error=str(e)))
+
+        try:
+            await asyncio.gather(*[upload(path) for path in paths])
+        finally:
+            if journal is not None:
+                journal.close()
+        result.elapsed_secs = time.time() - start_time
+        log_requests.debug('uploaded %d assets (%d bytes) in %.3f seconds (%.1f assets/sec), '
+                           '%d skipped, %d failed',
+                           result.num_uploaded, result.num_bytes, result.elapsed_secs,
+                           result.assets_per_sec, result.num_skipped, result.num_failed)
+        return result
+
+    async def _upload_file_with_retry(self, path: str, max_retries: int, **upload_kwargs: Any) -> Asset:
+        opener = FileOpener(path)
+        failed_attempts = 0
+        try:
+            while True:
+                try:
+                    await asyncio.to_thread(opener.prepare)
+                    job = await self.upload_asset_job(stream=opener, **upload_kwargs)
+                    return await job.result()
+                except _TRANSIENT_ERRORS as e:
+                    failed_attempts += 1
+                    if failed_attempts > max_retries:
+                        raise e
+                    log_requests.info('upload of %s failed with %s, retry %d of %d',
+                                      path, e, failed_attempts, max_retries)
+                    await asyncio.sleep(2 ** (failed_attempts - 1))
+        finally:
+            opener.close()
+
     async def list_assets(
             self,
             dataset_uuid: str,
@@ -586,6 +838,105 @@ class DataEndpoint(Endpoint):
             include_auto_annotates: list[AutoAnnotate] | None = None,
             include_sources: list[str] | None = None,
     ) -> list[Asset]:
+        get_url = await self._list_assets_url(
+            dataset_uuid=dataset_uuid,
+            dataset_version=dataset_version,
+            include_annotations=include_annotations,
+            inclusion_mode=inclusion_mode,
+            annotation_inclusion_mode=annotation_inclusion_mode,
+            include_partitions=include_partitions,
+            include_auto_annotates=include_auto_annotates,
+            include_sources=include_sources,
+        )
+        async with await self.request_with_retry("GET", get_url) as resp:
+            return _adapter(list[Asset]).validate_json(await resp.read()) # type: ignore [no-any-return]
+
+    async def iter_assets(
+            self,
+            dataset_uuid: str,
+            dataset_version: int | None = None,
+            include_annotations: bool = False,
+            inclusion_mode: AssetInclusionMode = AssetInclusionMode.annotated_only,
+            annotation_inclusion_mode: AnnotationInclusionMode | None = None,
+            include_partitions: list[str] | None = None,
+            include_auto_annotates: list[AutoAnnotate] | None = None,
+            include_sources: list[str] | None = None,
+            page_size: int = 1000,
+            result_format: AssetResultFormat = AssetResultFormat.model,
+    ) -> "AsyncIterator[Asset | dict[str, Any] | pa.RecordBatch]":
+        """Iterate over the assets of a dataset, fetched and parsed one page of `page_size` at a time.
+
+        Yields `Asset` models, plain dicts without pydantic validation, or, for
+        `AssetResultFormat.arrow`, one Arrow record batch per page. Only one page is held in
+        memory. A server without paging support answers the first request with all assets,
+        which are then yielded from that single response.
+        """
+        async for page in self._iter_asset_pages(
+                dataset_uuid=dataset_uuid,
+                dataset_version=dataset_version,
+                include_annotations=include_annotations,
+                inclusion_mode=inclusion_mode,
+                annotation_inclusion_mode=annotation_inclusion_mode,
+                include_partitions=include_partitions,
+                include_auto_annotates=include_auto_annotates,
+                include_sources=include_sources,
+                page_size=page_size,
+                result_format=result_format,
+        ):
+            if result_format == AssetResultFormat.arrow:
+                yield page
+            else:
+                for asset in page:
+                    yield asset
+
+    async def _iter_asset_pages(
+            self,
+            page_size: int,
+            result_format: AssetResultFormat,
+            **list_kwargs: Any,
+    ) -> "AsyncIterator[list[Asset] | list[dict[str, Any]] | pa.RecordBatch]":
+        if page_size <= 0:
+            raise ValueError("page_size must be positive")
+        base_url = await self._list_assets_url(**list_kwargs)
+        offset = 0
+        first_uuid = None
+        while True:
+            get_url = f'{base_url}offset={offset}&limit={page_size}&'
+            async with await self.request_with_retry("GET", get_url) as resp:
+                body = await resp.read()
+            if result_format == AssetResultFormat.dict:
+                page = json.loads(body)
+                page_first_uuid = page[0].get("uuid") if len(page) > 0 else None
+            else:
+                page = _adapter(list[Asset]).validate_json(body)
+                page_first_uuid = page[0].uuid if len(page) > 0 else None
+            num_assets = len(page)
+            if num_assets == 0 or (offset > 0 and page_first_uuid == first_uuid):
+                # empty, or the server ignored the offset and repeated the first page
+                return
+            if offset == 0:
+                first_uuid = page_first_uuid
+            if result_format == AssetResultFormat.arrow:
+                from eyepop.data.arrow.eyepop.assets import record_batch_from_eyepop_assets
+                yield record_batch_from_eyepop_assets(page)
+            else:
+                yield page
+            if num_assets != page_size:
+                # a short page is the last one, a long page means the server ignored the limit
+                return
+            offset += num_assets
+
+    async def _list_assets_url(
+            self,
+            dataset_uuid: str,
+            dataset_version: int | None,
+            include_annotations: bool,
+            inclusion_mode: AssetInclusionMode,
+            annotation_inclusion_mode: AnnotationInclusionMode | None,
+            include_partitions: list[str] | None,
+            include_auto_annotates: list[AutoAnnotate] | None,
+            include_sources: list[str] | None,
+    ) -> str:
         include_partitions_query = ""
         if include_partitions is not None:
             for include_partition in include_partitions:
@@ -598,7 +949,7 @@ class DataEndpoint(Endpoint):
         if include_sources is not None:
             for include_source in include_sources:
                 include_sources_query += f"include_source={quote_plus(include_source)}&"
-        get_url = "".join([
+        return "".join([
             f'{await self.data_base_url()}/assets?dataset_uuid={dataset_uuid}&',
             f'dataset_version={dataset_version}&' if dataset_version is not None else '',
             f'include_annotations={"true" if include_annotations else "false"}&' if include_annotations is not None else '',
@@ -608,8 +959,6 @@ class DataEndpoint(Endpoint):
             f'{include_auto_annotates_query}',
             f'{include_sources_query}',
         ])
-        async with await self.request_with_retry("GET", get_url) as resp:
-            return parse_obj_as(list[Asset], await resp.json()) # type: ignore [no-any-return]
 
     async def get_asset(self, asset_uuid: str, dataset_uuid: str | None = None,
                         dataset_version: int | None = None, include_annotations: bool = False) -> Asset:
@@ -617,7 +966,7 @@ class DataEndpoint(Endpoint):
         version_query = f'&dataset_version={dataset_version}' if dataset_version is not None else ''
         get_url = f'{await self.data_base_url()}/assets/{asset_uuid}?include_annotations={"true" if include_annotations else "false"}{dataset_query}{version_query}'
         async with await self.request_with_retry("GET", get_url) as resp:
-            return parse_obj_as(Asset, await resp.json()) # type: ignore [no-any-return]
+            return _adapter(Asset).validate_json(await resp.read()) # type: ignore [no-any-return]
 
     async def delete_asset(self, asset_uuid: str, dataset_uuid: str | None = None,
                            dataset_version: int | None = None) -> None:
@@ -642,7 +991,7 @@ class DataEndpoint(Endpoint):
         patch_url = f'{await self.data_base_url()}/assets/{asset_uuid}/ground_truth?{dataset_query}{version_query}'
         async with await self.request_with_retry("PATCH", patch_url,
                                                  content_type=APPLICATION_JSON if ground_truth else None,
-                                                 data=TypeAdapter(Sequence[Prediction]).dump_json(
+                                                 data=_adapter(Sequence[Prediction]).dump_json(
                                                      ground_truth,
                                                      exclude_unset=True,
                                                      exclude_none=True,
@@ -693,7 +1042,7 @@ class DataEndpoint(Endpoint):
                    f'{url_type_query}')
         resp = await self.request_with_retry("GET", get_url)
         if 'application/json' in resp.headers.get('Content-Type', ''):
-            return parse_obj_as(DownloadResponse, await resp.json()) # type: ignore [no-any-return]
+            return _adapter(DownloadResponse).validate_json(await resp.read()) # type: ignore [no-any-return]
         else:
             return resp.content # type: ignore [no-any-return]
 
@@ -720,7 +1069,7 @@ class DataEndpoint(Endpoint):
 
         async with await self.request_with_retry("POST", post_url,
                                                  content_type=APPLICATION_JSON,
-                                                 data=TypeAdapter(Sequence[Prediction]).dump_json(
+                                                 data=_adapter(Sequence[Prediction]).dump_json(
                                                      predictions,
                                                      exclude_unset=True,
                                                      exclude_none=True,
@@ -750,6 +1099,109 @@ class DataEndpoint(Endpoint):
         async with await self.request_with_retry("PATCH", patch_url):
             return
 
+    async def add_asset_annotations(
+            self,
+            predictions_by_asset: Mapping[str, Sequence[Prediction]],
+            auto_annotate: AutoAnnotate | None = None,
+            source: str | None = None,
+            user_review: UserReview | None = None,
+            approved_threshold: float | None = None,
+            dataset_uuid: str | None = None,
+            dataset_version: int | None = None,
+            concurrency: int = 8,
+            use_import: bool = False,
+    ) -> dict[str, BaseException | None]:
+        """Add an annotation to many assets, `concurrency` requests at a time.
+
+        Returns, per asset uuid, None on success or the exception its request failed with.
+        With `use_import`, all annotations are written by a single Arrow `import_assets` request
+        instead, for servers that accept annotation imports of existing assets; a failure of that
+        request is then reported for every asset.
+        """
+        if use_import:
+            annotation_type = AnnotationType.auto if auto_annotate is not None else AnnotationType.ground_truth
+            assets = [Asset(uuid=asset_uuid, annotations=[AssetAnnotation(
+                type=annotation_type,
+                user_review=user_review if user_review is not None else UserReview.unknown,
+                approved_threshold=approved_threshold,
+                auto_annotate=auto_annotate,
+                source=source,
+                predictions=predictions,
+            )]) for asset_uuid, predictions in predictions_by_asset.items()]
+            from eyepop.data.arrow.eyepop.assets import table_from_eyepop_assets
+            from eyepop.data.arrow.streaming import stream_arrow_table
+
+            arrow_stream = stream_arrow_table(table_from_eyepop_assets(assets))
+            error: BaseException | None = None
+            try:
+                await self.import_assets(
+                    arrow_stream=arrow_stream,
+                    dataset_uuid=dataset_uuid,
+                    dataset_version=dataset_version,
+                )
+            except Exception as e:
+                error = e
+            return {asset_uuid: error for asset_uuid in predictions_by_asset}
+
+        return await self._for_each_asset(
+            list(predictions_by_asset.keys()),
+            lambda asset_uuid: self.add_asset_annotation(
+                asset_uuid=asset_uuid,
+                predictions=predictions_by_asset[asset_uuid],
+                auto_annotate=auto_annotate,
+                source=source,
+                user_review=user_review,
+                approved_threshold=approved_threshold,
+                dataset_uuid=dataset_uuid,
+                dataset_version=dataset_version,
+            ),
+            concurrency,
+        )
+
+    async def update_asset_annotation_approvals(
+            self,
+            asset_uuids: Sequence[str],
+            auto_annotate: AutoAnnotate | None = None,
+            source: str | None = None,
+            user_review: UserReview | None = None,
+            approved_threshold: float | None = None,
+            dataset_uuid: str | None = None,
+            dataset_version: int | None = None,
+            concurrency: int = 8,
+    ) -> dict[str, BaseException | None]:
+        """Update the annotation approval of many assets, `concurrency` requests at a time.
+
+        Returns, per asset uuid, None on success or the exception its request failed with.
+        """
+        return await self._for_each_asset(
+            asset_uuids,
+            lambda asset_uuid: self.update_asset_annotation_approval(
+                asset_uuid=asset_uuid,
+                auto_annotate=auto_annotate,
+                source=source,
+                user_review=user_review,
+                approved_threshold=approved_threshold,
+                dataset_uuid=dataset_uuid,
+                dataset_version=dataset_version,
+            ),
+            concurrency,
+        )
+
+    @staticmethod
+    async def _for_each_asset(
+            asset_uuids: Sequence[str],
+            request: Callable[[str], Awaitable[Any]],
+            concurrency: int,
+    ) -> dict[str, BaseException | None]:
+        sem = asyncio.Semaphore(concurrency)
+
+        async def run(asset_uuid: str) -> None:
+            async with sem:
+                await request(asset_uuid)
+
+        results = await asyncio.gather(*[run(asset_uuid) for asset_uuid in asset_uuids], return_exceptions=True)
+        return dict(zip(asset_uuids, results, strict=True))
+
     async def add_asset_roi(
             self,
             asset_uuid: str,
@@ -794,9 +1246,13 @@ class DataEndpoint(Endpoint):
             account_uuid = self.account_uuid
         if account_uuid is None:
             raise ValueError("Listing models requires an account uuid")
-        get_url = f'{await self.data_base_url()}/models?account_uuid={account_uuid}'
-        async with await self.request_with_retry("GET", get_url) as resp:
-            return parse_obj_as(list[Model], await resp.json()) # type: ignore [no-any-return]
+
+        async def fetch() -> list[Model]:
+            get_url = f'{await self.data_base_url()}/models?account_uuid={account_uuid}'
+            async with await self.request_with_retry("GET", get_url) as resp:
+                return _adapter(list[Model]).validate_json(await resp.read()) # type: ignore [no-any-return]
+
+        return await self._cached(("models", account_uuid), [MODELS_TAG], fetch)  # type: ignore [no-any-return]
 
     async def create_model(self, model: ModelCreate, account_uuid: str | None = None) -> Model:
         if account_uuid is None:
@@ -806,7 +1262,9 @@ class DataEndpoint(Endpoint):
         post_url = f'{await self.data_base_url()}/models?account_uuid={account_uuid}&start_training=False'
         async with await self.request_with_retry("POST", post_url, content_type=APPLICATION_JSON,
                                                  data=model.model_dump_json(exclude_unset=True)) as resp:
-            return parse_obj_as(Model, await resp.json()) # type: ignore [no-any-return]
+            result = _adapter(Model).validate_json(await resp.read())
+        self._invalidate_cached(MODELS_TAG)
+        return result
 
     async def upload_model_artifact(self, model_uuid: str, model_format: ModelExportFormat, artifact_name: str,
                                     stream: BinaryIO, mime_type: str = 'application/octet-stream',
@@ -826,23 +1284,29 @@ class DataEndpoint(Endpoint):
                    f'{f"?{variant_query}" if variant_query else ""}')
         async with await self.request_with_retry("PUT", put_url, data=stream, content_type=mime_type,
                                                  timeout=aiohttp.ClientTimeout(total=None, sock_read=600)):
-            return
+            pass
+        self._invalidate_cached(model_tag(model_uuid))
 
     async def create_model_from_dataset(self, dataset_uuid: str, dataset_version: int | None, model: ModelCreate, start_training: bool = True) -> Model:
         post_url = f'{await self.data_base_url()}/models?dataset_uuid={dataset_uuid}&dataset_version={dataset_version}&start_training={start_training}'
         async with await self.request_with_retry("POST", post_url, content_type=APPLICATION_JSON,
                                                  data=model.model_dump_json(exclude_unset=True)) as resp:
-            return parse_obj_as(Model, await resp.json()) # type: ignore [no-any-return]
+            result = _adapter(Model).validate_json(await resp.read())
+        self._invalidate_cached(MODELS_TAG)
+        return result
 
     async def get_model(self, model_uuid: str) -> Model:
-        get_url = f'{await self.data_base_url()}/models/{model_uuid}'
-        async with await self.request_with_retry("GET", get_url) as resp:
-            return parse_obj_as(Model, await resp.json()) # type: ignore [no-any-return]
+        async def fetch() -> Model:
+            get_url = f'{await self.data_base_url()}/models/{model_uuid}'
+            async with await self.request_with_retry("GET", get_url) as resp:
+                return _adapter(Model).validate_json(await resp.read()) # type: ignore [no-any-return]
+
+        return await self._cached(("model", model_uuid), [model_tag(model_uuid)], fetch)  # type: ignore [no-any-return]
 
     async def get_model_progress(self, model_uuid: str) -> ModelTrainingProgress:
         get_url = f'{await self.data_base_url()}/models/{model_uuid}/progress'
         async with await self.request_with_retry("GET", get_url) as resp:
-            return parse_obj_as(ModelTrainingProgress, await resp.json()) # type: ignore [no-any-return]
+            return _adapter(ModelTrainingProgress).validate_json(await resp.read()) # type: ignore [no-any-return]
 
     async def update_model(self, model_uuid: str, model: ModelUpdate) -> Model:
         patch_url = f'{await self.data_base_url()}/models/{model_uuid}'
@@ -850,22 +1314,29 @@ class DataEndpoint(Endpoint):
                                                  data=model.model_dump_json(
                                                      exclude_unset=True, exclude_none=True
                                                  )) as resp:
-            return parse_obj_as(Model, await resp.json()) # type: ignore [no-any-return]
+            result = _adapter(Model).validate_json(await resp.read())
+        self._invalidate_cached(model_tag(model_uuid), MODELS_TAG, ALIASES_TAG)
+        return result
 
     async def delete_model(self, model_uuid: str) -> None:
         delete_url = f'{await self.data_base_url()}/models/{model_uuid}'
         async with await self.request_with_retry("DELETE", delete_url):
-            return
+            pass
+        self._invalidate_cached(model_tag(model_uuid), MODELS_TAG, ALIASES_TAG)
 
     async def train_model(self, model_uuid: str) -> Model:
         post_url = f'{await self.data_base_url()}/models/{model_uuid}/train'
         async with await self.request_with_retry("POST", post_url) as resp:
-            return parse_obj_as(Model, await resp.json()) # type: ignore [no-any-return]
+            result = _adapter(Model).validate_json(await resp.read())
+        self._invalidate_cached(model_tag(model_uuid), MODELS_TAG, ALIASES_TAG)
+        return result
 
     async def publish_model(self, model_uuid: str) -> Model:
         post_url = f'{await self.data_base_url()}/models/{model_uuid}/publish'
         async with await self.request_with_retry("POST", post_url) as resp:
-            return parse_obj_as(Model, await resp.json()) # type: ignore [no-any-return]
+            result = _adapter(Model).validate_json(await resp.read())
+        self._invalidate_cached(model_tag(model_uuid), MODELS_TAG, ALIASES_TAG)
+        return result
 
     """ Model aliases methods """
 
@@ -879,7 +1350,7 @@ class DataEndpoint(Endpoint):
             raise ValueError("Listing model aliases requires an account uuid")
         get_url = f'{await self.data_base_url()}/model_aliases?account_uuid={account_uuid}'
         async with await self.request_with_retry("GET", get_url) as resp:
-            return parse_obj_as(list[ModelAlias], await resp.json()) # type: ignore [no-any-return]
+            return _adapter(list[ModelAlias]).validate_json(await resp.read()) # type: ignore [no-any-return]
 
     async def create_model_alias(
             self,
@@ -894,17 +1365,21 @@ class DataEndpoint(Endpoint):
         post_url = f'{await self.data_base_url()}/model_aliases?account_uuid={account_uuid}&dry_run={dry_run}'
         async with await self.request_with_retry("POST", post_url, content_type=APPLICATION_JSON,
                                                  data=model_alias.model_dump_json(exclude_unset=True)) as resp:
-            return parse_obj_as(ModelAlias, await resp.json()) # type: ignore [no-any-return]
+            result = _adapter(ModelAlias).validate_json(await resp.read())
+        if not dry_run:
+            self._invalidate_cached(ALIASES_TAG)
+        return result
 
     async def get_model_alias(self, name: str) -> ModelAlias:
         get_url = f'{await self.data_base_url()}/model_aliases/{name}'
         async with await self.request_with_retry("GET", get_url) as resp:
-            return parse_obj_as(ModelAlias, await resp.json()) # type: ignore [no-any-return]
+            return _adapter(ModelAlias).validate_json(await resp.read()) # type: ignore [no-any-return]
 
     async def delete_model_alias(self, name: str) -> None:
         delete_url = f'{await self.data_base_url()}/model_aliases/{name}'
         async with await self.request_with_retry("DELETE", delete_url):
-            return
+            pass
+        self._invalidate_cached(ALIASES_TAG)
 
     async def update_model_alias(self, name: str, model_alias: ModelAliasUpdate) -> ModelAlias:
         patch_url = f'{await self.data_base_url()}/model_aliases/{name}'
@@ -912,17 +1387,21 @@ class DataEndpoint(Endpoint):
                                                  data=model_alias.model_dump_json(
                                                      exclude_unset=True, exclude_none=True
                                                  )) as resp:
-            return parse_obj_as(ModelAlias, await resp.json()) # type: ignore [no-any-return]
+            result = _adapter(ModelAlias).validate_json(await resp.read())
+        self._invalidate_cached(ALIASES_TAG)
+        return result
 
     async def set_model_alias_tag(self, name: str, tag: str, model_uuid: str) -> None:
         patch_url = f'{await self.data_base_url()}/model_aliases/{name}/{tag}?model_uuid={model_uuid}'
         async with await self.request_with_retry("PATCH", patch_url):
-            return
+            pass
+        self._invalidate_cached(ALIASES_TAG)
 
     async def delete_model_alias_tag(self, name: str, tag: str) -> None:
         delete_url = f'{await self.data_base_url()}/model_aliases/{name}/{tag}'
         async with await self.request_with_retry("DELETE", delete_url):
-            return
+            pass
+        self._invalidate_cached(ALIASES_TAG)
 
     """ Arrow im and export methods """
     async def export_assets(
@@ -941,6 +1420,8 @@ class DataEndpoint(Endpoint):
             include_auto_annotates: list[AutoAnnotate] | None = None,
             include_sources: list[str] | None = None,
     ) -> StreamReader:
+        from eyepop.data.arrow.schema import MIME_TYPE_APACHE_ARROW_FILE_VERSIONED
+
         asset_url_type_query = f'asset_url_type={asset_url_type}&' if asset_url_type is not None else ''
         dataset_uuid_query = f'dataset_uuid={dataset_uuid}&' if dataset_uuid is not None else ''
         dataset_version_query = f'dataset_version={dataset_version}&' if dataset_version is not None else ''
@@ -992,19 +1473,264 @@ class DataEndpoint(Endpoint):
             dataset_version: int | None = None,
             model_uuid: str | None = None
     ) -> None:
-        dataset_uuid_query = f'dataset_uuid={dataset_uuid}&' if dataset_uuid is not None else ''
-        dataset_version_query = f'dataset_version={dataset_version}&' if dataset_version is not None else ''
-        model_uuid_query = f'model_uuid={model_uuid}&' if model_uuid is not None else ''
-        post_url = (f'{await self.data_base_url()}/imports/assets?'
-                   f'{dataset_uuid_query}'
-                   f'{dataset_version_query}'
-                   f'{model_uuid_query}')
-        await self.request_with_retry(
+        from eyepop.data.arrow.schema import MIME_TYPE_APACHE_ARROW_FILE_VERSIONED
+
+        post_url = await self._import_assets_url(dataset_uuid, dataset_version, model_uuid)
+        async with await self.request_with_retry(
             "POST", post_url,
             data=arrow_stream,
             content_type=MIME_TYPE_APACHE_ARROW_FILE_VERSIONED,
             timeout=aiohttp.ClientTimeout(total=None, sock_read=600)
+        ):
+            pass
+
+    async def _import_assets_url(
+            self,
+            dataset_uuid: str | None,
+            dataset_version: int | None,
+            model_uuid: str | None
+    ) -> str:
+        dataset_uuid_query = f'dataset_uuid={dataset_uuid}&' if dataset_uuid is not None else ''
+        dataset_version_query = f'dataset_version={dataset_version}&' if dataset_version is not None else ''
+        model_uuid_query = f'model_uuid={model_uuid}&' if model_uuid is not None else ''
+        return (f'{await self.data_base_url()}/imports/assets?'
+                f'{dataset_uuid_query}'
+                f'{dataset_version_query}'
+                f'{model_uuid_query}')
+
+    async def import_assets_chunked(
+            self,
+            source: "pa.Table | str",
+            dataset_uuid: str | None = None,
+            dataset_version: int | None = None,
+            model_uuid: str | None = None,
+            max_chunk_rows: int = 1024,
+            concurrency: int = 4,
+            max_retries: int = 3,
+            callback: Callable[[int], None] | None = None,
+    ) -> ImportResult:
+        """Import a table, Parquet file or directory as independent requests of `max_chunk_rows` rows.
+
+        At most `concurrency` chunks are read, encoded or in flight at any time, so memory stays
+        bounded for large sources. A chunk that fails with a transient error is retried on its own,
+        up to `max_retries` times; chunks that still fail are reported in `failed_chunks` of the
+        result, with their row offsets, instead of aborting the other chunks.
+
+        `callback` receives the row count of every imported chunk. Unlike the `on_ready` callbacks
+        of the job based methods there is no job per chunk to pass; the counts of all calls add up
+        to `num_rows` of the result, so they can drive a progress bar over `source.num_rows`.
+        """
+        from eyepop.data.arrow.schema import MIME_TYPE_APACHE_ARROW_FILE_VERSIONED
+        from eyepop.data.data_import import iter_import_chunks, serialize_import_chunk
+
+        post_url = await self._import_assets_url(dataset_uuid, dataset_version, model_uuid)
+        result = ImportResult()
+        sem = asyncio.Semaphore(concurrency)
+
+        async def import_chunk(index: int, row_offset: int, chunk: "pa.Table") -> None:
+            failed_attempts = 0
+            try:
+                data = await asyncio.to_thread(serialize_import_chunk, chunk)
+                while True:
+                    try:
+                        async with await self.request_with_retry(
+                            "POST", post_url,
+                            data=data,
+                            content_type=MIME_TYPE_APACHE_ARROW_FILE_VERSIONED,
+                            timeout=aiohttp.ClientTimeout(total=None, sock_read=600)
+                        ):
+                            pass
+                        break
+                    except _TRANSIENT_ERRORS as e:
+                        failed_attempts += 1
+                        if failed_attempts > max_retries:
+                            raise e
+                        log_requests.info('import chunk %d failed with %s, retry %d of %d',
+                                          index, e, failed_attempts, max_retries)
+                        await asyncio.sleep(2 ** (failed_attempts - 1))
+                result.num_rows += chunk.num_rows
+                if callback is not None:
+                    callback(chunk.num_rows)
+            except Exception as e:
+                result.failed_chunks.append(ImportChunkFailure(
+                    index=index, row_offset=row_offset, num_rows=chunk.num_rows, error=str(e)
+                ))
+            finally:
+                sem.release()
+
+        start_time = time.time()
+        chunks = iter_import_chunks(source, max_chunk_rows)
+        tasks = []
+        row_offset = 0
+        try:
+            while True:
+                await sem.acquire()
+                chunk = await asyncio.to_thread(next, chunks, None)
+                if chunk is None:
+                    sem.release()
+                    break
+                tasks.append(asyncio.create_task(import_chunk(result.num_chunks, row_offset, chunk)))
+                result.num_chunks += 1
+                row_offset += chunk.num_rows
+            await asyncio.gather(*tasks)
+        finally:
+            # reading the source failed or the import was canceled, don't leave chunks in flight
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        result.failed_chunks.sort(key=lambda failure: failure.index)
+        result.elapsed_secs = time.time() - start_time
+        log_requests.debug('imported %d rows in %d chunks in %.3f seconds (%.1f rows/sec), %d chunks failed',
+                           result.num_rows, result.num_chunks, result.elapsed_secs,
+                           result.rows_per_sec, len(result.failed_chunks))
+        return result
+
+    async def export_assets_sharded(
+            self,
+            output_dir: str,
+            dataset_uuid: str,
+            dataset_version: int | None = None,
+            asset_uuids: list[str] | None = None,
+            shard_size: int = 100,
+            concurrency: int = 4,
+            file_format: ExportFileFormat = ExportFileFormat.arrow,
+            max_retries: int = 3,
+            model_uuid: str | None = None,
+            transcode_mode: TranscodeMode = TranscodeMode.image_original_size,
+            asset_url_type: AssetUrlType | None = None,
+            inclusion_mode: AssetInclusionMode = AssetInclusionMode.annotated_only,
+            annotation_inclusion_mode: AnnotationInclusionMode = AnnotationInclusionMode.all,
+            include_external_ids: bool = False,
+            include_partitions: list[str] | None = None,
+            include_auto_annotates: list[AutoAnnotate] | None = None,
+            include_sources: list[str] | None = None,
+    ) -> ExportManifest:
+        """Export a dataset as shards of `shard_size` assets into `output_dir`, `concurrency` shards at a time.
+
+        Each shard is one `export_assets` request restricted to its asset uuids (passed in the
+        query string, which bounds practical shard sizes) and lands in its own Arrow or Parquet
+        file. Completed shards are recorded in `manifest.json`; calling this again with the same
+        arguments only exports the shards that are missing or failed, a call with different
+        filters exports all shards again. Raises the first shard error after all other shards
+        finished.
+        """
+        if asset_uuids is None:
+            assets = await self.list_assets(
+                dataset_uuid=dataset_uuid,
+                dataset_version=dataset_version,
+                include_annotations=False,
+                inclusion_mode=inclusion_mode,
+                include_partitions=include_partitions,
+                include_auto_annotates=include_auto_annotates,
+                include_sources=include_sources,
+            )
+            asset_uuids = [asset.uuid for asset in assets]
+
+        await asyncio.to_thread(os.makedirs, output_dir, exist_ok=True)
+        manifest, shards_uuids = await asyncio.to_thread(
+            plan_manifest,
+            output_dir=output_dir,
+            asset_uuids=asset_uuids,
+            shard_size=shard_size,
+            file_format=file_format,
+            dataset_uuid=dataset_uuid,
+            dataset_version=dataset_version,
+            filters={
+                'model_uuid': model_uuid,
+                'transcode_mode': transcode_mode,
+                'asset_url_type': asset_url_type,
+                'inclusion_mode': inclusion_mode,
+                'annotation_inclusion_mode': annotation_inclusion_mode,
+                'include_external_ids': include_external_ids,
+                'include_partitions': include_partitions,
+                'include_auto_annotates': include_auto_annotates,
+                'include_sources': include_sources,
+            },
         )
+        await asyncio.to_thread(write_manifest, output_dir, manifest)
+
+        manifest_lock = asyncio.Lock()
+        sem = asyncio.Semaphore(concurrency)
+
+        async def export_shard(shard: ExportShard, shard_uuids: list[str]) -> None:
+            async with sem:
+                failed_attempts = 0
+                try:
+                    while True:
+                        try:
+                            shard.num_bytes = await self._export_shard(
+                                path=os.path.join(output_dir, shard.file_name),
+                                file_format=file_format,
+                                dataset_uuid=dataset_uuid,
+                                dataset_version=dataset_version,
+                                asset_uuids=shard_uuids,
+                                model_uuid=model_uuid,
+                                transcode_mode=transcode_mode,
+                                asset_url_type=asset_url_type,
+                                inclusion_mode=inclusion_mode,
+                                annotation_inclusion_mode=annotation_inclusion_mode,
+                                include_external_ids=include_external_ids,
+                                include_partitions=include_partitions,
+                                include_auto_annotates=include_auto_annotates,
+                                include_sources=include_sources,
+                            )
+                            shard.status = ExportShardStatus.completed
+                            shard.error = None
+                            return
+                        except _TRANSIENT_ERRORS as e:
+                            failed_attempts += 1
+                            if failed_attempts > max_retries:
+                                raise e
+                            log_requests.info('export shard %d failed with %s, retry %d of %d',
+                                              shard.index, e, failed_attempts, max_retries)
+                            await asyncio.sleep(2 ** (failed_attempts - 1))
+                except Exception as e:
+                    shard.status = ExportShardStatus.failed
+                    shard.error = str(e)
+                    raise e
+                finally:
+                    async with manifest_lock:
+                        await asyncio.to_thread(write_manifest, output_dir, manifest)
+
+        start_time = time.time()
+        pending = [
+            export_shard(shard, shard_uuids)
+            for shard, shard_uuids in zip(manifest.shards, shards_uuids, strict=True)
+            if shard.status != ExportShardStatus.completed
+        ]
+        results = await asyncio.gather(*pending, return_exceptions=True)
+        log_requests.debug('exported %d of %d shards in %.3f seconds',
+                           len(pending), len(manifest.shards), time.time() - start_time)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        return manifest
+
+    async def _export_shard(self, path: str, file_format: ExportFileFormat, **export_kwargs: Any) -> int:
+        arrow_path = path if file_format == ExportFileFormat.arrow else f"{path}.arrow"
+        partial_path = f"{arrow_path}.partial"
+        # the content of the aiohttp response
+        stream = cast(aiohttp.StreamReader, await self.export_assets(**export_kwargs))
+        num_bytes = 0
+        # file IO in a worker thread, buffered so a thread hop writes several MB at once
+        f = await asyncio.to_thread(open, partial_path, "wb")
+        try:
+            buffer = bytearray()
+            async for chunk in stream.iter_chunked(65536):
+                buffer.extend(chunk)
+                num_bytes += len(chunk)
+                if len(buffer) >= _EXPORT_WRITE_BUFFER_SIZE:
+                    await asyncio.to_thread(f.write, bytes(buffer))
+                    buffer.clear()
+            if buffer:
+                await asyncio.to_thread(f.write, bytes(buffer))
+        finally:
+            await asyncio.to_thread(f.close)
+        await asyncio.to_thread(os.replace, partial_path, arrow_path)
+        if file_format == ExportFileFormat.parquet:
+            from eyepop.data.data_export import convert_arrow_to_parquet
+            num_bytes = await asyncio.to_thread(convert_arrow_to_parquet, arrow_path, path)
+        return num_bytes
 
     async def model_training_audits(self, model_uuids: list[str]) -> list[ModelTrainingAuditRecord]:
         model_uuid_query = ""
@@ -1012,7 +1738,7 @@ class DataEndpoint(Endpoint):
             model_uuid_query += f"model_uuid={model_uuid}&"
         get_url = f'{await self.data_base_url()}/exports/model_training_audits?{model_uuid_query}'
         async with await self.request_with_retry("GET", get_url) as resp:
-            return TypeAdapter(list[ModelTrainingAuditRecord]).validate_python(await resp.json()) # type: ignore [no-any-return]
+            return _adapter(list[ModelTrainingAuditRecord]).validate_json(await resp.read()) # type: ignore [no-any-return]
 
 
     async def export_model_urls(self, model_uuids: list[str], model_formats: list[ModelExportFormat], device_name: str | None = None,
@@ -1033,17 +1759,29 @@ class DataEndpoint(Endpoint):
             model_format_query += f"model_format={model_format}&"
         device_name_query = f"device_name={quote_plus(device_name)}&" if device_name is not None else ""
         variant_query = _variant_query(variant)
-        get_url = f'{await self.data_base_url()}/exports/model_urls?{model_uuid_query}{model_format_query}{device_name_query}{variant_query}'
-        async with await self.request_with_retry("GET", get_url) as resp:
-            return TypeAdapter(list[ExportedUrlResponse]).validate_python(await resp.json()) # type: ignore [no-any-return]
+
+        async def fetch() -> list[ExportedUrlResponse]:
+            get_url = f'{await self.data_base_url()}/exports/model_urls?{model_uuid_query}{model_format_query}{device_name_query}{variant_query}'
+            async with await self.request_with_retry("GET", get_url) as resp:
+                return _adapter(list[ExportedUrlResponse]).validate_json(await resp.read()) # type: ignore [no-any-return]
+
+        return await self._cached(  # type: ignore [no-any-return]
+            ("model_urls", model_uuid_query, model_format_query, device_name_query, variant_query),
+            [model_tag(model_uuid) for model_uuid in model_uuids],
+            fetch,
+        )
 
     async def resolve_aliases(self, aliases: list[str]) -> list[AliasResolution]:
         alias_query = ""
         for alias in aliases:
             alias_query += f"alias={alias}&"
-        get_url = f'{await self.data_base_url()}/exports/aliases?{alias_query}'
-        async with await self.request_with_retry("GET", get_url) as resp:
-            return TypeAdapter(list[AliasResolution]).validate_python(await resp.json()) # type: ignore [no-any-return]
+
+        async def fetch() -> list[AliasResolution]:
+            get_url = f'{await self.data_base_url()}/exports/aliases?{alias_query}'
+            async with await self.request_with_retry("GET", get_url) as resp:
+                return _adapter(list[AliasResolution]).validate_json(await resp.read()) # type: ignore [no-any-return]
+
+        return await self._cached(("aliases", alias_query), [ALIASES_TAG], fetch)  # type: ignore [no-any-return]
 
     async def export_model_artifacts(self, model_uuids: list[str], model_formats: list[ModelExportFormat], device_name: str | None = None,
                                      artifact_type: ArtifactType | None = None,
@@ -1083,7 +1821,7 @@ class DataEndpoint(Endpoint):
         post_url = f'{await self.data_base_url()}/models/{model_uuid}/exports/qc_ai_hub'
         await self.request_with_retry(
             "POST", post_url,
-            data=TypeAdapter(list[QcAiHubExportParams]).dump_json(export_params),
+            data=_adapter(list[QcAiHubExportParams]).dump_json(export_params),
             content_type=APPLICATION_JSON,
         )
 
@@ -1106,7 +1844,7 @@ class DataEndpoint(Endpoint):
             content_type=APPLICATION_JSON,
             data=workflow_create.model_dump_json(exclude_unset=True)
         ) as resp:
-            return parse_obj_as(CreateWorkflowResponse, await resp.json()) # type: ignore [no-any-return]
+            return _adapter(CreateWorkflowResponse).validate_json(await resp.read()) # type: ignore [no-any-return]
 
     async def get_workflow(
             self,
@@ -1119,7 +1857,7 @@ class DataEndpoint(Endpoint):
             raise ValueError("Fetching a workflow requires an account uuid")
         get_url = f'{await self.data_base_url()}/workflows/{workflow_id}?account_uuid={account_uuid}'
         async with await self.request_with_retry("GET", get_url) as resp:
-            return parse_obj_as(ListWorkflowItem, await resp.json())  # type: ignore [no-any-return]
+            return _adapter(ListWorkflowItem).validate_json(await resp.read())  # type: ignore [no-any-return]
 
     async def list_workflows(
         self,
@@ -1144,7 +1882,7 @@ class DataEndpoint(Endpoint):
                 query += f'&phase={p.value}'
         get_url = f'{await self.data_base_url()}/workflows?{query}'
         async with await self.request_with_retry("GET", get_url) as resp:
-            return parse_obj_as(list[ListWorkflowItem], await resp.json()) # type: ignore [no-any-return]
+            return _adapter(list[ListWorkflowItem]).validate_json(await resp.read()) # type: ignore [no-any-return]
 
     """ Ad hoc inference Api [EXPERIMENTAL] """
 
@@ -1159,18 +1897,9 @@ class DataEndpoint(Endpoint):
             end_timestamp: int | None = None,
             priority: str | None = None,
     ) -> InferJob:
-        dataset_query = f'&dataset_uuid={dataset_uuid}' if dataset_uuid is not None else ''
-        version_query = f'&dataset_version={dataset_version}' if dataset_version is not None else ''
-        start_timestamp_query = f'&start_timestamp={start_timestamp}' if start_timestamp is not None else ''
-        end_timestamp_query = f'&end_timestamp={end_timestamp}' if end_timestamp is not None else ''
-        transcode_mode_query = f'&transcode_mode={transcode_mode}' if transcode_mode is not None else ''
-
-        asset_url = (f'ai.eyepop://data/assets/{asset_uuid}?'
-                   f'{dataset_query}'
-                   f'{version_query}'
-                   f'{transcode_mode_query}'
-                   f'{start_timestamp_query}'
-                   f'{end_timestamp_query}')
+        asset_url = self._infer_asset_url(
+            asset_uuid, dataset_uuid, dataset_version, transcode_mode, start_timestamp, end_timestamp
+        )
 
         session = DataClientSession(self, await self.vlm_base_url())
 
@@ -1178,12 +1907,74 @@ class DataEndpoint(Endpoint):
             asset_url=asset_url,
             infer_request=infer_request,
             session=session,
-            callback=self.metrics_collector,
+            callback=self.job_callback,
             priority=priority,
+            completion_tracker=self.completion_tracker,
+            infer_cache=self.infer_cache,
         )
         await self._task_start(job.execute())
         return job
 
+    async def infer_assets(
+            self,
+            asset_uuids: Iterable[str],
+            infer_request: InferRequest,
+            dataset_uuid: str | None = None,
+            dataset_version: int | None = None,
+            transcode_mode: TranscodeMode | None = None,
+            start_timestamp: int | None = None,
+            end_timestamp: int | None = None,
+            priority: str | None = None,
+            concurrency: int = 16,
+            max_retries: int = 3,
+    ) -> InferAssetsJob:
+        """Run `infer_request` over many assets, iterate the returned job for per-asset results.
+
+        `asset_uuids` is consumed lazily, so it can be a generator over a large dataset. An asset
+        that fails with a transient error is retried up to `max_retries` times. Token usage of all
+        completed assets is aggregated in `job.usage`.
+        """
+        session = DataClientSession(self, await self.vlm_base_url())
+
+        job = InferAssetsJob(
+            asset_uuids=asset_uuids,
+            asset_url=lambda asset_uuid: self._infer_asset_url(
+                asset_uuid, dataset_uuid, dataset_version, transcode_mode, start_timestamp, end_timestamp
+            ),
+            infer_request=infer_request,
+            session=session,
+            callback=self.job_callback,
+            priority=priority,
+            concurrency=concurrency,
+            max_retries=max_retries,
+            completion_tracker=self.completion_tracker,
+            infer_cache=self.infer_cache,
+        )
+        await self._task_start(job.execute())
+        return job
+
+    @staticmethod
+    def _infer_asset_url(
+            asset_uuid: str,
+            dataset_uuid: str | None,
+            dataset_version: int | None,
+            transcode_mode: TranscodeMode | None,
+            start_timestamp: int | None,
+            end_timestamp: int | None,
+    ) -> str:
+        dataset_query = f'&dataset_uuid={dataset_uuid}' if dataset_uuid is not None else ''
+        version_query = f'&dataset_version={dataset_version}' if dataset_version is not None else ''
+        start_timestamp_query = f'&start_timestamp={start_timestamp}' if start_timestamp is not None else ''
+        end_timestamp_query = f'&end_timestamp={end_timestamp}' if end_timestamp is not None else ''
+        transcode_mode_query = f'&transcode_mode={transcode_mode}' if transcode_mode is not None else ''
+
+        return (f'ai.eyepop://data/assets/{asset_uuid}?'
+                f'{dataset_query}'
+                f'{version_query}'
+                f'{transcode_mode_query}'
+                f'{start_timestamp_query}'
+                f'{end_timestamp_query}')
+
     """ Vlm Ability Management Api """
 
     async def list_vlm_ability_groups(
@@ -1196,7 +1987,7 @@ class DataEndpoint(Endpoint):
             raise ValueError("Listing Vlm Ability Groups requires an account uuid")
         get_url = f'{await self.data_base_url()}/vlm_ability_groups?account_uuid={account_uuid}'
         async with await self.request_with_retry("GET", get_url) as resp:
-            return parse_obj_as(list[VlmAbilityGroupResponse], await resp.json()) # type: ignore [no-any-return]
+            return _adapter(list[VlmAbilityGroupResponse]).validate_json(await resp.read()) # type: ignore [no-any-return]
 
     async def create_vlm_ability_group(self, create: VlmAbilityGroupCreate, account_uuid: str | None = None) -> VlmAbilityGroupResponse:
         if account_uuid is None:
@@ -1206,18 +1997,18 @@ class DataEndpoint(Endpoint):
         post_url = f'{await self.data_base_url()}/vlm_ability_groups?account_uuid={account_uuid}'
         async with await self.request_with_retry("POST", post_url, content_type=APPLICATION_JSON,
                                                  data=create.model_dump_json(exclude_unset=True, exclude_none=True)) as resp:
-            return parse_obj_as(VlmAbilityGroupResponse, await resp.json()) # type: ignore [no-any-return]
+            return _adapter(VlmAbilityGroupResponse).validate_json(await resp.read()) # type: ignore [no-any-return]
 
     async def get_vlm_ability_group(self, vlm_ability_group_uuid: str) -> VlmAbilityGroupResponse:
         get_url = f'{await self.data_base_url()}/vlm_ability_groups/{vlm_ability_group_uuid}'
         async with await self.request_with_retry("GET", get_url) as resp:
-            return parse_obj_as(VlmAbilityGroupResponse, await resp.json()) # type: ignore [no-any-return]
+            return _adapter(VlmAbilityGroupResponse).validate_json(await resp.read()) # type: ignore [no-any-return]
 
     async def update_vlm_ability_group(self, vlm_ability_group_uuid: str, update: VlmAbilityGroupUpdate) -> VlmAbilityGroupResponse:
         patch_url = f'{await self.data_base_url()}/vlm_ability_groups/{vlm_ability_group_uuid}'
         async with await self.request_with_retry("PATCH", patch_url, content_type=APPLICATION_JSON,
                                                  data=update.model_dump_json(exclude_unset=True)) as resp:
-            return parse_obj_as(VlmAbilityGroupResponse, await resp.json()) # type: ignore [no-any-return]
+            return _adapter(VlmAbilityGroupResponse).validate_json(await resp.read()) # type: ignore [no-any-return]
 
     async def delete_vlm_ability_group(self, vlm_ability_group_uuid: str) -> None:
         delete_url = f'{await self.data_base_url()}/vlm_ability_groups/{vlm_ability_group_uuid}'
@@ -1238,7 +2029,7 @@ class DataEndpoint(Endpoint):
         else:
             get_url = f'{await self.data_base_url()}/vlm_abilities?vlm_ability_group_uuid={vlm_ability_group_uuid}'
         async with await self.request_with_retry("GET", get_url) as resp:
-            return parse_obj_as(list[VlmAbilityResponse], await resp.json()) # type: ignore [no-any-return]
+            return _adapter(list[VlmAbilityResponse]).validate_json(await resp.read()) # type: ignore [no-any-return]
 
     async def create_vlm_ability(
             self,
@@ -1254,7 +2045,7 @@ class DataEndpoint(Endpoint):
         post_url = f'{await self.data_base_url()}/vlm_abilities?account_uuid={account_uuid}{group_query}'
         async with await self.request_with_retry("POST", post_url, content_type=APPLICATION_JSON,
                                                  data=create.model_dump_json(exclude_unset=True, exclude_none=True)) as resp:
-            return parse_obj_as(VlmAbilityResponse, await resp.json()) # type: ignore [no-any-return]
+            return _adapter(VlmAbilityResponse).validate_json(await resp.read()) # type: ignore [no-any-return]
 
     async def refine_vlm_ability(
             self,
@@ -1266,12 +2057,12 @@ class DataEndpoint(Endpoint):
             post_url = f'{await self.data_base_url()}/vlm_abilities/{vlm_ability_uuid}/refine'
             async with await self.request_with_retry("POST", post_url, content_type=APPLICATION_JSON,
                                                      data=auto_prompt.model_dump_json(exclude_unset=True, exclude_none=True)) as resp:
-                return parse_obj_as(VlmAbilityResponse, await resp.json()) # type: ignore [no-any-return]
+                return _adapter(VlmAbilityResponse).validate_json(await resp.read()) # type: ignore [no-any-return]
         elif auto_task is not None:
             post_url = f'{await self.data_base_url()}/vlm_abilities/{vlm_ability_uuid}/refine_task'
             async with await self.request_with_retry("POST", post_url, content_type=APPLICATION_JSON,
                                                      data=auto_task.model_dump_json(exclude_unset=True, exclude_none=True)) as resp:
-                return parse_obj_as(VlmAbilityResponse, await resp.json()) # type: ignore [no-any-return]
+                return _adapter(VlmAbilityResponse).validate_json(await resp.read()) # type: ignore [no-any-return]
         else:
             raise ValueError("Refine Vlm Abilities requires an auto_prompt or auto_task parameter")
 
@@ -1296,18 +2087,18 @@ class DataEndpoint(Endpoint):
 
         post_url = f'{await self.data_base_url()}/vlm_abilities/{vlm_ability_uuid}/clone?{urlencode(params)}'
         async with await self.request_with_retry("POST", post_url) as resp:
-            return parse_obj_as(VlmAbilityResponse, await resp.json()) # type: ignore [no-any-return]
+            return _adapter(VlmAbilityResponse).validate_json(await resp.read()) # type: ignore [no-any-return]
 
     async def get_vlm_ability(self, vlm_ability_uuid: str) -> VlmAbilityResponse:
         get_url = f'{await self.data_base_url()}/vlm_abilities/{vlm_ability_uuid}'
         async with await self.request_with_retry("GET", get_url) as resp:
-            return parse_obj_as(VlmAbilityResponse, await resp.json()) # type: ignore [no-any-return]
+            return _adapter(VlmAbilityResponse).validate_json(await resp.read()) # type: ignore [no-any-return]
 
     async def update_vlm_ability(self, vlm_ability_uuid: str, update: VlmAbilityUpdate) -> VlmAbilityResponse:
         patch_url = f'{await self.data_base_url()}/vlm_abilities/{vlm_ability_uuid}'
         async with await self.request_with_retry("PATCH", patch_url, content_type=APPLICATION_JSON,
                                                  data=update.model_dump_json(exclude_unset=True)) as resp:
-            return parse_obj_as(VlmAbilityResponse, await resp.json()) # type: ignore [no-any-return]
+            return _adapter(VlmAbilityResponse).validate_json(await resp.read()) # type: ignore [no-any-return]
 
     async def delete_vlm_ability(self, vlm_ability_uuid: str) -> None:
         delete_url = f'{await self.data_base_url()}/vlm_abilities/{vlm_ability_uuid}'
@@ -1324,7 +2115,9 @@ class DataEndpoint(Endpoint):
         tag_name_query = f'tag_name={tag_name}&' if tag_name else ''
         post_url = f'{await self.data_base_url()}/vlm_abilities/{vlm_ability_uuid}/publish?{alias_name_query}{tag_name_query}'
         async with await self.request_with_retry("POST", post_url) as resp:
-            return parse_obj_as(VlmAbilityResponse, await resp.json()) # type: ignore [no-any-return]
+            result = _adapter(VlmAbilityResponse).validate_json(await resp.read())
+        self._invalidate_cached(ALIASES_TAG)
+        return result
 
     async def add_vlm_ability_alias(
             self,
@@ -1334,7 +2127,9 @@ class DataEndpoint(Endpoint):
     ) -> VlmAbilityResponse:
         post_url = f'{await self.data_base_url()}/vlm_abilities/{vlm_ability_uuid}/alias/{alias_name}/tag/{tag_name if tag_name else ""}'
         async with await self.request_with_retry("POST", post_url) as resp:
-            return parse_obj_as(VlmAbilityResponse, await resp.json()) # type: ignore [no-any-return]
+            result = _adapter(VlmAbilityResponse).validate_json(await resp.read())
+        self._invalidate_cached(ALIASES_TAG)
+        return result
 
     async def remove_vlm_ability_alias(
             self,
@@ -1344,17 +2139,19 @@ class DataEndpoint(Endpoint):
     ) -> VlmAbilityResponse:
         delete_url = f'{await self.data_base_url()}/vlm_abilities/{vlm_ability_uuid}/alias/{alias_name}/tag/{tag_name}'
         async with await self.request_with_retry("DELETE", delete_url) as resp:
-            return parse_obj_as(VlmAbilityResponse, await resp.json()) # type: ignore [no-any-return]
+            result = _adapter(VlmAbilityResponse).validate_json(await resp.read())
+        self._invalidate_cached(ALIASES_TAG)
+        return result
 
     async def list_vlm_ability_evaluations(self, vlm_ability_uuid: str) -> list[DatasetAutoAnnotate]:
         get_url = f'{await self.data_base_url()}/vlm_abilities/{vlm_ability_uuid}/evaluations'
         async with await self.request_with_retry("GET", get_url) as resp:
-            return parse_obj_as(list[DatasetAutoAnnotate], await resp.json()) # type: ignore [no-any-return]
+            return _adapter(list[DatasetAutoAnnotate]).validate_json(await resp.read()) # type: ignore [no-any-return]
 
     async def get_vlm_ability_evaluation(self, vlm_ability_uuid: str, source: str) -> DatasetAutoAnnotate:
         get_url = f'{await self.data_base_url()}/vlm_abilities/{vlm_ability_uuid}/evaluations/{source}'
         async with await self.request_with_retry("GET", get_url) as resp:
-            return parse_obj_as(DatasetAutoAnnotate, await resp.json()) # type: ignore [no-any-return]
+            return _adapter(DatasetAutoAnnotate).validate_json(await resp.read()) # type: ignore [no-any-return]
 
     async def start_vlm_ability_evaluation(self, vlm_ability_uuid: str, evaluate_request: EvaluateRequest) -> DatasetAutoAnnotate:
         post_url = f'{await self.data_base_url()}/vlm_abilities/{vlm_ability_uuid}/evaluations'
@@ -1364,5 +2161,5 @@ class DataEndpoint(Endpoint):
                 content_type=APPLICATION_JSON,
                 data=evaluate_request.model_dump_json(exclude_none=True)
         ) as resp:
-            return parse_obj_as(DatasetAutoAnnotate, await resp.json()) # type: ignore [no-any-return]
+            return _adapter(DatasetAutoAnnotate).validate_json(await resp.read()) # type: ignore [no-any-return]
 
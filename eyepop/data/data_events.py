@@ -0,0 +1,203 @@
+import asyncio
+import logging
+import time
+from enum import StrEnum
+from typing import Iterable
+
+from pydantic import BaseModel
+
+from eyepop.data.types.events import ChangeEvent, EventHandler
+
+log = logging.getLogger('eyepop.requests')
+
+
+class EventOverflowPolicy(StrEnum):
+    """What happens to a new event when a handler's queue is full."""
+    block = "block"
+    drop_oldest = "drop_oldest"
+    drop_newest = "drop_newest"
+
+
+class EventOrdering(StrEnum):
+    """Delivery order per handler: all events in order, or in order per dataset only."""
+    handler = "handler"
+    dataset = "dataset"
+
+
+class EventHandlerStats(BaseModel):
+    handler: str
+    queued: int
+    delivered: int
+    dropped: int
+    failed: int
+    last_lag_secs: float
+    max_lag_secs: float
+    mean_lag_secs: float
+
+
+class EventHandlerWorker:
+    """Bounded queue(s) and worker task(s) feeding change events to one handler.
+
+    With `EventOrdering.dataset` each dataset gets its own lane, so a slow dataset does not
+    delay the events of others. Lanes are created on demand and end when they run empty.
+    """
+    def __init__(
+            self,
+            handler: EventHandler,
+            queue_size: int,
+            overflow_policy: EventOverflowPolicy,
+            ordering: EventOrdering,
+    ):
+        self.handler = handler
+        self.queue_size = queue_size
+        self.overflow_policy = overflow_policy
+        self.ordering = ordering
+        self.lanes: dict[str | None, tuple[asyncio.Queue, asyncio.Task]] = {}
+        # producers waiting on a full lane, the lane must not end before their events are in
+        self.pending_puts: dict[str | None, int] = {}
+        self.closed = False
+        self.delivered = 0
+        self.dropped = 0
+        self.failed = 0
+        self.last_lag_secs = 0.0
+        self.max_lag_secs = 0.0
+        self.total_lag_secs = 0.0
+
+    async def put(self, change_event: ChangeEvent) -> None:
+        if self.closed:
+            return
+        key = change_event.dataset_uuid if self.ordering == EventOrdering.dataset else None
+        lane = self.lanes.get(key)
+        if lane is None:
+            queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+            lane = (queue, asyncio.create_task(self._run(key, queue)))
+            self.lanes[key] = lane
+        queue = lane[0]
+        item = (time.monotonic(), change_event)
+        if not queue.full():
+            queue.put_nowait(item)
+        elif self.overflow_policy == EventOverflowPolicy.block:
+            self.pending_puts[key] = self.pending_puts.get(key, 0) + 1
+            try:
+                await queue.put(item)
+            finally:
+                self.pending_puts[key] -= 1
+                if self.pending_puts[key] == 0:
+                    del self.pending_puts[key]
+        elif self.overflow_policy == EventOverflowPolicy.drop_newest:
+            self.dropped += 1
+        else:
+            queue.get_nowait()
+            queue.put_nowait(item)
+            self.dropped += 1
+
+    async def _run(self, key: str | None, queue: asyncio.Queue) -> None:
+        while True:
+            enqueued_at, change_event = await queue.get()
+            lag_secs = time.monotonic() - enqueued_at
+            self.last_lag_secs = lag_secs
+            self.total_lag_secs += lag_secs
+            if lag_secs > self.max_lag_secs:
+                self.max_lag_secs = lag_secs
+            try:
+                await self.handler(change_event)
+                self.delivered += 1
+            except Exception as e:
+                self.failed += 1
+                log.exception(e)
+            if self.closed:
+                return
+            if queue.empty() and key not in self.pending_puts:
+                self.lanes.pop(key, None)
+                return
+
+    def stats(self) -> EventHandlerStats:
+        processed = self.delivered + self.failed
+        return EventHandlerStats(
+            handler=getattr(self.handler, "__qualname__", repr(self.handler)),
+            queued=sum(queue.qsize() for queue, _ in self.lanes.values()),
+            delivered=self.delivered,
+            dropped=self.dropped,
+            failed=self.failed,
+            last_lag_secs=self.last_lag_secs,
+            max_lag_secs=self.max_lag_secs,
+            mean_lag_secs=self.total_lag_secs / processed if processed > 0 else 0.0,
+        )
+
+    async def close(self) -> None:
+        self.closed = True
+        # a handler may remove itself, its own lane then ends after the handler returns
+        current_task = asyncio.current_task()
+        tasks = [task for _, task in self.lanes.values() if task is not current_task]
+        self.lanes.clear()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+class EventDispatcher:
+    """Fans change events out to per-handler workers, the caller only enqueues.
+
+    Handler registrations are kept as immutable tuples that are replaced on change, so
+    dispatching an event never copies the registered handlers.
+    """
+    def __init__(
+            self,
+            queue_size: int = 1024,
+            overflow_policy: EventOverflowPolicy = EventOverflowPolicy.block,
+            ordering: EventOrdering = EventOrdering.handler,
+    ):
+        self.queue_size = queue_size
+        self.overflow_policy = overflow_policy
+        self.ordering = ordering
+        self.account_workers: tuple[EventHandlerWorker, ...] = ()
+        self.dataset_uuid_to_workers: dict[str, tuple[EventHandlerWorker, ...]] = {}
+
+    async def set_account_handlers(self, handlers: Iterable[EventHandler]) -> None:
+        self.account_workers = await self._update_workers(self.account_workers, handlers)
+
+    async def set_dataset_handlers(self, dataset_uuid: str, handlers: Iterable[EventHandler]) -> None:
+        workers = await self._update_workers(self.dataset_uuid_to_workers.get(dataset_uuid, ()), handlers)
+        if len(workers) > 0:
+            self.dataset_uuid_to_workers[dataset_uuid] = workers
+        else:
+            self.dataset_uuid_to_workers.pop(dataset_uuid, None)
+
+    async def dispatch(self, change_event: ChangeEvent, to_account: bool, to_dataset: bool) -> None:
+        if to_account:
+            for worker in self.account_workers:
+                await worker.put(change_event)
+        if to_dataset and change_event.dataset_uuid is not None:
+            for worker in self.dataset_uuid_to_workers.get(change_event.dataset_uuid, ()):
+                await worker.put(change_event)
+
+    def stats(self) -> list[EventHandlerStats]:
+        workers = list(self.account_workers)
+        for dataset_workers in self.dataset_uuid_to_workers.values():
+            workers.extend(dataset_workers)
+        return [worker.stats() for worker in workers]
+
+    async def close(self) -> None:
+        workers = list(self.account_workers)
+        for dataset_workers in self.dataset_uuid_to_workers.values():
+            workers.extend(dataset_workers)
+        self.account_workers = ()
+        self.dataset_uuid_to_workers = {}
+        for worker in workers:
+            await worker.close()
+
+    async def _update_workers(
+            self,
+            workers: tuple[EventHandlerWorker, ...],
+            handlers: Iterable[EventHandler],
+    ) -> tuple[EventHandlerWorker, ...]:
+        handler_to_worker = {worker.handler: worker for worker in workers}
+        updated = []
+        for handler in handlers:
+            worker = handler_to_worker.pop(handler, None)
+            if worker is None:
+                worker = EventHandlerWorker(handler, self.queue_size, self.overflow_policy, self.ordering)
+            updated.append(worker)
+        for removed in handler_to_worker.values():
+            await removed.close()
+        return tuple(updated)
@@ -0,0 +1,168 @@
+import hashlib
+import os
+from enum import StrEnum
+from typing import TYPE_CHECKING, Any, Sequence
+
+from pydantic import BaseModel
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+MANIFEST_FILE_NAME = "manifest.json"
+MANIFEST_VERSION = 2
+
+
+class ExportFileFormat(StrEnum):
+    arrow = "arrow"
+    parquet = "parquet"
+
+
+class ExportShardStatus(StrEnum):
+    pending = "pending"
+    completed = "completed"
+    failed = "failed"
+
+
+class ExportShard(BaseModel):
+    index: int
+    file_name: str
+    num_assets: int
+    asset_uuids_digest: str
+    status: ExportShardStatus = ExportShardStatus.pending
+    num_bytes: int | None = None
+    error: str | None = None
+
+
+class ExportManifest(BaseModel):
+    """Progress record of a sharded asset export, persisted next to the shard files.
+
+    A rerun against the same output directory skips every shard that is recorded
+    as completed, whose file still exists and whose asset uuids did not change.
+    `filters` holds the other export parameters, e.g. `transcode_mode`; shards exported
+    with different filters are not reused.
+    """
+    version: int = MANIFEST_VERSION
+    dataset_uuid: str | None = None
+    dataset_version: int | None = None
+    shard_size: int
+    file_format: ExportFileFormat
+    filters: dict[str, Any] = {}
+    shards: list[ExportShard] = []
+
+    @property
+    def completed(self) -> bool:
+        return all(shard.status == ExportShardStatus.completed for shard in self.shards)
+
+    def shard_paths(self, output_dir: str) -> list[str]:
+        return [os.path.join(output_dir, shard.file_name) for shard in self.shards]
+
+
+def split_into_shards(asset_uuids: Sequence[str], shard_size: int) -> list[list[str]]:
+    """Deterministic split: sorted uuids in fixed size slices, so reruns see the same shards."""
+    if shard_size <= 0:
+        raise ValueError("shard_size must be positive")
+    sorted_uuids = sorted(asset_uuids)
+    return [sorted_uuids[i:i + shard_size] for i in range(0, len(sorted_uuids), shard_size)]
+
+
+def asset_uuids_digest(asset_uuids: Sequence[str]) -> str:
+    digest = hashlib.sha256()
+    for asset_uuid in asset_uuids:
+        digest.update(asset_uuid.encode())
+        digest.update(b"\n")
+    return digest.hexdigest()
+
+
+def shard_file_name(index: int, file_format: ExportFileFormat) -> str:
+    return f"shard-{index:05d}.{file_format}"
+
+
+def read_manifest(output_dir: str) -> ExportManifest | None:
+    path = os.path.join(output_dir, MANIFEST_FILE_NAME)
+    if not os.path.exists(path):
+        return None
+    with open(path, "r") as f:
+        return ExportManifest.model_validate_json(f.read())
+
+
+def write_manifest(output_dir: str, manifest: ExportManifest) -> None:
+    path = os.path.join(output_dir, MANIFEST_FILE_NAME)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        f.write(manifest.model_dump_json(indent=2))
+    os.replace(tmp_path, path)
+
+
+def plan_manifest(
+        output_dir: str,
+        asset_uuids: Sequence[str],
+        shard_size: int,
+        file_format: ExportFileFormat,
+        dataset_uuid: str | None,
+        dataset_version: int | None,
+        filters: dict[str, Any] | None = None,
+) -> tuple[ExportManifest, list[list[str]]]:
+    """Build the manifest for this export, carrying over completed shards of a previous run.
+
+    Reads the previous manifest, call it from a worker thread.
+    """
+    shards_uuids = split_into_shards(asset_uuids, shard_size)
+    # compared in their json form, as read back from a previous manifest
+    json_filters = ExportManifest(shard_size=shard_size, file_format=file_format,
+                                  filters=filters or {}).model_dump(mode="json")["filters"]
+    previous = read_manifest(output_dir)
+    previous_by_index: dict[int, ExportShard] = {}
+    if (previous is not None
+            and previous.version == MANIFEST_VERSION
+            and previous.dataset_uuid == dataset_uuid
+            and previous.dataset_version == dataset_version
+            and previous.shard_size == shard_size
+            and previous.file_format == file_format
+            and previous.filters == json_filters):
+        previous_by_index = {shard.index: shard for shard in previous.shards}
+
+    manifest = ExportManifest(
+        dataset_uuid=dataset_uuid,
+        dataset_version=dataset_version,
+        shard_size=shard_size,
+        file_format=file_format,
+        filters=json_filters,
+    )
+    for index, shard_uuids in enumerate(shards_uuids):
+        shard = ExportShard(
+            index=index,
+            file_name=shard_file_name(index, file_format),
+            num_assets=len(shard_uuids),
+            asset_uuids_digest=asset_uuids_digest(shard_uuids),
+        )
+        previous_shard = previous_by_index.get(index)
+        if (previous_shard is not None
+                and previous_shard.status == ExportShardStatus.completed
+                and previous_shard.asset_uuids_digest == shard.asset_uuids_digest
+                and os.path.exists(os.path.join(output_dir, previous_shard.file_name))):
+            shard = previous_shard
+        manifest.shards.append(shard)
+    return manifest, shards_uuids
+
+
+def read_arrow_table(path: str) -> "pa.Table":
+    """Read an exported Arrow shard, accepting both the IPC file and the IPC stream format."""
+    import pyarrow as pa
+
+    with pa.memory_map(path, "r") as source:
+        try:
+            return pa.ipc.open_file(source).read_all()
+        except pa.ArrowInvalid:
+            source.seek(0)
+            return pa.ipc.open_stream(source).read_all()
+
+
+def convert_arrow_to_parquet(arrow_path: str, parquet_path: str) -> int:
+    import pyarrow.parquet as pq
+
+    table = read_arrow_table(arrow_path)
+    tmp_path = f"{parquet_path}.partial"
+    pq.write_table(table, tmp_path)
+    os.replace(tmp_path, parquet_path)
+    os.remove(arrow_path)
+    return os.path.getsize(parquet_path)
@@ -0,0 +1,65 @@
+import io
+import os
+from typing import TYPE_CHECKING, Iterator
+
+from pydantic import BaseModel
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+
+class ImportChunkFailure(BaseModel):
+    index: int
+    row_offset: int
+    num_rows: int
+    error: str
+
+
+class ImportResult(BaseModel):
+    """Outcome of a chunked Arrow import; rows of failed chunks can be re-imported by offset."""
+    num_rows: int = 0
+    num_chunks: int = 0
+    failed_chunks: list[ImportChunkFailure] = []
+    elapsed_secs: float = 0.0
+
+    @property
+    def rows_per_sec(self) -> float:
+        if self.elapsed_secs <= 0.0:
+            return 0.0
+        return self.num_rows / self.elapsed_secs
+
+
+def iter_import_chunks(source: "pa.Table | str", max_chunk_rows: int) -> Iterator["pa.Table"]:
+    """Split a table or a Parquet file/directory into tables of at most max_chunk_rows rows.
+
+    Parquet sources are read lazily, batch by batch, so memory is bounded by the chunk size.
+    """
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+
+    if max_chunk_rows <= 0:
+        raise ValueError("max_chunk_rows must be positive")
+    if isinstance(source, str):
+        if not os.path.exists(source):
+            raise FileNotFoundError(source)
+        dataset = ds.dataset(source, format="parquet")
+        for batch in dataset.to_batches(batch_size=max_chunk_rows):
+            if batch.num_rows > 0:
+                yield pa.Table.from_batches([batch], schema=dataset.schema)
+    elif isinstance(source, pa.Table):
+        for offset in range(0, source.num_rows, max_chunk_rows):
+            yield source.slice(offset, max_chunk_rows)
+    else:
+        raise TypeError(f"unsupported import source {type(source)}, expected pa.Table or path")
+
+
+def serialize_import_chunk(chunk: "pa.Table") -> bytes:
+    """Encode one chunk as a self-contained Arrow IPC stream with its own schema header."""
+    import pyarrow as pa
+    from pyarrow.ipc import IpcWriteOptions
+
+    buffer = io.BytesIO()
+    with pa.ipc.new_stream(buffer, schema=chunk.schema,
+                           options=IpcWriteOptions(emit_dictionary_deltas=True)) as writer:
+        writer.write_table(chunk)
+    return buffer.getvalue()
@@ -0,0 +1,115 @@
+import asyncio
+import hashlib
+import json
+import os
+import tempfile
+from collections import OrderedDict
+from typing import Any
+
+
+def infer_cache_key(post_body_part: dict[str, Any]) -> str:
+    """Key of an inference request body, its `url` already encodes asset, version, transcoding and timestamps.
+
+    The dataset version is only part of the `url` when the caller passed `dataset_version`, without
+    it a result stays cached for the asset across dataset versions. The `refresh` flag is not part
+    of the key, a refreshed result replaces the cached one.
+    """
+    keyed = {k: v for k, v in post_body_part.items() if k != "refresh"}
+    return hashlib.sha256(json.dumps(keyed, sort_keys=True).encode()).hexdigest()
+
+
+class InferCache:
+    """Client side cache of VLM inference results, opt-in via `EyePopSdk.dataEndpoint(infer_cache=...)`.
+
+    Values are the json serialized inference responses. Requests with `refresh=True` skip the
+    lookup and store the fresh result. Pass an explicit `dataset_version` to `infer_asset()` and
+    `infer_assets()` to get a fresh result when an asset changes in a new dataset version.
+    """
+    hits: int
+    misses: int
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+
+    async def get(self, key: str) -> str | None:
+        value = await self._get(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    async def put(self, key: str, value: str) -> None:
+        await self._put(key, value)
+
+    async def _get(self, key: str) -> str | None:
+        raise NotImplementedError("can't use abstract InferCache")
+
+    async def _put(self, key: str, value: str) -> None:
+        raise NotImplementedError("can't use abstract InferCache")
+
+
+class MemoryInferCache(InferCache):
+    """LRU cache of the `max_entries` most recently used inference results."""
+    max_entries: int
+
+    def __init__(self, max_entries: int = 4096):
+        super().__init__()
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, str] = OrderedDict()
+
+    def __len__(self) -> int:
+        """Number of cached inference results."""
+        return len(self._entries)
+
+    async def _get(self, key: str) -> str | None:
+        value = self._entries.get(key)
+        if value is not None:
+            self._entries.move_to_end(key)
+        return value
+
+    async def _put(self, key: str, value: str) -> None:
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+class DiskInferCache(InferCache):
+    """Inference results as one json file per request in `directory`, kept across processes.
+
+    Files are written atomically, entries are never evicted; delete the directory to reset.
+    """
+    directory: str
+
+    def __init__(self, directory: str):
+        super().__init__()
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    async def _get(self, key: str) -> str | None:
+        return await asyncio.to_thread(self._read, key)
+
+    async def _put(self, key: str, value: str) -> None:
+        await asyncio.to_thread(self._write, key, value)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def _read(self, key: str) -> str | None:
+        try:
+            with open(self._path(key), "r", encoding="utf-8") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def _write(self, key: str, value: str) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(value)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
@@ -1,13 +1,17 @@
+import asyncio
 import json
+import logging
 import time
 from asyncio import Queue
-from typing import Any, BinaryIO, Callable, Sequence
+from typing import Any, AsyncIterator, BinaryIO, Callable, Iterable, Sequence
 from urllib.parse import quote_plus
 
 import aiohttp
 from pydantic import BaseModel, Field
 
 from eyepop.client_session import ClientSession
+from eyepop.data.data_completion import CompletionTracker
+from eyepop.data.data_infer_cache import InferCache, infer_cache_key
 from eyepop.data.data_types import (
     APPLICATION_JSON,
     Asset,
@@ -20,6 +24,15 @@ from eyepop.data.data_types import (
 )
 from eyepop.jobs import Job, JobStateCallback
 
+log = logging.getLogger('eyepop.requests')
+
+
+def _is_transient(e: BaseException) -> bool:
+    """Connection errors, timeouts and 429 or 5xx responses may succeed when retried."""
+    if isinstance(e, aiohttp.ClientResponseError):
+        return e.status == 429 or e.status >= 500
+    return isinstance(e, (aiohttp.ClientPayloadError, aiohttp.ClientConnectionError, asyncio.TimeoutError))
+
 
 class DataJob(Job):
     """Abstract Job submitted to an EyePop.ai DataEndpoint."""
@@ -86,8 +99,8 @@ class _UploadStreamJob(DataJob):
                 content_type=self.mime_type,
                 timeout=self.timeout
         ) as resp:
-            result = Asset.model_validate(await resp.json())
-            await queue.put(result)
+            result = Asset.model_validate_json(await resp.read())
+            await self.push_message(result)
 
 
 class _ImportFromJob(DataJob):
@@ -134,8 +147,8 @@ class _ImportFromJob(DataJob):
                 content_type="application/json",
                 timeout=self.timeout
         ) as resp:
-            result = Asset.model_validate(await resp.json())
-            await queue.put(result)
+            result = Asset.model_validate_json(await resp.read())
+            await self.push_message(result)
 
 
 class _VlmInferRequestAccepted(BaseModel):
@@ -158,6 +171,77 @@ class _InferResponse(BaseModel):
     run_info: InferRunInfo | None = Field(
         default=None, description="Runtime information about the inference execution"
     )
+    cached: bool = Field(
+        default=False, exclude=True, description="Returned from the client side cache, no tokens were spent"
+    )
+
+async def _accepted_or_result(resp: aiohttp.ClientResponse) -> _VlmInferRequestAccepted | Any:
+    if resp.status == 202:
+        return _VlmInferRequestAccepted.model_validate_json(await resp.read())
+    elif resp.status == 200:
+        return await resp.json()
+    else:
+        raise ValueError(f"Unexpected status code: {resp.status}")
+
+
+async def _wait_for_completion(
+        completion_tracker: CompletionTracker | None,
+        session: ClientSession,
+        status_path: str,
+        extra_headers: dict[str, str] | None,
+        timeout: aiohttp.ClientTimeout | None,
+        start_time: float,
+) -> Any:
+    if completion_tracker is None:
+        # a job created without an endpoint's shared tracker polls on its own
+        completion_tracker = CompletionTracker(max_pollers=1)
+    total_timeout = timeout.total if timeout else None
+    remaining = total_timeout - (time.time() - start_time) if total_timeout is not None else None
+    return await completion_tracker.wait(session, status_path, extra_headers, remaining)
+
+
+async def _infer(
+        session: ClientSession,
+        post_body_part: dict[str, Any],
+        extra_headers: dict[str, str] | None,
+        timeout: aiohttp.ClientTimeout | None,
+        completion_tracker: CompletionTracker | None,
+        infer_cache: InferCache | None = None,
+) -> _InferResponse:
+    cache_key = None
+    if infer_cache is not None:
+        cache_key = infer_cache_key(post_body_part)
+        if not post_body_part.get("refresh", False):
+            cached = await infer_cache.get(cache_key)
+            if cached is not None:
+                response = _InferResponse.model_validate_json(cached)
+                response.cached = True
+                return response
+
+    post_body = aiohttp.FormData()
+    post_body.add_field('infer_request', json.dumps(post_body_part), content_type="application/json")
+
+    start_time = time.time()
+    async with await session.request_with_retry(
+            method="POST",
+            url="/api/v1/infer?timeout=20",
+            data=post_body,
+            extra_headers=extra_headers,
+    ) as resp:
+        response_json = await _accepted_or_result(resp)
+    if isinstance(response_json, _VlmInferRequestAccepted):
+        try:
+            response_json = await _wait_for_completion(
+                completion_tracker, session, f"/api/v1/infer/{response_json.request_id}",
+                extra_headers, timeout, start_time
+            )
+        except TimeoutError:
+            raise TimeoutError(f"infer request timed out after {time.time() - start_time} seconds") from None
+    response = _InferResponse.model_validate(response_json)
+    if infer_cache is not None and cache_key is not None:
+        await infer_cache.put(cache_key, response.model_dump_json(exclude_none=True))
+    return response
+
 
 class InferJob(Job):
     timeout: aiohttp.ClientTimeout | None
@@ -170,12 +254,16 @@ class InferJob(Job):
             callback: JobStateCallback | None = None,
             timeout: aiohttp.ClientTimeout | None = aiohttp.ClientTimeout(total=None, sock_read=600),
             priority: str | None = None,
+            completion_tracker: CompletionTracker | None = None,
+            infer_cache: InferCache | None = None,
     ):
         super().__init__(session, on_ready, callback)  # type: ignore[arg-type]
         self.timeout = timeout
         self._asset_url = asset_url
         self._infer_request = infer_request
         self._priority = priority
+        self._completion_tracker = completion_tracker
+        self._infer_cache = infer_cache
 
         self._run_info = None
 
@@ -192,44 +280,166 @@ class InferJob(Job):
     async def _do_execute_job(self, queue: Queue, session: ClientSession):
         post_body_part = self._infer_request.model_dump(exclude_none=True)
         post_body_part["url"] = self._asset_url
+        extra_headers = {"X-Priority": self._priority} if self._priority else None
 
-        post_body = aiohttp.FormData()
-        post_body.add_field('infer_request', json.dumps(post_body_part), content_type="application/json")
+        result = await _infer(session, post_body_part, extra_headers, self.timeout, self._completion_tracker,
+                              self._infer_cache)
+        self._run_info = result.run_info
+        if result.predictions is not None:
+            for prediction in result.predictions:
+                await self.push_message(prediction.model_dump(exclude_none=True))
+
+
+class InferAssetResult(BaseModel):
+    """Result of one asset of an `InferAssetsJob`, `error` is set if all attempts failed."""
+    asset_uuid: str
+    raw_output: str | None = None
+    predictions: Sequence[Prediction] | None = None
+    run_info: InferRunInfo | None = None
+    error: str | None = None
+    cached: bool = False
+
+
+class InferTokenUsage(BaseModel):
+    """Aggregated `InferRunInfo` token counts of the assets completed so far.
+
+    Results returned from the client side cache are counted in `num_cached`, their tokens are not
+    added since they were not spent again.
+    """
+    num_assets: int = 0
+    num_failed: int = 0
+    num_retries: int = 0
+    num_cached: int = 0
+    total_tokens: int = 0
+    visual_tokens: int = 0
+    text_tokens: int = 0
+    output_tokens: int = 0
+
+    def add(self, run_info: InferRunInfo | None) -> None:
+        if run_info is None:
+            return
+        self.total_tokens += run_info.total_tokens or 0
+        self.visual_tokens += run_info.visual_tokens or 0
+        self.text_tokens += run_info.text_tokens or 0
+        self.output_tokens += run_info.output_tokens or 0
+
+
+class InferAssetsJob(Job):
+    """Runs one inference request over many assets and yields an `InferAssetResult` per asset.
+
+    At most `concurrency` assets are in flight. Results are yielded in completion order, when
+    the consumer falls behind the job's bounded result queue stops new assets from starting.
+    An asset failing with a transient error is retried up to `max_retries` times before it is
+    reported as failed.
+    """
+    timeout: aiohttp.ClientTimeout | None
+    usage: InferTokenUsage
 
+    def __init__(
+            self,
+            asset_uuids: Iterable[str],
+            asset_url: Callable[[str], str],
+            infer_request: InferRequest,
+            session: ClientSession,
+            on_ready: Callable[[DataJob], None] | None = None,
+            callback: JobStateCallback | None = None,
+            timeout: aiohttp.ClientTimeout | None = aiohttp.ClientTimeout(total=None, sock_read=600),
+            priority: str | None = None,
+            concurrency: int = 16,
+            max_retries: int = 3,
+            completion_tracker: CompletionTracker | None = None,
+            infer_cache: InferCache | None = None,
+    ):
+        super().__init__(session, on_ready, callback)  # type: ignore[arg-type]
+        self.timeout = timeout
+        self.usage = InferTokenUsage()
+        self._asset_uuids = asset_uuids
+        self._asset_url = asset_url
+        self._infer_request = infer_request
+        self._priority = priority
+        self._concurrency = concurrency
+        self._max_retries = max_retries
+        self._completion_tracker = completion_tracker
+        self._infer_cache = infer_cache
+        self._tasks: set[asyncio.Task] = set()
+
+    async def __aiter__(self) -> AsyncIterator[InferAssetResult]:
+        """Iterate over the results in completion order."""
+        while True:
+            result = await self.pop_result()
+            if result is None:
+                return
+            yield result
+
+    async def cancel(self):
+        for task in self._tasks:
+            task.cancel()
+        queue = self._queue
+        if queue is not None:
+            # make room for the end marker, undelivered results are discarded anyway
+            while not queue.empty():
+                queue.get_nowait()
+        await super().cancel()
+
+    async def _do_execute_job(self, queue: Queue, session: ClientSession):
+        post_body_part = self._infer_request.model_dump(exclude_none=True)
         extra_headers = {"X-Priority": self._priority} if self._priority else None
+        window = asyncio.Semaphore(self._concurrency)
 
-        total_timeout = self.timeout.total if self.timeout else None
-        start_time = time.time()
-        request_id = None
-        result = None
-        while total_timeout is None or time.time() - start_time < total_timeout:
-            if request_id is None:
-                request_coro = session.request_with_retry(
-                    method="POST",
-                    url="/api/v1/infer?timeout=20",
-                    data=post_body,
-                    extra_headers=extra_headers,
-                )
-            else:
-                request_coro = session.request_with_retry(
-                    method="GET",
-                    url=f"/api/v1/infer/{request_id}?timeout=20",
-                    extra_headers=extra_headers,
+        async def infer_one(asset_uuid: str) -> None:
+            try:
+                result = await self._infer_with_retry(
+                    session, {**post_body_part, "url": self._asset_url(asset_uuid)}, extra_headers, asset_uuid
                 )
-            async with await request_coro as resp:
-                if resp.status == 202:
-                    request_id = _VlmInferRequestAccepted.model_validate(await resp.json()).request_id
-                elif resp.status == 200:
-                    result = _InferResponse.model_validate(await resp.json())
-                    self._run_info = result.run_info = result.run_info
-                    if result.predictions is not None:
-                        for prediction in result.predictions:
-                            await queue.put(prediction.model_dump(exclude_none=True))
-                    break
+                await self.push_message(result)
+            finally:
+                window.release()
+
+        for asset_uuid in self._asset_uuids:
+            await window.acquire()
+            if self._queue is None:
+                # canceled
+                window.release()
+                break
+            task = asyncio.create_task(infer_one(asset_uuid))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def _infer_with_retry(
+            self,
+            session: ClientSession,
+            post_body_part: dict[str, Any],
+            extra_headers: dict[str, str] | None,
+            asset_uuid: str,
+    ) -> InferAssetResult:
+        failed_attempts = 0
+        while True:
+            try:
+                response = await _infer(session, post_body_part, extra_headers, self.timeout,
+                                        self._completion_tracker, self._infer_cache)
+                self.usage.num_assets += 1
+                if response.cached:
+                    self.usage.num_cached += 1
                 else:
-                    raise ValueError(f"Unexpected status code: {resp.status}")
-        if result is None:
-            raise TimeoutError(f"infer request timed out after {time.time() - start_time} seconds")
+                    self.usage.add(response.run_info)
+                return InferAssetResult(
+                    asset_uuid=asset_uuid,
+                    raw_output=response.raw_output,
+                    predictions=response.predictions,
+                    run_info=response.run_info,
+                    cached=response.cached,
+                )
+            except Exception as e:
+                failed_attempts += 1
+                if not _is_transient(e) or failed_attempts > self._max_retries:
+                    log.debug("infer of asset %s failed after %d attempts: %s", asset_uuid, failed_attempts, e)
+                    self.usage.num_assets += 1
+                    self.usage.num_failed += 1
+                    return InferAssetResult(asset_uuid=asset_uuid, error=str(e) or type(e).__name__)
+                self.usage.num_retries += 1
+                await asyncio.sleep(2 ** (failed_attempts - 1))
+
 
 class EvaluateJob(Job):
     timeout: aiohttp.ClientTimeout | None
@@ -239,11 +449,13 @@ class EvaluateJob(Job):
             session: ClientSession,
             on_ready: Callable[[DataJob], None] | None = None,
             callback: JobStateCallback | None = None,
-            timeout: aiohttp.ClientTimeout | None = aiohttp.ClientTimeout(total=None, sock_read=600)
+            timeout: aiohttp.ClientTimeout | None = aiohttp.ClientTimeout(total=None, sock_read=600),
+            completion_tracker: CompletionTracker | None = None,
     ):
         super().__init__(session, on_ready, callback)  # type: ignore[arg-type]
         self.timeout = timeout
         self._evaluate_request = evaluate_request
+        self._completion_tracker = completion_tracker
         self._result = None
 
     @property
@@ -257,33 +469,20 @@ class EvaluateJob(Job):
     async def _do_execute_job(self, queue: Queue, session: ClientSession):
         extra_headers = {"X-Priority": "low"}
         start_time = time.time()
-        request_id = None
-        result = None
-        total_timeout = self.timeout.total if self.timeout else None
-        while total_timeout is None or time.time() - start_time < total_timeout:
-            if request_id is None:
-                request_coro = session.request_with_retry(
-                    method="POST",
-                    url="/api/v1/evaluations?timeout=20",
-                    content_type=APPLICATION_JSON,
-                    data=self._evaluate_request.model_dump_json(exclude_none=True),
-                    extra_headers=extra_headers,
-                )
-            else:
-                request_coro = session.request_with_retry(
-                    method="GET",
-                    url=f"/api/v1/evaluations/{request_id}?timeout=20",
-                    extra_headers=extra_headers,
+        async with await session.request_with_retry(
+                method="POST",
+                url="/api/v1/evaluations?timeout=20",
+                content_type=APPLICATION_JSON,
+                data=self._evaluate_request.model_dump_json(exclude_none=True),
+                extra_headers=extra_headers,
+        ) as resp:
+            response_json = await _accepted_or_result(resp)
+        if isinstance(response_json, _VlmInferRequestAccepted):
+            try:
+                response_json = await _wait_for_completion(
+                    self._completion_tracker, session, f"/api/v1/evaluations/{response_json.request_id}",
+                    extra_headers, self.timeout, start_time
                 )
-            async with await request_coro as resp:
-                if resp.status == 202:
-                    request_id = _VlmInferRequestAccepted.model_validate(await resp.json()).request_id
-                elif resp.status == 200:
-                    result = EvaluateResponse.model_validate(await resp.json())
-                    await queue.put(result)
-                    break
-                else:
-                    raise ValueError(f"Unexpected status code: {resp.status}")
-        if result is None:
-            raise TimeoutError(f"evaluate request timed out after {time.time() - start_time} seconds")
-
+            except TimeoutError:
+                raise TimeoutError(f"evaluate request timed out after {time.time() - start_time} seconds") from None
+        await self.push_message(EvaluateResponse.model_validate(response_json))
@@ -1,11 +1,22 @@
 import asyncio
+import functools
 import typing
-from typing import BinaryIO, Callable, List, Optional
+from typing import TYPE_CHECKING, BinaryIO, Callable, List, Optional
 
 import aiohttp
 
 from eyepop.data.data_endpoint import DataEndpoint
-from eyepop.data.data_jobs import DataJob, EvaluateJob, InferJob
+from eyepop.data.data_events import EventHandlerStats
+from eyepop.data.data_export import ExportFileFormat, ExportManifest
+from eyepop.data.data_import import ImportResult
+from eyepop.data.data_jobs import (
+    DataJob,
+    EvaluateJob,
+    InferAssetResult,
+    InferAssetsJob,
+    InferJob,
+    InferTokenUsage,
+)
 from eyepop.data.data_types import (
     AliasResolution,
     AnnotationInclusionMode,
@@ -13,6 +24,7 @@ from eyepop.data.data_types import (
     Asset,
     AssetImport,
     AssetInclusionMode,
+    AssetResultFormat,
     AssetUrlType,
     AutoAnnotate,
     ChangeEvent,
@@ -52,9 +64,14 @@ from eyepop.data.data_types import (
     VlmAbilityResponse,
     VlmAbilityUpdate,
 )
+from eyepop.data.data_upload import UploadResult
 from eyepop.data.types import Roi
 from eyepop.data.types.vlm import AutoPromptConfig, AutoTask
-from eyepop.syncify import SyncEndpoint, run_coro_thread_save
+from eyepop.jobs import JobTimings
+from eyepop.syncify import SYNC_RESULT_BATCH, SyncEndpoint, _anext_or_none, run_coro_thread_save
+
+if TYPE_CHECKING:
+    import pyarrow as pa
 
 SyncEventHandler = Callable[[ChangeEvent], None]
 
@@ -64,6 +81,10 @@ class SyncDataJob:
         self.job = job
         self.event_loop = event_loop
 
+    @property
+    def timings(self) -> JobTimings:
+        return self.job.timings
+
     def result(self) -> Asset:
         result = run_coro_thread_save(self.event_loop, self.job.result())
         return result # type: ignore [no-any-return]
@@ -81,6 +102,10 @@ class SyncInferJob:
     def run_info(self) -> InferRunInfo | None:
         return self.job.run_info
 
+    @property
+    def timings(self) -> JobTimings:
+        return self.job.timings
+
     def predict(self) -> dict[str, typing.Any]:
         result = run_coro_thread_save(self.event_loop, self.job.predict())
         return result # type: ignore [no-any-return]
@@ -89,6 +114,28 @@ class SyncInferJob:
         run_coro_thread_save(self.event_loop, self.job.cancel())
 
 
+class SyncInferAssetsJob:
+    def __init__(self, job: InferAssetsJob, event_loop):
+        self.job = job
+        self.event_loop = event_loop
+
+    @property
+    def usage(self) -> InferTokenUsage:
+        return self.job.usage
+
+    def __iter__(self) -> typing.Iterator[InferAssetResult]:
+        """Iterate over the results in completion order."""
+        while True:
+            results = run_coro_thread_save(self.event_loop, self.job.pop_results(SYNC_RESULT_BATCH))
+            for result in results:
+                if result is None:
+                    return
+                yield result
+
+    def cancel(self):
+        run_coro_thread_save(self.event_loop, self.job.cancel())
+
+
 class SyncEvaluateJob:
     def __init__(self, job: EvaluateJob, event_loop):
         self.job = job
@@ -103,6 +150,7 @@ class SyncEvaluateJob:
 
 
 def wrap_event_handler(event_handler: SyncEventHandler) -> EventHandler:
+    @functools.wraps(event_handler)
     async def async_event_handler(event: ChangeEvent):
         await asyncio.to_thread(event_handler, event)
     return async_event_handler
@@ -159,6 +207,9 @@ class SyncDataEndpoint(SyncEndpoint):
             self.endpoint.remove_all_dataset_event_handlers(dataset_uuid)
         )
 
+    def event_handler_stats(self) -> list[EventHandlerStats]:
+        return run_coro_thread_save(self.event_loop, self.endpoint.event_handler_stats())
+
     """ Model methods """
 
     def list_datasets(
@@ -328,6 +379,39 @@ class SyncDataEndpoint(SyncEndpoint):
         )
         return SyncDataJob(job, self.event_loop)
 
+    def upload_assets(
+            self,
+            paths: typing.Sequence[str],
+            dataset_uuid: str,
+            dataset_version: int | None = None,
+            concurrency: int = 8,
+            journal_path: str | None = None,
+            mime_type: str | None = None,
+            sync_transform: bool | None = None,
+            no_transform: bool | None = None,
+            max_retries: int = 3,
+            timeout: aiohttp.ClientTimeout | None = aiohttp.ClientTimeout(total=None, sock_read=600),
+            external_ids: typing.Mapping[str, str] | None = None,
+            dedup_by_hash: bool = False,
+    ) -> UploadResult:
+        return run_coro_thread_save(
+            self.event_loop,
+            self.endpoint.upload_assets(
+                paths=paths,
+                dataset_uuid=dataset_uuid,
+                dataset_version=dataset_version,
+                concurrency=concurrency,
+                journal_path=journal_path,
+                mime_type=mime_type,
+                sync_transform=sync_transform,
+                no_transform=no_transform,
+                max_retries=max_retries,
+                timeout=timeout,
+                external_ids=external_ids,
+                dedup_by_hash=dedup_by_hash,
+            )
+        )
+
     def list_assets(
             self,
             dataset_uuid: str,
@@ -353,6 +437,44 @@ class SyncDataEndpoint(SyncEndpoint):
             )
         )
 
+    def iter_assets(
+            self,
+            dataset_uuid: str,
+            dataset_version: int | None = None,
+            include_annotations: bool = False,
+            inclusion_mode: AssetInclusionMode = AssetInclusionMode.annotated_only,
+            annotation_inclusion_mode: AnnotationInclusionMode | None = None,
+            include_partitions: list[str] | None = None,
+            include_auto_annotates: list[AutoAnnotate] | None = None,
+            include_sources: list[str] | None = None,
+            page_size: int = 1000,
+            result_format: AssetResultFormat = AssetResultFormat.model,
+    ) -> "typing.Iterator[Asset | dict[str, typing.Any] | pa.RecordBatch]":
+        # one round trip to the event loop per page, not per asset
+        pages = self.endpoint._iter_asset_pages(
+            dataset_uuid=dataset_uuid,
+            dataset_version=dataset_version,
+            include_annotations=include_annotations,
+            inclusion_mode=inclusion_mode,
+            annotation_inclusion_mode=annotation_inclusion_mode,
+            include_partitions=include_partitions,
+            include_auto_annotates=include_auto_annotates,
+            include_sources=include_sources,
+            page_size=page_size,
+            result_format=result_format,
+        )
+        try:
+            while True:
+                page = run_coro_thread_save(self.event_loop, _anext_or_none(pages))
+                if page is None:
+                    return
+                if result_format == AssetResultFormat.arrow:
+                    yield page
+                else:
+                    yield from page
+        finally:
+            run_coro_thread_save(self.event_loop, pages.aclose())
+
     def get_asset(self, asset_uuid: str, dataset_uuid: Optional[str] = None,
                   dataset_version: Optional[int] = None, include_annotations: bool = False) -> Asset:
         return run_coro_thread_save( # type: ignore [no-any-return]
@@ -495,6 +617,58 @@ class SyncDataEndpoint(SyncEndpoint):
             )
         )
 
+    def add_asset_annotations(
+            self,
+            predictions_by_asset: typing.Mapping[str, typing.Sequence[Prediction]],
+            auto_annotate: AutoAnnotate | None = None,
+            source: str | None = None,
+            user_review: UserReview | None = None,
+            approved_threshold: float | None = None,
+            dataset_uuid: str | None = None,
+            dataset_version: int | None = None,
+            concurrency: int = 8,
+            use_import: bool = False,
+    ) -> dict[str, BaseException | None]:
+        return run_coro_thread_save(
+            self.event_loop,
+            self.endpoint.add_asset_annotations(
+                predictions_by_asset=predictions_by_asset,
+                auto_annotate=auto_annotate,
+                source=source,
+                user_review=user_review,
+                approved_threshold=approved_threshold,
+                dataset_uuid=dataset_uuid,
+                dataset_version=dataset_version,
+                concurrency=concurrency,
+                use_import=use_import,
+            )
+        )
+
+    def update_asset_annotation_approvals(
+            self,
+            asset_uuids: typing.Sequence[str],
+            auto_annotate: AutoAnnotate | None = None,
+            source: str | None = None,
+            user_review: UserReview | None = None,
+            approved_threshold: float | None = None,
+            dataset_uuid: str | None = None,
+            dataset_version: int | None = None,
+            concurrency: int = 8,
+    ) -> dict[str, BaseException | None]:
+        return run_coro_thread_save(
+            self.event_loop,
+            self.endpoint.update_asset_annotation_approvals(
+                asset_uuids=asset_uuids,
+                auto_annotate=auto_annotate,
+                source=source,
+                user_review=user_review,
+                approved_threshold=approved_threshold,
+                dataset_uuid=dataset_uuid,
+                dataset_version=dataset_version,
+                concurrency=concurrency,
+            )
+        )
+
     def add_asset_roi(
             self,
             asset_uuid: str,
@@ -643,6 +817,74 @@ class SyncDataEndpoint(SyncEndpoint):
             )
         )
 
+    def import_assets_chunked(
+            self,
+            source: "pa.Table | str",
+            dataset_uuid: str | None = None,
+            dataset_version: int | None = None,
+            model_uuid: str | None = None,
+            max_chunk_rows: int = 1024,
+            concurrency: int = 4,
+            max_retries: int = 3,
+            callback: Callable[[int], None] | None = None,
+    ) -> ImportResult:
+        return run_coro_thread_save(
+            self.event_loop,
+            self.endpoint.import_assets_chunked(
+                source=source,
+                dataset_uuid=dataset_uuid,
+                dataset_version=dataset_version,
+                model_uuid=model_uuid,
+                max_chunk_rows=max_chunk_rows,
+                concurrency=concurrency,
+                max_retries=max_retries,
+                callback=callback,
+            )
+        )
+
+    def export_assets_sharded(
+            self,
+            output_dir: str,
+            dataset_uuid: str,
+            dataset_version: int | None = None,
+            asset_uuids: list[str] | None = None,
+            shard_size: int = 100,
+            concurrency: int = 4,
+            file_format: ExportFileFormat = ExportFileFormat.arrow,
+            max_retries: int = 3,
+            model_uuid: str | None = None,
+            transcode_mode: TranscodeMode = TranscodeMode.image_original_size,
+            asset_url_type: AssetUrlType | None = None,
+            inclusion_mode: AssetInclusionMode = AssetInclusionMode.annotated_only,
+            annotation_inclusion_mode: AnnotationInclusionMode = AnnotationInclusionMode.all,
+            include_external_ids: bool = False,
+            include_partitions: list[str] | None = None,
+            include_auto_annotates: list[AutoAnnotate] | None = None,
+            include_sources: list[str] | None = None,
+    ) -> ExportManifest:
+        return run_coro_thread_save( # type: ignore [no-any-return]
+            self.event_loop,
+            self.endpoint.export_assets_sharded(
+                output_dir=output_dir,
+                dataset_uuid=dataset_uuid,
+                dataset_version=dataset_version,
+                asset_uuids=asset_uuids,
+                shard_size=shard_size,
+                concurrency=concurrency,
+                file_format=file_format,
+                max_retries=max_retries,
+                model_uuid=model_uuid,
+                transcode_mode=transcode_mode,
+                asset_url_type=asset_url_type,
+                inclusion_mode=inclusion_mode,
+                annotation_inclusion_mode=annotation_inclusion_mode,
+                include_external_ids=include_external_ids,
+                include_partitions=include_partitions,
+                include_auto_annotates=include_auto_annotates,
+                include_sources=include_sources,
+            )
+        )
+
     def model_training_audits(
             self,
             model_uuids: list[str]
@@ -791,6 +1033,36 @@ class SyncDataEndpoint(SyncEndpoint):
         )
         return SyncInferJob(job, self.event_loop)
 
+    def infer_assets(
+            self,
+            asset_uuids: typing.Iterable[str],
+            infer_request: InferRequest,
+            dataset_uuid: str | None = None,
+            dataset_version: int | None = None,
+            transcode_mode: TranscodeMode | None = None,
+            start_timestamp: int | None = None,
+            end_timestamp: int | None = None,
+            priority: str | None = None,
+            concurrency: int = 16,
+            max_retries: int = 3,
+    ) -> SyncInferAssetsJob:
+        job = run_coro_thread_save(
+            self.event_loop,
+            self.endpoint.infer_assets(
+                asset_uuids=asset_uuids,
+                infer_request=infer_request,
+                dataset_uuid=dataset_uuid,
+                dataset_version=dataset_version,
+                transcode_mode=transcode_mode,
+                start_timestamp=start_timestamp,
+                end_timestamp=end_timestamp,
+                priority=priority,
+                concurrency=concurrency,
+                max_retries=max_retries,
+            )
+        )
+        return SyncInferAssetsJob(job, self.event_loop)
+
     def evaluate_dataset(
             self,
             evaluate_request: EvaluateRequest,
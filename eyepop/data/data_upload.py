@@ -0,0 +1,131 @@
+import hashlib
+import json
+import mimetypes
+import os
+from typing import Any, BinaryIO, Iterator
+
+from pydantic import BaseModel
+
+HASH_BLOCK_SIZE = 1024 * 1024
+
+
+class UploadFailure(BaseModel):
+    path: str
+    error: str
+
+
+class UploadResult(BaseModel):
+    """Outcome of a bulk upload; `uploaded` maps each uploaded path to its new asset uuid."""
+    uploaded: dict[str, str] = {}
+    skipped: list[str] = []
+    failed: list[UploadFailure] = []
+    num_bytes: int = 0
+    elapsed_secs: float = 0.0
+
+    @property
+    def num_uploaded(self) -> int:
+        return len(self.uploaded)
+
+    @property
+    def num_skipped(self) -> int:
+        return len(self.skipped)
+
+    @property
+    def num_failed(self) -> int:
+        return len(self.failed)
+
+    @property
+    def assets_per_sec(self) -> float:
+        if self.elapsed_secs <= 0.0:
+            return 0.0
+        return self.num_uploaded / self.elapsed_secs
+
+    @property
+    def bytes_per_sec(self) -> float:
+        if self.elapsed_secs <= 0.0:
+            return 0.0
+        return self.num_bytes / self.elapsed_secs
+
+
+def file_sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while block := f.read(HASH_BLOCK_SIZE):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def guess_mime_type(path: str) -> str:
+    mime_type, _ = mimetypes.guess_type(path)
+    return mime_type if mime_type is not None else "application/octet-stream"
+
+
+def _read_journal_entries(journal_path: str) -> Iterator[dict[str, Any]]:
+    """The entries of a journal, a truncated last line left behind by an interrupted run is ignored."""
+    if not os.path.exists(journal_path):
+        return
+    with open(journal_path, "r") as f:
+        for line in f:
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                continue
+
+
+def read_upload_journal(journal_path: str) -> dict[str, str]:
+    """Read the external ids already uploaded by a previous run, mapped to their asset uuids."""
+    return {entry["external_id"]: entry["asset_uuid"] for entry in _read_journal_entries(journal_path)
+            if entry.get("external_id") is not None}
+
+
+def read_journaled_paths(journal_path: str) -> set[str]:
+    """Read the paths already uploaded by a previous run."""
+    return {entry["path"] for entry in _read_journal_entries(journal_path)}
+
+
+def open_upload_journal(journal_path: str) -> BinaryIO:
+    """Open the journal for appending, terminating a truncated last line of an interrupted run."""
+    journal = open(journal_path, "a+b")
+    if journal.tell() > 0:
+        journal.seek(-1, os.SEEK_END)
+        if journal.read(1) != b"\n":
+            journal.write(b"\n")
+    return journal
+
+
+def append_upload_journal(journal: BinaryIO, path: str, external_id: str | None, asset_uuid: str) -> None:
+    entry = {"path": path, "external_id": external_id, "asset_uuid": asset_uuid}
+    journal.write(json.dumps(entry).encode() + b"\n")
+    journal.flush()
+
+
+class FileOpener:
+    """Re-openable upload stream, every request attempt reads the file from the start.
+
+    The request calls the opener on the event loop; `prepare()` opens the file for the next call
+    ahead of time, from a worker thread.
+    """
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.file: BinaryIO | None = None
+        self.prepared: BinaryIO | None = None
+
+    def prepare(self) -> None:
+        self.close()
+        self.prepared = open(self.path, "rb")
+
+    def __call__(self) -> BinaryIO:
+        if self.file is not None:
+            self.file.close()
+        if self.prepared is not None:
+            self.file, self.prepared = self.prepared, None
+        else:
+            self.file = open(self.path, "rb")
+        return self.file
+
+    def close(self) -> None:
+        for f in (self.file, self.prepared):
+            if f is not None:
+                f.close()
+        self.file = None
+        self.prepared = None
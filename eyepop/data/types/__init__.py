@@ -6,6 +6,7 @@ from eyepop.data.types.enums import (
     ArgoWorkflowPhase,
     ArtifactType,
     AssetInclusionMode,
+    AssetResultFormat,
     AssetStatus,
     AssetUrlType,
     AutoAnnotate,
@@ -138,6 +139,7 @@ __all__ = [
     "ArgoWorkflowPhase",
     "ArtifactType",
     "AssetInclusionMode",
+    "AssetResultFormat",
     "AssetStatus",
     "AssetUrlType",
     "AutoAnnotate",
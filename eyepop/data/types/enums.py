@@ -157,6 +157,13 @@ class AssetUrlType(enum.StrEnum):
     https_signed = enum.auto()
 
 
+class AssetResultFormat(enum.StrEnum):
+    """Client side representation of assets returned by `iter_assets`."""
+    model = enum.auto()
+    dict = enum.auto()
+    arrow = enum.auto()
+
+
 class AssetInclusionMode(enum.StrEnum):
     all_assets = enum.auto()
     annotated_only = enum.auto()
@@ -1,17 +1,24 @@
 import asyncio
+import contextlib
 import logging
 import time
 from types import TracebackType
-from typing import Any, Awaitable, Callable, Optional, Type
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Optional, Type
 
 import aiohttp
 
+from eyepop import telemetry
 from eyepop.client_session import ClientSession
-from eyepop.metrics import MetricCollector
+from eyepop.jobs import JobStateCallback, current_timings, get_timings_trace_config
+from eyepop.loop_monitor import LoopLagMonitor
+from eyepop.metrics import EndpointMetrics, MetricCollector
 from eyepop.periodic import Periodic
-from eyepop.request_tracer import RequestTracer
+from eyepop.request_tracer import RequestTracer, TraceSpool
 from eyepop.settings import settings
 
+if TYPE_CHECKING:
+    from eyepop.metrics_exporter import MetricsServer
+
 log = logging.getLogger('eyepop')
 log_requests = logging.getLogger('eyepop.requests')
 log_metrics = logging.getLogger('eyepop.metrics')
@@ -47,7 +54,12 @@ class Endpoint(ClientSession):
     client_session: aiohttp.ClientSession | None
     tasks: set[asyncio.Task]
     sem: asyncio.Semaphore
+    metrics: EndpointMetrics | None
     metrics_collector: MetricCollector | None
+    metrics_server: "MetricsServer | None"
+    loop_monitor: LoopLagMonitor | None
+    tracer: Any | None
+    job_callback: JobStateCallback | None
 
     def __init__(
             self,
@@ -80,7 +92,11 @@ class Endpoint(ClientSession):
             log.debug("Compute API will be used, session will be fetched in _reconnect()")
 
         if request_tracer_max_buffer > 0:
-            self.request_tracer = RequestTracer(max_events=request_tracer_max_buffer)
+            self.request_tracer = RequestTracer(
+                max_events=request_tracer_max_buffer,
+                spool=TraceSpool(settings.trace_spool_max_bytes, settings.trace_spool_dir),
+                compress=settings.trace_gzip,
+            )
             self.event_sender = Periodic(self.send_trace_recordings, settings.send_trace_threshold_secs / 2)
         else:
             self.request_tracer = None
@@ -101,11 +117,44 @@ class Endpoint(ClientSession):
         self.tasks = set()
         self.sem = asyncio.Semaphore(job_queue_length)
 
-        if log_metrics.getEffectiveLevel() == logging.DEBUG:
-            self.metrics_collector = MetricCollector()
+        self.jobs_waiting = 0
+        self.metrics_server = None
+        if (settings.collect_metrics or settings.metrics_port is not None
+                or log_metrics.getEffectiveLevel() == logging.DEBUG):
+            self.metrics = EndpointMetrics()
+            self.metrics_collector = self.metrics.jobs
+            self.metrics.add_gauge('jobs_in_flight', 'Jobs holding a job slot.', lambda: [({}, len(self.tasks))])
+            self.metrics.add_gauge('jobs_waiting', 'Jobs waiting for a free job slot.',
+                                   lambda: [({}, self.jobs_waiting)])
+            if self.request_tracer is not None:
+                request_tracer = self.request_tracer
+                self.metrics.add_gauge('request_trace_events', 'Request trace events sent or lost, by outcome.',
+                                       lambda: [({'outcome': k}, v) for k, v in request_tracer.counters.items()])
         else:
+            self.metrics = None
             self.metrics_collector = None
 
+        if settings.loop_lag_probe_secs is not None:
+            self.loop_monitor = LoopLagMonitor(settings.loop_lag_probe_secs, settings.loop_lag_threshold_secs)
+            if self.metrics is not None:
+                loop_monitor = self.loop_monitor
+                self.metrics.add_gauge('event_loop_lag_max_seconds', 'Largest event loop lag seen by the probe.',
+                                       lambda: [({}, loop_monitor.max_lag_secs)])
+                self.metrics.add_gauge('event_loop_blocked',
+                                       'Event loop blocking spans over the threshold, by call site.',
+                                       lambda: [({'site': k}, v) for k, v in loop_monitor.blocked.items()])
+                self.metrics.add_gauge('event_loop_blocked_seconds',
+                                       'Seconds the event loop was blocked, by call site.',
+                                       lambda: [({'site': k}, v) for k, v in loop_monitor.blocked_secs.items()])
+        else:
+            self.loop_monitor = None
+
+        self.tracer = telemetry.get_tracer() if settings.otel_tracing else None
+        if self.tracer is not None:
+            self.job_callback = telemetry.JobTracer(self.tracer, self.metrics_collector)
+        else:
+            self.job_callback = self.metrics_collector
+
     def add_retry_handler(self, status_code: int, handler: Callable[[int, int], Awaitable[bool]]):
         self.retry_handlers[status_code] = handler
 
@@ -159,8 +208,17 @@ class Endpoint(ClientSession):
         if self.request_tracer and self.client_session and self.event_sender:
             await self.event_sender.stop()
             if self.compute_ctx is None:
-                await self.request_tracer.send_and_reset(f'{self.eyepop_url}/events', await self._authorization_header(),
-                                                         None)
+                # bounded, records not delivered in time stay in the spool
+                try:
+                    await asyncio.wait_for(
+                        self.request_tracer.send_and_reset(f'{self.eyepop_url}/events',
+                                                           await self._authorization_header(), None,
+                                                           settings.trace_flush_timeout_secs),
+                        settings.trace_flush_timeout_secs)
+                except Exception as e:
+                    log.warning('final flush of trace events failed: %r', e)
+        if self.request_tracer is not None:
+            await self.request_tracer.close()
 
         if self.client_session:
             try:
@@ -170,29 +228,65 @@ class Endpoint(ClientSession):
             finally:
                 self.client_session = None
 
-        if self.metrics_collector:
+        if self.metrics_server is not None:
+            await self.metrics_server.stop()
+            self.metrics_server = None
+
+        if self.loop_monitor is not None:
+            await self.loop_monitor.stop()
+            if self.loop_monitor.blocked:
+                log.info('event loop blocked by call site: %s', dict(self.loop_monitor.blocked.most_common()))
+
+        if self.metrics_collector is not None and log_metrics.isEnabledFor(logging.DEBUG):
+            summary = self.metrics_collector.summary()
             log_metrics.debug('endpoint disconnected, collected session metrics:')
-            log_metrics.debug('total number of jobs: %d', self.metrics_collector.total_number_of_jobs)
-            log_metrics.debug(f'max concurrent number of jobs: {self.metrics_collector.max_number_of_jobs_by_state}')
-            log_metrics.debug(f'average wait time until state: {self.metrics_collector.get_average_times()}')
+            log_metrics.debug('total number of jobs: %d', summary['total_number_of_jobs'])
+            log_metrics.debug('max concurrent number of jobs: %s', summary['max_number_of_jobs_by_state'])
+            log_metrics.debug('time to start p50/p90/p99: %s', summary['time_to_start'])
+            log_metrics.debug('time to first result p50/p90/p99: %s', summary['time_to_first_result'])
+            log_metrics.debug('time to drain p50/p90/p99: %s', summary['time_to_drain'])
 
     async def connect(self):
-        trace_configs = [self.request_tracer.get_trace_config()] if self.request_tracer else None
+        trace_configs = [self.request_tracer.get_trace_config()] if self.request_tracer else []
+        trace_configs.append(get_timings_trace_config())
+        if self.metrics is not None:
+            trace_configs.append(self.metrics.get_trace_config())
+        if self.tracer is not None:
+            trace_configs.append(telemetry.get_trace_config(self.tracer))
         self.client_session = aiohttp.ClientSession(
             raise_for_status=response_check_with_error_body,
             trace_configs=trace_configs
         )
         assert self.client_session is not None
+        if self.loop_monitor is not None:
+            await self.loop_monitor.start()
         try:
             await self._reconnect()
         except Exception as e:
             await self.client_session.close()
             self.client_session = None
+            if self.loop_monitor is not None:
+                await self.loop_monitor.stop()
             raise e
 
         if self.event_sender is not None:
             await self.event_sender.start()
 
+        if settings.metrics_port is not None and self.metrics_server is None:
+            await self.start_metrics_server(settings.metrics_port, settings.metrics_host)
+
+    async def start_metrics_server(self, port: int = 9464, host: str = '127.0.0.1') -> "MetricsServer":
+        """Serve this endpoint's metrics in Prometheus text format at `http://{host}:{port}/metrics`."""
+        from eyepop.metrics_exporter import MetricsServer
+
+        if self.metrics is None:
+            raise ValueError("metrics are not collected, set EYEPOP_COLLECT_METRICS=true")
+        if self.metrics_server is not None:
+            await self.metrics_server.stop()
+        self.metrics_server = MetricsServer(self.metrics, host, port)
+        await self.metrics_server.start()
+        return self.metrics_server
+
     async def session(self) -> dict | None:
         token = await self.__get_access_token()
         if token is None:
@@ -235,11 +329,12 @@ class Endpoint(ClientSession):
             body = {'secret_key': self.secret_key}
             post_url = f'{self.eyepop_url}/authentication/token'
             log_requests.debug('before POST %s', post_url)
-            async with self.client_session.post(post_url, json=body) as response:
-                token = await response.json()
-                assert token is not None
-                self.token = token
-                self.expire_token_time = time.time() + token['expires_in'] - 60
+            with self._start_span('eyepop.token_refresh'):
+                async with self.client_session.post(post_url, json=body) as response:
+                    token = await response.json()
+                    assert token is not None
+                    self.token = token
+                    self.expire_token_time = time.time() + token['expires_in'] - 60
             assert self.token is not None
             log_requests.debug('after POST %s expires_in=%d token_type=%s', post_url, self.token['expires_in'],
                                self.token['token_type'])
@@ -252,7 +347,16 @@ class Endpoint(ClientSession):
         self.sem.release()
 
     async def _task_start(self, coro):
-        await self.sem.acquire()
+        if self.metrics is not None:
+            self.jobs_waiting += 1
+            wait_start = time.monotonic()
+            try:
+                await self.sem.acquire()
+            finally:
+                self.jobs_waiting -= 1
+            self.metrics.semaphore_wait.record(time.monotonic() - wait_start)
+        else:
+            await self.sem.acquire()
         task = asyncio.create_task(coro)
         self.tasks.add(task)
         task.add_done_callback(self._task_done)
@@ -277,7 +381,8 @@ class Endpoint(ClientSession):
             try:
                 from eyepop.compute.api import refresh_compute_token
                 assert self.client_session is not None
-                self.compute_ctx = await refresh_compute_token(self.compute_ctx, self.client_session)
+                with self._start_span('eyepop.token_refresh'):
+                    self.compute_ctx = await refresh_compute_token(self.compute_ctx, self.client_session)
                 log_requests.debug('retry handler: compute token refreshed successfully')
                 return True
             except Exception as e:
@@ -305,6 +410,7 @@ class Endpoint(ClientSession):
             extra_headers: dict[str, str] | None = None,
     ) -> aiohttp.ClientResponse:
         assert self.client_session is not None
+        timings = current_timings()
         failed_attempts = 0
         while True:
             headers = {}
@@ -321,24 +427,48 @@ class Endpoint(ClientSession):
                 log_requests.debug('before %s %s', method, url)
                 if isinstance(data, Callable):
                     data = data()
+                if timings is not None:
+                    timings.attempt_started()
                 response = await self.client_session.request(method, url, headers=headers, data=data, timeout=timeout)
+                if timings is not None:
+                    timings.response_received()
                 log_requests.debug('after %s %s', method, url)
                 return response
             except aiohttp.ClientResponseError as e:
                 failed_attempts += 1
                 if e.status not in self.retry_handlers:
                     raise e
-                if not await self.retry_handlers[e.status](e.status, failed_attempts):
+                if not await self._retry(e.status, failed_attempts):
                     raise e
             except aiohttp.ClientConnectionError as e:
                 failed_attempts += 1
                 if 404 not in self.retry_handlers:
                     raise e
-                if not await self.retry_handlers[404](404, failed_attempts):
+                if not await self._retry(404, failed_attempts):
                     raise e
 
+    async def _retry(self, status_code: int, failed_attempts: int) -> bool:
+        retry = await self.retry_handlers[status_code](status_code, failed_attempts)
+        if retry:
+            self._record_retry(status_code, failed_attempts)
+        return retry
+
+    def _record_retry(self, status: int | str, failed_attempts: int) -> None:
+        if self.metrics is not None:
+            self.metrics.record_retry(status)
+        if self.tracer is not None:
+            telemetry.add_event('retry', {'http.response.status_code': str(status),
+                                          'eyepop.failed_attempts': failed_attempts})
+
+    def _start_span(self, name: str) -> contextlib.AbstractContextManager:
+        """A span around a block of the endpoint's own work, e.g. a config reconnect, if tracing is enabled."""
+        if self.tracer is None:
+            return contextlib.nullcontext()
+        return self.tracer.start_as_current_span(name)
+
     async def send_trace_recordings(self):
         if self.request_tracer is not None:
             await self.request_tracer.send_and_reset(f'{self.eyepop_url}/events',
                                                      await self._authorization_header(),
-                                                     settings.send_trace_threshold_secs)
+                                                     settings.send_trace_threshold_secs,
+                                                     settings.trace_send_timeout_secs)
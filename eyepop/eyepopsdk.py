@@ -1,15 +1,23 @@
 import logging
 import os
+from typing import TYPE_CHECKING
 
 from typing_extensions import deprecated
 
 from eyepop import __version__
-from eyepop.data.data_endpoint import DataEndpoint
-from eyepop.data.data_syncify import SyncDataEndpoint
+from eyepop.data.data_events import EventOrdering, EventOverflowPolicy
+from eyepop.data.data_infer_cache import InferCache
 from eyepop.worker.worker_endpoint import WorkerEndpoint
 from eyepop.worker.worker_syncify import SyncWorkerEndpoint
 from eyepop.worker.worker_types import Pop
 
+if TYPE_CHECKING:
+    # the data API pulls in pyarrow, visualize pulls in matplotlib; both load on first use
+    from matplotlib.axes import Axes
+
+    from eyepop.data.data_endpoint import DataEndpoint
+    from eyepop.data.data_syncify import SyncDataEndpoint
+
 log = logging.getLogger('eyepop')
 log.debug(f"EyePop SDK v{__version__} initializing...")
 
@@ -220,7 +228,16 @@ class EyePopSdk:
         is_async: bool = False,
         request_tracer_max_buffer: int = 1204,
         disable_ws: bool = True,
-    ) -> DataEndpoint | SyncDataEndpoint:
+        metadata_cache_ttl_secs: float | None = None,
+        event_queue_size: int = 1024,
+        event_overflow_policy: EventOverflowPolicy = EventOverflowPolicy.block,
+        event_ordering: EventOrdering = EventOrdering.handler,
+        completion_pollers: int | None = 64,
+        infer_cache: InferCache | None = None,
+    ) -> "DataEndpoint | SyncDataEndpoint":
+        from eyepop.data.data_endpoint import DataEndpoint
+        from eyepop.data.data_syncify import SyncDataEndpoint
+
         if access_token is None and secret_key is None and api_key is None:
             secret_key = os.getenv("EYEPOP_SECRET_KEY")
             api_key = os.getenv("EYEPOP_API_KEY")
@@ -250,6 +267,12 @@ class EyePopSdk:
             job_queue_length=job_queue_length,
             request_tracer_max_buffer=request_tracer_max_buffer,
             disable_ws=disable_ws,
+            metadata_cache_ttl_secs=metadata_cache_ttl_secs,
+            event_queue_size=event_queue_size,
+            event_overflow_policy=event_overflow_policy,
+            event_ordering=event_ordering,
+            completion_pollers=completion_pollers,
+            infer_cache=infer_cache,
         )
 
         if not is_async:
@@ -257,8 +280,7 @@ class EyePopSdk:
 
         return endpoint
 
-    from matplotlib.axes import Axes
     @staticmethod
-    def plot(axes: Axes):
+    def plot(axes: "Axes"):
         from eyepop.visualize import EyePopPlot
         return EyePopPlot(axes)
@@ -1,8 +1,13 @@
 import asyncio
+import time
 from asyncio import Queue
+from contextvars import ContextVar
 from enum import Enum
+from types import SimpleNamespace
 from typing import Any, Callable
 
+import aiohttp
+
 from eyepop.client_session import ClientSession
 
 
@@ -42,6 +47,101 @@ class JobStateCallback:
         pass
 
 
+class JobTimings:
+    """When a job reached each stage, in `time.monotonic()` seconds, and the bytes it moved.
+
+    Stages not reached yet are None. `queued_secs` is the wait for a slot of the endpoint's job
+    queue, `request_secs` runs from the first request attempt, i.e. the upload including retries,
+    until the response headers of the job's last request arrived, and `processing_secs` from
+    there until the first result.
+    """
+    __slots__ = ('created', 'started', 'request_start', 'response', 'first_result', 'finished',
+                 'attempts', 'bytes_sent', 'bytes_received')
+
+    def __init__(self):
+        self.created = time.monotonic()
+        self.started: float | None = None
+        self.request_start: float | None = None
+        self.response: float | None = None
+        self.first_result: float | None = None
+        self.finished: float | None = None
+        self.attempts = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+
+    def attempt_started(self) -> None:
+        if self.request_start is None:
+            self.request_start = time.monotonic()
+        self.attempts += 1
+
+    def response_received(self) -> None:
+        self.response = time.monotonic()
+
+    @property
+    def queued_secs(self) -> float | None:
+        return _secs_between(self.created, self.started)
+
+    @property
+    def request_secs(self) -> float | None:
+        return _secs_between(self.request_start, self.response)
+
+    @property
+    def processing_secs(self) -> float | None:
+        return _secs_between(self.response, self.first_result)
+
+    @property
+    def total_secs(self) -> float | None:
+        return _secs_between(self.created, self.finished)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            'queued_secs': self.queued_secs,
+            'request_secs': self.request_secs,
+            'processing_secs': self.processing_secs,
+            'total_secs': self.total_secs,
+            'attempts': self.attempts,
+            'bytes_sent': self.bytes_sent,
+            'bytes_received': self.bytes_received,
+        }
+
+    def __repr__(self):
+        """String representation of the timings."""
+        return f'JobTimings({self.as_dict()})'
+
+
+def _secs_between(start: float | None, end: float | None) -> float | None:
+    return end - start if start is not None and end is not None else None
+
+
+# timings of the job whose task is running, set by Job.execute and inherited by its subtasks
+_current_timings: ContextVar[JobTimings | None] = ContextVar('eyepop_job_timings', default=None)
+
+
+def current_timings() -> JobTimings | None:
+    """Timings of the job executing in the current task, if any."""
+    return _current_timings.get()
+
+
+def get_timings_trace_config() -> aiohttp.TraceConfig:
+    """An aiohttp trace config that counts body bytes into the timings of the current job."""
+    async def on_request_chunk_sent(session, trace_config_ctx: SimpleNamespace,
+                                    params: aiohttp.TraceRequestChunkSentParams):
+        timings = _current_timings.get()
+        if timings is not None:
+            timings.bytes_sent += len(params.chunk)
+
+    async def on_response_chunk_received(session, trace_config_ctx: SimpleNamespace,
+                                         params: aiohttp.TraceResponseChunkReceivedParams):
+        timings = _current_timings.get()
+        if timings is not None:
+            timings.bytes_received += len(params.chunk)
+
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_request_chunk_sent.append(on_request_chunk_sent)
+    trace_config.on_response_chunk_received.append(on_response_chunk_received)
+    return trace_config
+
+
 class Job:
     """Abstract Job submitted to an EyePop.ai Endpoint."""
 
@@ -54,6 +154,8 @@ class Job:
         self._response: Any = None
         self._callback: JobStateCallback
         self._queue = asyncio.Queue(maxsize=128)
+        self._deferred_error: Exception | None = None
+        self.timings = JobTimings()
         if callback is not None:
             self._callback = callback
         else:
@@ -64,12 +166,18 @@ class Job:
         """Destructor."""
         self._callback.finalized(self)
 
-    async def push_message(self, message: dict[str, Any]):
+    async def push_message(self, message: Any):
+        if self.timings.first_result is None:
+            self.timings.first_result = time.monotonic()
         queue = self._queue
         if queue is not None:
             await queue.put(message)
 
     async def pop_result(self) -> Any:
+        error = self._deferred_error
+        if error is not None:
+            self._deferred_error = None
+            raise error
         queue = self._queue
         if queue is None:
             return None
@@ -84,6 +192,25 @@ class Job:
                 raise result
             return result
 
+    async def pop_results(self, max_results: int) -> list[Any]:
+        """Wait for the next result, then take up to `max_results` in total of those already queued.
+
+        Lets a caller on another thread collect a burst of results in one round trip. The list
+        ends with None at the end of the job; an error is raised by the call after the results
+        queued before it.
+        """
+        results = [await self.pop_result()]
+        while results[-1] is not None and len(results) < max_results:
+            queue = self._queue
+            if queue is None or queue.empty():
+                break
+            try:
+                results.append(await self.pop_result())
+            except Exception as e:
+                self._deferred_error = e
+                break
+        return results
+
     async def cancel(self):
         queue = self._queue
         if queue is None:
@@ -99,6 +226,8 @@ class Job:
             return
         session = self._session
 
+        self.timings.started = time.monotonic()
+        _current_timings.set(self.timings)
         self._callback.started(self)
 
         try:
@@ -116,6 +245,7 @@ class Job:
                 response = self._response.close()
                 if response is not None:
                     response.release()
+            self.timings.finished = time.monotonic()
             self._callback.finished(self)
             if self.on_ready is not None:
                 await self.on_ready(self)
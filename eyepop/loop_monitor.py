@@ -0,0 +1,120 @@
+import asyncio
+import logging
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from types import FrameType
+from typing import Any
+
+from eyepop.metrics import LatencyHistogram
+from eyepop.periodic import Periodic
+
+log = logging.getLogger('eyepop.loop')
+
+_SDK_DIR = os.path.dirname(os.path.abspath(__file__))
+_SDK_ROOT = os.path.dirname(_SDK_DIR)
+
+
+def call_site(frame: FrameType | None) -> str:
+    """The innermost SDK frame of a stack as `path:line (function)`.
+
+    Falls back to the innermost frame if no SDK code is on the stack.
+    """
+    innermost = frame
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if filename.startswith(_SDK_DIR) and filename != __file__:
+            return _format_frame(frame)
+        frame = frame.f_back
+    return _format_frame(innermost) if innermost is not None else 'unknown'
+
+
+def _format_frame(frame: FrameType) -> str:
+    filename = frame.f_code.co_filename
+    if filename.startswith(_SDK_DIR):
+        filename = os.path.relpath(filename, _SDK_ROOT)
+    return f'{filename}:{frame.f_lineno} ({frame.f_code.co_name})'
+
+
+class LoopLagMonitor:
+    """Measures the lag of the event loop and attributes blocking spans to the code that blocked.
+
+    A `Periodic` probe on the loop expects to wake up every `interval_secs`; how late it wakes is
+    the loop lag. A watchdog thread samples the stack of the loop thread whenever the probe is more
+    than `threshold_secs` late, so a blocking span is attributed to the innermost SDK frame that
+    was running, e.g. a large `json.loads` in a job or a file `open()` in an upload. Each span over
+    the threshold is logged as warning on `eyepop.loop` and counted by call site in `blocked`.
+    """
+
+    def __init__(self, interval_secs: float = 0.05, threshold_secs: float = 0.1):
+        self.interval_secs = interval_secs
+        self.threshold_secs = threshold_secs
+        self.lag = LatencyHistogram()
+        self.max_lag_secs = 0.0
+        self.blocked: Counter[str] = Counter()
+        self.blocked_secs: dict[str, float] = {}
+        self._probe = Periodic(self._on_probe, interval_secs)
+        self._heartbeat = 0.0
+        self._loop_thread_id: int | None = None
+        self._samples: Counter[str] = Counter()
+        self._samples_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._watchdog: threading.Thread | None = None
+
+    async def start(self) -> None:
+        if self._watchdog is not None:
+            return
+        self._loop_thread_id = threading.get_ident()
+        self._heartbeat = time.monotonic()
+        self._stop.clear()
+        self._watchdog = threading.Thread(target=self._watch, name='eyepop-loop-watchdog', daemon=True)
+        self._watchdog.start()
+        await self._probe.start()
+
+    async def stop(self) -> None:
+        await self._probe.stop()
+        watchdog = self._watchdog
+        self._watchdog = None
+        if watchdog is not None:
+            self._stop.set()
+            await asyncio.to_thread(watchdog.join)
+
+    def summary(self, ps: tuple[float, ...] = (50.0, 90.0, 99.0)) -> dict[str, Any]:
+        return {
+            'lag': self.lag.percentiles(ps),
+            'max_lag_secs': self.max_lag_secs,
+            'blocked': dict(self.blocked),
+            'blocked_secs': dict(self.blocked_secs),
+        }
+
+    async def _on_probe(self) -> None:
+        now = time.monotonic()
+        lag = max(0.0, now - self._heartbeat - self.interval_secs)
+        self._heartbeat = now
+        self.lag.record(lag)
+        if lag > self.max_lag_secs:
+            self.max_lag_secs = lag
+        with self._samples_lock:
+            samples = self._samples
+            self._samples = Counter()
+        if lag < self.threshold_secs:
+            return
+        # the site sampled most often during the span, the watchdog may miss spans near the threshold
+        site = samples.most_common(1)[0][0] if samples else 'unknown'
+        self.blocked[site] += 1
+        self.blocked_secs[site] = self.blocked_secs.get(site, 0.0) + lag
+        log.warning('event loop blocked for %.3f s in %s', lag, site)
+
+    def _watch(self) -> None:
+        check_secs = max(self.threshold_secs / 4, 0.005)
+        while not self._stop.wait(check_secs):
+            if time.monotonic() - self._heartbeat - self.interval_secs < self.threshold_secs:
+                continue
+            assert self._loop_thread_id is not None
+            frame = sys._current_frames().get(self._loop_thread_id)
+            site = call_site(frame)
+            del frame
+            with self._samples_lock:
+                self._samples[site] += 1
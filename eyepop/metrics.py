@@ -1,105 +1,263 @@
 import logging
+import re
 import time
-from enum import Enum
+from types import SimpleNamespace
+from typing import Any, Callable, Iterable
 
-from eyepop.jobs import JobState
-from eyepop.worker.worker_jobs import JobStateCallback, WorkerJob
+import aiohttp
+
+from eyepop.jobs import JobState, JobStateCallback
 
 log = logging.getLogger('eyepop')
 
+
+class LatencyHistogram:
+    """Log-bucketed latency histogram in microseconds, HDR style.
+
+    Every power of two is split into `2 ** sub_bucket_bits` linear buckets, so a recorded value
+    is off by at most 1 / 2 ** sub_bucket_bits of itself (6.25% by default). Recording is O(1)
+    and memory grows with the range of values seen, not with the number of values.
+    """
+
+    def __init__(self, sub_bucket_bits: int = 4):
+        self._sub_bucket_bits = sub_bucket_bits
+        self._sub_buckets = 1 << sub_bucket_bits
+        self._counts: dict[int, int] = {}
+        self.count = 0
+        self.total_secs = 0.0
+        self.min_secs: float | None = None
+        self.max_secs: float | None = None
+
+    def record(self, secs: float) -> None:
+        if secs < 0.0:
+            secs = 0.0
+        index = self._bucket_index(int(secs * 1_000_000))
+        self._counts[index] = self._counts.get(index, 0) + 1
+        self.count += 1
+        self.total_secs += secs
+        if self.min_secs is None or secs < self.min_secs:
+            self.min_secs = secs
+        if self.max_secs is None or secs > self.max_secs:
+            self.max_secs = secs
+
+    def mean(self) -> float:
+        return self.total_secs / self.count if self.count > 0 else 0.0
+
+    def percentile(self, p: float) -> float:
+        """Latency in seconds at or below which `p` percent of the recorded values fall."""
+        if not 0.0 <= p <= 100.0:
+            raise ValueError("percentile must be between 0 and 100")
+        if self.count == 0:
+            return 0.0
+        rank = max(1, int(p / 100.0 * self.count + 0.5))
+        seen = 0
+        for index in sorted(self._counts):
+            seen += self._counts[index]
+            if seen >= rank:
+                value_secs = self._bucket_value(index) / 1_000_000
+                return min(max(value_secs, self.min_secs or 0.0), self.max_secs or 0.0)
+        return self.max_secs or 0.0
+
+    def percentiles(self, ps: tuple[float, ...] = (50.0, 90.0, 99.0)) -> dict[float, float]:
+        return {p: self.percentile(p) for p in ps}
+
+    def buckets(self) -> list[tuple[float, int]]:
+        """Non-empty buckets as (upper bound in seconds, count), ascending."""
+        return [(self._bucket_upper(index) / 1_000_000, self._counts[index]) for index in sorted(self._counts)]
+
+    def _bucket_index(self, micros: int) -> int:
+        if micros < 2 * self._sub_buckets:
+            return micros
+        shift = micros.bit_length() - self._sub_bucket_bits - 1
+        return shift * self._sub_buckets + (micros >> shift)
+
+    def _bucket_bounds(self, index: int) -> tuple[int, int]:
+        if index < 2 * self._sub_buckets:
+            return index, index + 1
+        shift = index // self._sub_buckets - 1
+        mantissa = index - shift * self._sub_buckets
+        return mantissa << shift, (mantissa + 1) << shift
+
+    def _bucket_value(self, index: int) -> float:
+        lower, upper = self._bucket_bounds(index)
+        return (lower + upper) / 2
+
+    def _bucket_upper(self, index: int) -> int:
+        return self._bucket_bounds(index)[1]
+
+
+class _JobMetrics:
+    __slots__ = ('state', 'created_at')
+
+    def __init__(self, created_at: float):
+        self.state = JobState.CREATED
+        self.created_at = created_at
+
+
 class MetricCollector(JobStateCallback):
+    """Job state metrics of an endpoint, O(1) per state transition.
+
+    Keeps the number of jobs currently in each state and its maximum, and latency histograms
+    measured from job creation to start, to the first result and to the drained result queue.
+    Jobs are tracked by id and forgotten when finalized, the collector holds no job references.
+    """
+
     def __init__(self):
-        self.jobs_to_state = {}
-        self.jobs_to_last_updated = {}
+        self._jobs: dict[int, _JobMetrics] = {}
         self.total_number_of_jobs = 0
-        self.max_number_of_jobs_by_state = {JobState.STARTED: 0, JobState.IN_PROGRESS: 0, JobState.FINISHED: 0,
-                                            JobState.DRAINED: 0, JobState.FAILED: 0, }
-        self.number_of_jobs_reached_state = {JobState.IN_PROGRESS: 0, JobState.FINISHED: 0, JobState.DRAINED: 0,
-                                             JobState.FAILED: 0, }
-        self.total_time_to_reached_state = {JobState.IN_PROGRESS: 0.0, JobState.FINISHED: 0.0, JobState.DRAINED: 0.0,
-                                            JobState.FAILED: 0.0, }
-
-    def get_average_time(self, state: JobState) -> float:
-        if self.number_of_jobs_reached_state[state] == 0:
-            return 0.0
-        else:
-            return self.total_time_to_reached_state[state] / self.number_of_jobs_reached_state[state]
-
-    def get_average_times(self) -> dict:
-        times = {JobState.IN_PROGRESS: self.get_average_time(JobState.IN_PROGRESS),
-                 JobState.FINISHED: self.get_average_time(JobState.FINISHED),
-                 JobState.DRAINED: self.get_average_time(JobState.DRAINED),
-                 JobState.FAILED: self.get_average_time(JobState.FAILED), }
-        return times
-
-    def update_count_by_state(self, state: JobState):
-        count = 0
-        for _, job_state in self.jobs_to_state.items():
-            if state == job_state:
-                count += 1
+        self.number_of_jobs_by_state = {state: 0 for state in JobState}
+        self.max_number_of_jobs_by_state = {state: 0 for state in JobState}
+        self.number_of_jobs_reached_state = {state: 0 for state in JobState}
+        self.time_to_start = LatencyHistogram()
+        self.time_to_first_result = LatencyHistogram()
+        self.time_to_drain = LatencyHistogram()
+
+    def summary(self, ps: tuple[float, ...] = (50.0, 90.0, 99.0)) -> dict[str, Any]:
+        return {
+            'total_number_of_jobs': self.total_number_of_jobs,
+            'number_of_jobs_by_state': {state.name: n for state, n in self.number_of_jobs_by_state.items()},
+            'max_number_of_jobs_by_state': {state.name: n for state, n in self.max_number_of_jobs_by_state.items()},
+            'time_to_start': self.time_to_start.percentiles(ps),
+            'time_to_first_result': self.time_to_first_result.percentiles(ps),
+            'time_to_drain': self.time_to_drain.percentiles(ps),
+        }
+
+    def _transition(self, job, new_state: JobState, histogram: LatencyHistogram | None = None) -> None:
+        metrics = self._jobs.get(id(job))
+        if metrics is None:
+            log.debug("untracked job %s in metrics collector for %s", job, new_state)
+            return
+        if metrics.state == new_state or metrics.state == JobState.DRAINED:
+            # a job may finish after its consumer saw the end of the results
+            return
+        self.number_of_jobs_by_state[metrics.state] -= 1
+        metrics.state = new_state
+        self._enter(new_state)
+        if histogram is not None:
+            histogram.record(time.monotonic() - metrics.created_at)
+
+    def _enter(self, state: JobState) -> None:
+        count = self.number_of_jobs_by_state[state] + 1
+        self.number_of_jobs_by_state[state] = count
         if count > self.max_number_of_jobs_by_state[state]:
             self.max_number_of_jobs_by_state[state] = count
-
-    def collect_execution_time(self, job: WorkerJob, new_state: JobState):
-        now = time.time()
-        duration = now - self.jobs_to_last_updated[job]
-        self.jobs_to_last_updated[job] = now
-        self.number_of_jobs_reached_state[new_state] += 1
-        self.total_time_to_reached_state[new_state] += duration
+        self.number_of_jobs_reached_state[state] += 1
 
     def created(self, job):
         self.total_number_of_jobs += 1
-        self.jobs_to_state[job] = JobState.CREATED
-        self.jobs_to_last_updated[job] = time.time()
+        self._jobs[id(job)] = _JobMetrics(time.monotonic())
+        self._enter(JobState.CREATED)
 
     def started(self, job):
-        current_state = self.jobs_to_state[job]
-        if current_state != JobState.CREATED:
-            log.debug("invalid job state %v in metrics collector for started(%v)", current_state, job)
-        else:
-            self.jobs_to_state[job] = JobState.STARTED
-        self.jobs_to_last_updated[job] = time.time()
-        self.update_count_by_state(JobState.STARTED)
+        self._transition(job, JobState.STARTED, self.time_to_start)
 
     def first_result(self, job):
-        current_state = self.jobs_to_state[job]
-        if current_state != JobState.STARTED:
-            log.debug("invalid job state %v in metrics collector for first_result(%v)", current_state, job)
-        else:
-            self.jobs_to_state[job] = JobState.IN_PROGRESS
-        self.collect_execution_time(job, JobState.IN_PROGRESS)
-        self.update_count_by_state(JobState.IN_PROGRESS)
+        self._transition(job, JobState.IN_PROGRESS, self.time_to_first_result)
 
     def failed(self, job):
-        self.jobs_to_state[job] = JobState.FAILED
-        self.collect_execution_time(job, JobState.FAILED)
-        self.update_count_by_state(JobState.FAILED)
-        self.jobs_to_last_updated[job] = time.time()
+        self._transition(job, JobState.FAILED)
 
     def finished(self, job):
-        self.jobs_to_state[job] = JobState.FINISHED
-        self.collect_execution_time(job, JobState.FINISHED)
-        self.update_count_by_state(JobState.FINISHED)
-        self.jobs_to_last_updated[job] = time.time()
+        self._transition(job, JobState.FINISHED)
 
     def drained(self, job):
-        self.jobs_to_state[job] = JobState.DRAINED
-        self.collect_execution_time(job, JobState.DRAINED)
-        self.update_count_by_state(JobState.DRAINED)
-        self.jobs_to_last_updated[job] = time.time()
+        self._transition(job, JobState.DRAINED, self.time_to_drain)
 
     def finalized(self, job):
-        del self.jobs_to_state[job]
+        metrics = self._jobs.pop(id(job), None)
+        if metrics is not None:
+            self.number_of_jobs_by_state[metrics.state] -= 1
+
+
+_ROUTE_ID_SEGMENT = re.compile(r'^([0-9]+|[0-9a-fA-F]{32}|[0-9a-fA-F-]{36}|[A-Za-z0-9_-]{24,})$')
+
+
+def route_of(path: str) -> str:
+    """Request path with id-like segments replaced by `{id}`, to bound label cardinality."""
+    return '/'.join('{id}' if _ROUTE_ID_SEGMENT.match(segment) else segment for segment in path.split('/'))
+
+
+GaugeCallback = Callable[[], Iterable[tuple[dict[str, str], float]]]
+
+
+class _RequestTrace:
+    __slots__ = ('route', 'method', 'start', 'bytes_sent', 'bytes_received')
+
+    def __init__(self, route: str, method: str, start: float):
+        self.route = route
+        self.method = method
+        self.start = start
+        self.bytes_sent = 0
+        self.bytes_received = 0
+
+
+class EndpointMetrics:
+    """Job, request and saturation metrics of one endpoint, exported by `eyepop.metrics_exporter`.
+
+    Request metrics come from an aiohttp trace config, keyed by method and route. Endpoints and
+    callers plug in further gauges with `add_gauge()`; they are evaluated at export time only.
+    """
+
+    def __init__(self, jobs: MetricCollector | None = None):
+        self.jobs = jobs if jobs is not None else MetricCollector()
+        self.semaphore_wait = LatencyHistogram()
+        self.request_latency: dict[tuple[str, str], LatencyHistogram] = {}
+        self.requests: dict[tuple[str, str, str], int] = {}
+        self.bytes_sent: dict[tuple[str, str], int] = {}
+        self.bytes_received: dict[tuple[str, str], int] = {}
+        self.retries_by_status: dict[str, int] = {}
+        self.gauges: dict[str, tuple[str, GaugeCallback]] = {}
+
+    def add_gauge(self, name: str, help_text: str, callback: GaugeCallback) -> None:
+        """Register a gauge; `callback` returns (labels, value) pairs when metrics are exported."""
+        self.gauges[name] = (help_text, callback)
+
+    def record_retry(self, status: int | str) -> None:
+        key = str(status)
+        self.retries_by_status[key] = self.retries_by_status.get(key, 0) + 1
+
+    def get_trace_config(self) -> aiohttp.TraceConfig:
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_request_start.append(self._on_request_start)
+        trace_config.on_request_chunk_sent.append(self._on_request_chunk_sent)
+        trace_config.on_response_chunk_received.append(self._on_response_chunk_received)
+        trace_config.on_request_end.append(self._on_request_end)
+        trace_config.on_request_exception.append(self._on_request_exception)
+        return trace_config
+
+    async def _on_request_start(self, session, trace_config_ctx: SimpleNamespace,
+                                params: aiohttp.TraceRequestStartParams):
+        trace_config_ctx.metrics = _RequestTrace(route_of(params.url.path), params.method.upper(),
+                                                 time.monotonic())
+
+    async def _on_request_chunk_sent(self, session, trace_config_ctx: SimpleNamespace,
+                                     params: aiohttp.TraceRequestChunkSentParams):
+        trace_config_ctx.metrics.bytes_sent += len(params.chunk)
+
+    async def _on_response_chunk_received(self, session, trace_config_ctx: SimpleNamespace,
+                                          params: aiohttp.TraceResponseChunkReceivedParams):
+        trace = trace_config_ctx.metrics
+        trace.bytes_received += len(params.chunk)
+        key = (trace.method, trace.route)
+        self.bytes_received[key] = self.bytes_received.get(key, 0) + len(params.chunk)
 
+    async def _on_request_end(self, session, trace_config_ctx: SimpleNamespace,
+                              params: aiohttp.TraceRequestEndParams):
+        self._request_done(trace_config_ctx.metrics, str(params.response.status))
 
-class JobState(Enum):
-    CREATED = 1
-    STARTED = 2
-    IN_PROGRESS = 3
-    FINISHED = 4
-    FAILED = 5
-    DRAINED = 6
+    async def _on_request_exception(self, session, trace_config_ctx: SimpleNamespace,
+                                    params: aiohttp.TraceRequestExceptionParams):
+        exception = params.exception
+        status = str(exception.status) if isinstance(exception, aiohttp.ClientResponseError) else 'error'
+        self._request_done(trace_config_ctx.metrics, status)
 
-    def __repr__(self):
-        """To string."""
-        return self._name_
+    def _request_done(self, trace: _RequestTrace, status: str) -> None:
+        # latency until the response headers, the body is streamed by the job afterwards
+        key = (trace.method, trace.route)
+        histogram = self.request_latency.get(key)
+        if histogram is None:
+            histogram = self.request_latency[key] = LatencyHistogram()
+        histogram.record(time.monotonic() - trace.start)
+        status_key = (trace.method, trace.route, status)
+        self.requests[status_key] = self.requests.get(status_key, 0) + 1
+        self.bytes_sent[key] = self.bytes_sent.get(key, 0) + trace.bytes_sent
@@ -0,0 +1,163 @@
+import logging
+from typing import Any, Iterator
+
+from aiohttp import web
+
+from eyepop.jobs import JobState
+from eyepop.metrics import EndpointMetrics, LatencyHistogram
+
+log = logging.getLogger('eyepop.metrics')
+
+CONTENT_TYPE_LATEST = 'text/plain; version=0.0.4; charset=utf-8'
+
+# fixed bucket bounds in seconds, so bucket series stay stable between scrapes
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+Sample = tuple[str, dict[str, str], float]
+Family = tuple[str, str, str, list[Sample]]
+
+
+def _histogram_samples(name: str, labels: dict[str, str], histogram: LatencyHistogram) -> list[Sample]:
+    samples = []
+    buckets = histogram.buckets()
+    i = 0
+    cumulative = 0
+    for bound in LATENCY_BUCKETS:
+        while i < len(buckets) and buckets[i][0] <= bound:
+            cumulative += buckets[i][1]
+            i += 1
+        samples.append((f'{name}_bucket', {**labels, 'le': repr(bound)}, cumulative))
+    samples.append((f'{name}_bucket', {**labels, 'le': '+Inf'}, histogram.count))
+    samples.append((f'{name}_sum', labels, histogram.total_secs))
+    samples.append((f'{name}_count', labels, histogram.count))
+    return samples
+
+
+def metric_families(metrics: EndpointMetrics, prefix: str = 'eyepop') -> Iterator[Family]:
+    """All metrics as (name, type, help, samples); counters are named without `_total`."""
+    jobs = metrics.jobs
+    yield (f'{prefix}_jobs', 'gauge', 'Jobs currently in each state.', [
+        (f'{prefix}_jobs', {'state': state.name.lower()}, n) for state, n in jobs.number_of_jobs_by_state.items()
+    ])
+    yield (f'{prefix}_jobs_created', 'counter', 'Jobs created.', [
+        (f'{prefix}_jobs_created_total', {}, jobs.total_number_of_jobs)
+    ])
+    yield (f'{prefix}_jobs_failed', 'counter', 'Jobs failed.', [
+        (f'{prefix}_jobs_failed_total', {}, jobs.number_of_jobs_reached_state[JobState.FAILED])
+    ])
+    for name, help_text, histogram in (
+            ('job_time_to_start_seconds', 'Time from job creation to start.', jobs.time_to_start),
+            ('job_time_to_first_result_seconds', 'Time from job creation to its first result.',
+             jobs.time_to_first_result),
+            ('job_time_to_drain_seconds', 'Time from job creation until all results were consumed.',
+             jobs.time_to_drain),
+            ('job_semaphore_wait_seconds', 'Time a job waited for a free job slot.', metrics.semaphore_wait),
+    ):
+        yield f'{prefix}_{name}', 'histogram', help_text, _histogram_samples(f'{prefix}_{name}', {}, histogram)
+
+    name = f'{prefix}_request_duration_seconds'
+    yield name, 'histogram', 'HTTP request latency until the response headers, by route.', [
+        sample
+        for (method, route), histogram in sorted(metrics.request_latency.items())
+        for sample in _histogram_samples(name, {'method': method, 'route': route}, histogram)
+    ]
+    yield f'{prefix}_requests', 'counter', 'HTTP requests by route and status.', [
+        (f'{prefix}_requests_total', {'method': method, 'route': route, 'status': status}, n)
+        for (method, route, status), n in sorted(metrics.requests.items())
+    ]
+    for direction, counts in (('sent', metrics.bytes_sent), ('received', metrics.bytes_received)):
+        yield f'{prefix}_request_bytes_{direction}', 'counter', f'HTTP body bytes {direction}, by route.', [
+            (f'{prefix}_request_bytes_{direction}_total', {'method': method, 'route': route}, n)
+            for (method, route), n in sorted(counts.items())
+        ]
+    yield f'{prefix}_request_retries', 'counter', 'HTTP request retries by status.', [
+        (f'{prefix}_request_retries_total', {'status': status}, n)
+        for status, n in sorted(metrics.retries_by_status.items())
+    ]
+    for gauge_name, (help_text, callback) in sorted(metrics.gauges.items()):
+        try:
+            values = list(callback())
+        except Exception as e:
+            log.debug('gauge %s failed: %s', gauge_name, e)
+            continue
+        yield f'{prefix}_{gauge_name}', 'gauge', help_text, [
+            (f'{prefix}_{gauge_name}', labels, value) for labels, value in values
+        ]
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if isinstance(value, int):
+        return str(value)
+    return repr(float(value))
+
+
+def render(metrics: EndpointMetrics, prefix: str = 'eyepop') -> str:
+    """Prometheus text exposition format 0.0.4."""
+    lines = []
+    for name, type_, help_text, samples in metric_families(metrics, prefix):
+        lines.append(f'# HELP {name} {help_text}')
+        lines.append(f'# TYPE {name} {type_}')
+        for sample_name, labels, value in samples:
+            if labels:
+                label_text = ','.join(f'{k}="{_escape(v)}"' for k, v in labels.items())
+                lines.append(f'{sample_name}{{{label_text}}} {_format_value(value)}')
+            else:
+                lines.append(f'{sample_name} {_format_value(value)}')
+    lines.append('')
+    return '\n'.join(lines)
+
+
+class MetricsServer:
+    """Serves `GET /metrics` for one endpoint on the endpoint's event loop."""
+
+    def __init__(self, metrics: EndpointMetrics, host: str = '127.0.0.1', port: int = 9464):
+        self.metrics = metrics
+        self.host = host
+        self.port = port
+        self._runner: web.AppRunner | None = None
+
+    async def start(self) -> None:
+        app = web.Application()
+        app.router.add_get('/metrics', self._handle_metrics)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        if self.port == 0 and self._runner.addresses:
+            self.port = self._runner.addresses[0][1]
+        log.info('serving metrics on http://%s:%d/metrics', self.host, self.port)
+
+    async def stop(self) -> None:
+        runner = self._runner
+        self._runner = None
+        if runner is not None:
+            await runner.cleanup()
+
+    async def _handle_metrics(self, request: web.Request) -> web.Response:
+        return web.Response(body=render(self.metrics).encode(), headers={'Content-Type': CONTENT_TYPE_LATEST})
+
+
+def prometheus_collector(metrics: EndpointMetrics, prefix: str = 'eyepop') -> Any:
+    """A `prometheus_client` collector, for `REGISTRY.register(prometheus_collector(endpoint.metrics))`.
+
+    Requires the optional `prometheus-client` package: `pip install eyepop[prometheus]`.
+    """
+    try:
+        from prometheus_client.metrics_core import Metric
+    except ImportError as e:
+        raise ImportError("prometheus_collector() requires prometheus-client, "
+                          "install it with `pip install eyepop[prometheus]`") from e
+
+    class _Collector:
+        def collect(self):
+            for name, type_, help_text, samples in metric_families(metrics, prefix):
+                family = Metric(name, help_text, type_)
+                for sample_name, labels, value in samples:
+                    family.add_sample(sample_name, labels, value)
+                yield family
+
+    return _Collector()
@@ -1,10 +1,14 @@
 import asyncio
+import gzip
 import importlib.metadata
 import logging
+import os
+import threading
 import time
 import uuid
 from collections import deque
 from types import SimpleNamespace
+from typing import Iterable
 
 import aiohttp
 import flatbuffers
@@ -54,24 +58,6 @@ log = logging.getLogger('eyepop.tracer')
 
 __version__ = importlib.metadata.version('eyepop')
 
-def delete_nth(d: deque, n: int):
-    d.rotate(-n)
-    d.popleft()
-    d.rotate(n)
-
-
-def is_event_started_ended_before(event: SimpleNamespace, threshold: float) -> (bool, bool):
-    if event.start > threshold:
-        return False, False
-    last: float = None
-    if hasattr(event, 'request_end'):
-        last = event.request_end
-    if hasattr(event, 'last_chunk_received') and (last is None or event.last_chunk_received > last):
-        last = event.last_chunk_received
-    if hasattr(event, 'exception') and (last is None or event.exception > last):
-        last = event.exception
-    return True, (last is not None) and (last <= threshold)
-
 
 method_to_fb_enum = {
     'other': 0,
@@ -84,9 +70,150 @@ method_to_fb_enum = {
     'delete': 7,
 }
 
+
+class TraceEvent:
+    """One traced request; times are `time.monotonic()` seconds, `realtime` is the epoch start."""
+
+    __slots__ = ('x_request_id', 'realtime', 'start', 'host', 'method', 'path', 'result', 'status',
+                 'bytes_sent', 'bytes_received', 'request_end', 'last_chunk_received', 'exception')
+
+    def __init__(self, x_request_id: str, realtime: float, start: float, host: str | None, method: int,
+                 path: str):
+        self.x_request_id = x_request_id
+        self.realtime = realtime
+        self.start = start
+        self.host = host
+        self.method = method
+        self.path = path
+        self.result: int | None = None
+        self.status: int | None = None
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.request_end: float | None = None
+        self.last_chunk_received: float | None = None
+        self.exception: float | None = None
+
+    def ended(self) -> float | None:
+        """Time of the last observation of the request, None while no response or error arrived."""
+        last = self.request_end
+        if self.last_chunk_received is not None and (last is None or self.last_chunk_received > last):
+            last = self.last_chunk_received
+        if self.exception is not None and (last is None or self.exception > last):
+            last = self.exception
+        return last
+
+
+class TraceSpool:
+    """Bounded FIFO of encoded records waiting for delivery, kept in memory or as files in `directory`.
+
+    When full, the oldest records are dropped. Records spooled to a directory survive the process
+    and are delivered by the next tracer spooling to the same directory.
+    Methods block on file IO when a directory is used, call them from a worker thread.
+    """
+
+    def __init__(self, max_bytes: int, directory: str | None = None):
+        self.max_bytes = max_bytes
+        self.directory = directory
+        self.size = 0
+        self._lock = threading.Lock()
+        # (number of events, payload or file name, size)
+        self._records: deque[tuple[int, bytes | str, int]] = deque()
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+            for name in sorted(os.listdir(directory)):
+                if not name.endswith('.record'):
+                    continue
+                try:
+                    num_events = int(name[:-len('.record')].split('-')[1])
+                    size = os.path.getsize(os.path.join(directory, name))
+                except (ValueError, IndexError, OSError) as e:
+                    log.warning('skipping unreadable trace record %s in %s: %s', name, directory, e)
+                    continue
+                self._records.append((num_events, name, size))
+                self.size += size
+
+    def __len__(self) -> int:
+        """Number of records waiting for delivery."""
+        return len(self._records)
+
+    def put(self, payload: bytes, num_events: int) -> int:
+        """Append a record; returns the number of events dropped to stay within `max_bytes`."""
+        with self._lock:
+            if self.directory is not None:
+                name = f'{time.time_ns():020d}-{num_events}.record'
+                with open(os.path.join(self.directory, name), 'wb') as f:
+                    f.write(payload)
+                self._records.append((num_events, name, len(payload)))
+            else:
+                self._records.append((num_events, payload, len(payload)))
+            self.size += len(payload)
+            dropped = 0
+            while self.size > self.max_bytes and len(self._records) > 0:
+                dropped += self._remove_first()
+            return dropped
+
+    def peek(self) -> tuple[int, bytes] | None:
+        """The oldest record as (number of events, payload), or None if empty.
+
+        A spooled file that is gone was delivered by another tracer sharing the directory, it is
+        skipped.
+        """
+        with self._lock:
+            while len(self._records) > 0:
+                num_events, payload, size = self._records[0]
+                if not isinstance(payload, str):
+                    return num_events, payload
+                try:
+                    with open(os.path.join(self.directory, payload), 'rb') as f:  # type: ignore[arg-type]
+                        return num_events, f.read()
+                except FileNotFoundError:
+                    self._records.popleft()
+                    self.size -= size
+            return None
+
+    def pop(self) -> None:
+        with self._lock:
+            if len(self._records) > 0:
+                self._remove_first()
+
+    def _remove_first(self) -> int:
+        num_events, payload, size = self._records.popleft()
+        self.size -= size
+        if isinstance(payload, str):
+            try:
+                os.remove(os.path.join(self.directory, payload))  # type: ignore[arg-type]
+            except FileNotFoundError:
+                pass
+        return num_events
+
+
 class RequestTracer():
-    def __init__(self, max_events: int):
-        self.events = deque(maxlen=max_events)
+    """Records every request of an endpoint session and sends them as flatbuffer record to `/events`.
+
+    Events are kept in start order in a ring buffer of `max_events`, the oldest are dropped first.
+    Events are sent once they ended at least `secs_to_mature` ago, so late response chunks are
+    still counted; only the events started before that threshold are visited.
+
+    Records are encoded and gzipped in a worker thread and go through a bounded `TraceSpool`, so
+    a slow or failing `/events` endpoint delays delivery to the next send instead of the caller.
+    Delivery uses one session of the tracer, without the endpoint's trace configs. `counters`
+    report events sent and lost, by cause.
+    """
+
+    def __init__(self, max_events: int, spool: TraceSpool | None = None, compress: bool = True):
+        self.events: deque[TraceEvent] = deque(maxlen=max_events)
+        self.spool = spool if spool is not None else TraceSpool(max_bytes=16 * 1024 * 1024)
+        self.compress = compress
+        self.counters = {
+            'events_sent': 0,
+            'events_dropped_buffer_full': 0,
+            'events_dropped_spool_full': 0,
+            'events_rejected': 0,
+            'send_failures': 0,
+        }
+        self._builder = flatbuffers.Builder(1024)
+        self._send_lock = asyncio.Lock()
+        self._session: aiohttp.ClientSession | None = None
 
     def get_trace_config(self) -> TraceConfig:
         trace_config = aiohttp.TraceConfig()
@@ -97,164 +224,200 @@ class RequestTracer():
         trace_config.on_request_end.append(self.on_request_end)
         return trace_config
 
-    async def send_and_reset(self, url: str, authorization_header: str | None, secs_to_mature: float | None):
+    def take_matured(self, secs_to_mature: float | None) -> list[TraceEvent]:
+        """Remove and return the events that ended at least `secs_to_mature` ago, or all with None."""
+        events = self.events
         if secs_to_mature is None or secs_to_mature <= 0.0:
-            matured_events = self.events
-            self.events = deque(maxlen=self.events.maxlen)
-        else:
-            threshold = time.time() - secs_to_mature
-            matured_events = deque()
-            immature_events = deque()
-            while len(self.events) > 0:
-                event = self.events.pop()
-                started_before, ended_before = is_event_started_ended_before(event, threshold)
-                if ended_before:
-                    matured_events.appendleft(event)
-                elif started_before:
-                    immature_events.appendleft(event)
-                else:
-                    immature_events.appendleft(event)
-                    immature_events.extendleft(self.events)
-                    break
-
-            self.events = immature_events
-
-        if len(matured_events) > 0:
-            log.debug('send_and_reset: %d (version: %s)', len(matured_events), __version__)
-            builder = flatbuffers.Builder()
-            host_to_index = {}
-            hosts = []
-            path_to_index = {}
-            paths = []
-            client_events = []
-            for event in matured_events:
-                if not event.host:
-                    host_index = -1
-                elif event.host in host_to_index.keys():
-                    host_index = host_to_index[event.host]
-                else:
-                    host = builder.CreateString(event.host)
-                    hosts.append(host)
-                    host_index = len(hosts) - 1
-                    host_to_index[event.host] = host_index
-
-                if event.path in path_to_index.keys():
-                    path_index = path_to_index[event.path]
-                else:
-                    path = builder.CreateString(event.path)
-                    paths.append(path)
-                    path_index = len(paths) - 1
-                    path_to_index[event.path] = path_index
-
-                if hasattr(event, 'x_request_id'):
-                    x_request_id = builder.CreateString(event.x_request_id)
-                else:
-                    x_request_id = None
-                EventStart(builder)
-                EventAddMethod(builder, event.method)
-                EventAddEventTimeEpochMs(builder, int(event.realtime * 1000))
-                if x_request_id is not None:
-                    EventAddXRequestId(builder, x_request_id)
+            matured = list(events)
+            events.clear()
+            return matured
+        threshold = time.monotonic() - secs_to_mature
+        matured = []
+        pending = []
+        while len(events) > 0 and events[0].start <= threshold:
+            event = events.popleft()
+            last = event.ended()
+            if last is not None and last <= threshold:
+                matured.append(event)
+            else:
+                pending.append(event)
+        events.extendleft(reversed(pending))
+        return matured
+
+    def encode(self, events: Iterable[TraceEvent]) -> bytes:
+        """Encode events as `eyepop.events.Record` flatbuffer, reusing one builder."""
+        builder = self._builder
+        builder.Clear()
+        host_to_index: dict[str, int] = {}
+        hosts = []
+        path_to_index: dict[str, int] = {}
+        paths = []
+        client_events = []
+        for event in events:
+            if not event.host:
+                host_index = -1
+            else:
+                host_index = host_to_index.get(event.host, -1)
+                if host_index < 0:
+                    hosts.append(builder.CreateString(event.host))
+                    host_index = host_to_index[event.host] = len(hosts) - 1
+
+            path_index = path_to_index.get(event.path, -1)
+            if path_index < 0:
+                paths.append(builder.CreateString(event.path))
+                path_index = path_to_index[event.path] = len(paths) - 1
+
+            x_request_id = builder.CreateString(event.x_request_id)
+            EventStart(builder)
+            EventAddMethod(builder, event.method)
+            EventAddEventTimeEpochMs(builder, int(event.realtime * 1000))
+            EventAddXRequestId(builder, x_request_id)
+            if event.result is not None:
                 EventAddResult(builder, event.result)
-                if hasattr(event, 'status'):
-                    EventAddStatus(builder, event.status)
-
-                EventAddHostIndex(builder, host_index)
-                EventAddPathIndex(builder, path_index)
-
-                if hasattr(event, 'exception'):
-                    EventAddWaitMs(builder, round((event.exception - event.start) * 1000))
-                if hasattr(event, 'request_end'):
-                    EventAddWaitMs(builder, round((event.request_end - event.start) * 1000))
-                    if hasattr(event, 'last_chunk_received'):
-                        EventAddProcessMs(builder, round((event.last_chunk_received - event.request_end) * 1000))
-
-                if hasattr(event, 'bytes_sent'):
-                    EventAddBodyBytesSent(builder, event.bytes_sent)
-
-                if hasattr(event, 'bytes_received'):
-                    EventAddBodyBytesReceived(builder, event.bytes_received)
-
-                client_event = EventEnd(builder)
-                client_events.append(client_event)
-
-            RecordStartHostsVector(builder, len(hosts))
-            for host in reversed(hosts):
-                builder.PrependSOffsetTRelative(host)
-            hosts_vector = builder.EndVector()
-
-            RecordStartPathsVector(builder, len(paths))
-            for path in reversed(paths):
-                builder.PrependSOffsetTRelative(path)
-            paths_vector = builder.EndVector()
-
-            RecordStartEventsVector(builder, len(client_events))
-            for client_event in client_events:
-                builder.PrependSOffsetTRelative(client_event)
-            events_vector = builder.EndVector()
-
-            client_version = builder.CreateString(__version__)
-
-            RecordStart(builder)
-            RecordAddClientType(builder, ClientType.python)
-            RecordAddClientVersion(builder, client_version)
-            RecordAddHosts(builder, hosts_vector)
-            RecordAddPaths(builder, paths_vector)
-            RecordAddEvents(builder, events_vector)
-            record = RecordEnd(builder)
-            builder.Finish(record)
-            buf = builder.Output()
-
-            async with aiohttp.ClientSession() as session:
-                headers = {
-                    'content-type': 'application/x-flatbuffers;schema=eyepop.events.Record'
-                }
-                if authorization_header is not None:
-                    headers['authorization'] = authorization_header
-                async with session.post(url, data=buf, headers=headers):
-                    pass
-
+            if event.status is not None:
+                EventAddStatus(builder, event.status)
+
+            EventAddHostIndex(builder, host_index)
+            EventAddPathIndex(builder, path_index)
+
+            if event.request_end is not None:
+                EventAddWaitMs(builder, round((event.request_end - event.start) * 1000))
+                if event.last_chunk_received is not None:
+                    EventAddProcessMs(builder, round((event.last_chunk_received - event.request_end) * 1000))
+            elif event.exception is not None:
+                EventAddWaitMs(builder, round((event.exception - event.start) * 1000))
+
+            if event.bytes_sent > 0:
+                EventAddBodyBytesSent(builder, event.bytes_sent)
+            if event.bytes_received > 0:
+                EventAddBodyBytesReceived(builder, event.bytes_received)
+
+            client_events.append(EventEnd(builder))
+
+        RecordStartHostsVector(builder, len(hosts))
+        for host in reversed(hosts):
+            builder.PrependSOffsetTRelative(host)
+        hosts_vector = builder.EndVector()
+
+        RecordStartPathsVector(builder, len(paths))
+        for path in reversed(paths):
+            builder.PrependSOffsetTRelative(path)
+        paths_vector = builder.EndVector()
+
+        RecordStartEventsVector(builder, len(client_events))
+        for client_event in reversed(client_events):
+            builder.PrependSOffsetTRelative(client_event)
+        events_vector = builder.EndVector()
+
+        client_version = builder.CreateString(__version__)
+
+        RecordStart(builder)
+        RecordAddClientType(builder, ClientType.python)
+        RecordAddClientVersion(builder, client_version)
+        RecordAddHosts(builder, hosts_vector)
+        RecordAddPaths(builder, paths_vector)
+        RecordAddEvents(builder, events_vector)
+        record = RecordEnd(builder)
+        builder.Finish(record)
+        return bytes(builder.Output())
+
+    async def send_and_reset(self, url: str, authorization_header: str | None, secs_to_mature: float | None,
+                             timeout: float | None = None):
+        """Spool the matured events as one record, then deliver spooled records until one fails."""
+        async with self._send_lock:
+            matured_events = self.take_matured(secs_to_mature)
+            if len(matured_events) > 0:
+                log.debug('send_and_reset: %d (version: %s)', len(matured_events), __version__)
+                dropped = await asyncio.to_thread(self._encode_to_spool, matured_events)
+                self.counters['events_dropped_spool_full'] += dropped
+            await self._deliver(url, authorization_header, timeout)
+
+    async def close(self):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def _encode_to_spool(self, events: list[TraceEvent]) -> int:
+        payload = self.encode(events)
+        if self.compress:
+            payload = gzip.compress(payload, compresslevel=6)
+        return self.spool.put(payload, len(events))
+
+    async def _deliver(self, url: str, authorization_header: str | None, timeout: float | None):
+        headers = {
+            'content-type': 'application/x-flatbuffers;schema=eyepop.events.Record'
+        }
+        if self.compress:
+            headers['content-encoding'] = 'gzip'
+        if authorization_header is not None:
+            headers['authorization'] = authorization_header
+        if self._session is None:
+            self._session = aiohttp.ClientSession()
+        while len(self.spool) > 0:
+            record = await asyncio.to_thread(self.spool.peek)
+            if record is None:
+                break
+            num_events, payload = record
+            try:
+                async with self._session.post(url, data=payload, headers=headers,
+                                              timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+                    status = response.status
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                log.debug('sending trace events failed, %d records spooled: %s', len(self.spool), e)
+                self.counters['send_failures'] += 1
+                break
+            if status == 429 or status >= 500:
+                log.debug('sending trace events failed with %d, %d records spooled', status, len(self.spool))
+                self.counters['send_failures'] += 1
+                break
+            if status >= 400:
+                log.debug('trace events rejected with %d', status)
+                self.counters['events_rejected'] += num_events
+            else:
+                self.counters['events_sent'] += num_events
+            await asyncio.to_thread(self.spool.pop)
 
     async def on_request_start(self, session, trace_config_ctx: SimpleNamespace, params: TraceRequestStartParams):
-        trace_config_ctx.x_request_id = uuid.uuid4().hex
-        params.headers.add('X-Request-Id', trace_config_ctx.x_request_id)
-        trace_config_ctx.realtime = time.time()
-        trace_config_ctx.start = asyncio.get_event_loop().time()
-        if params.url.port is not None:
-            trace_config_ctx.host = f'{params.url.host}:{params.url.port}'
+        x_request_id = uuid.uuid4().hex
+        params.headers.add('X-Request-Id', x_request_id)
+        url = params.url
+        if url.port is not None:
+            host = f'{url.host}:{url.port}'
         else:
-            trace_config_ctx.host = params.url.host
-        trace_config_ctx.method = method_to_fb_enum[params.method.lower()]
-        trace_config_ctx.path = params.url.path
-        self.events.appendleft(trace_config_ctx)
-
-    async def on_request_chunk_sent(self, session, trace_config_ctx: SimpleNamespace, params: TraceRequestChunkSentParams):
-        bytes_sent = 0
-        if hasattr(trace_config_ctx, 'bytes_sent'):
-            bytes_sent = trace_config_ctx.bytes_sent
-        trace_config_ctx.bytes_sent = bytes_sent + len(params.chunk)
-
-    async def on_response_chunk_received(self, session, trace_config_ctx: SimpleNamespace, params: TraceResponseChunkReceivedParams):
-        trace_config_ctx.last_chunk_received = asyncio.get_event_loop().time()
-        bytes_received = 0
-        if hasattr(trace_config_ctx, 'bytes_received'):
-            bytes_received = trace_config_ctx.bytes_received
-        trace_config_ctx.bytes_received = bytes_received + len(params.chunk)
-
-    async def on_request_exception(self, session, trace_config_ctx: SimpleNamespace, params: TraceRequestExceptionParams):
-        trace_config_ctx.exception = asyncio.get_event_loop().time()
+            host = url.host
+        event = TraceEvent(x_request_id, time.time(), time.monotonic(), host,
+                           method_to_fb_enum.get(params.method.lower(), 0), url.path)
+        trace_config_ctx.event = event
+        events = self.events
+        if len(events) == events.maxlen:
+            self.counters['events_dropped_buffer_full'] += 1
+        events.append(event)
+
+    async def on_request_chunk_sent(self, session, trace_config_ctx: SimpleNamespace,
+                                    params: TraceRequestChunkSentParams):
+        trace_config_ctx.event.bytes_sent += len(params.chunk)
+
+    async def on_response_chunk_received(self, session, trace_config_ctx: SimpleNamespace,
+                                         params: TraceResponseChunkReceivedParams):
+        event = trace_config_ctx.event
+        event.last_chunk_received = time.monotonic()
+        event.bytes_received += len(params.chunk)
+
+    async def on_request_exception(self, session, trace_config_ctx: SimpleNamespace,
+                                   params: TraceRequestExceptionParams):
+        event = trace_config_ctx.event
+        event.exception = time.monotonic()
         if isinstance(params.exception, ClientConnectionError):
-            trace_config_ctx.result = Result.connection
+            event.result = Result.connection
         elif isinstance(params.exception, ServerTimeoutError):
-            trace_config_ctx.result = Result.timeout
+            event.result = Result.timeout
         elif isinstance(params.exception, ClientResponseError):
-            trace_config_ctx.result = Result.status
+            event.result = Result.status
         else:
-            trace_config_ctx.result = Result.other
-
+            event.result = Result.other
 
     async def on_request_end(self, session, trace_config_ctx: SimpleNamespace, params: TraceRequestEndParams):
-        trace_config_ctx.request_end = asyncio.get_event_loop().time()
-        trace_config_ctx.status = params.response.status
-        trace_config_ctx.result = Result.success
-
+        event = trace_config_ctx.event
+        event.request_end = time.monotonic()
+        event.status = params.response.status
+        event.result = Result.success
@@ -11,6 +11,11 @@ class Settings(BaseSettings):
     max_retry_time_secs: float = 30.0
     force_refresh_config_secs: float = 3721.0  # 61 * 61
     send_trace_threshold_secs: float = 10.0
+    trace_send_timeout_secs: float = 5.0
+    trace_flush_timeout_secs: float = 2.0
+    trace_spool_dir: str | None = None
+    trace_spool_max_bytes: int = 16 * 1024 * 1024
+    trace_gzip: bool = True
     default_job_queue_length: int = 1024
     default_request_tracer_max_buffer: int = 1204
     ws_initial_reconnect_delay: float = 1.0
@@ -19,6 +24,12 @@ class Settings(BaseSettings):
     coordinate_n_digits: int = 3
     embedding_n_digits: int = 1
     default_data_url: str = "https://dataset-api.eyepop.ai"
+    collect_metrics: bool = False
+    metrics_port: int | None = None
+    metrics_host: str = "127.0.0.1"
+    otel_tracing: bool = False
+    loop_lag_probe_secs: float | None = None
+    loop_lag_threshold_secs: float = 0.1
 
 
 settings = Settings()
@@ -9,6 +9,9 @@ from typing import TYPE_CHECKING
 
 log = logging.getLogger(__name__)
 
+# results moved from the event loop thread to a sync caller per round trip
+SYNC_RESULT_BATCH = 64
+
 if TYPE_CHECKING:
     from eyepop import Endpoint
 
@@ -85,6 +88,10 @@ def submit_coro_thread_save(event_loop, coro):
             coro.close()
 
 
+async def _anext_or_none(iterator: typing.AsyncIterator) -> typing.Any:
+    return await anext(iterator, None)
+
+
 async def _create_queue() -> asyncio.Queue:
     return asyncio.Queue(maxsize=128)
 
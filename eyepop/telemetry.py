@@ -0,0 +1,169 @@
+import importlib.metadata
+import logging
+from types import SimpleNamespace
+from typing import Any
+
+import aiohttp
+
+from eyepop.jobs import JobStateCallback
+from eyepop.metrics import route_of
+
+log = logging.getLogger('eyepop.tracer')
+
+
+def get_tracer() -> Any | None:
+    """The OpenTelemetry tracer of the SDK, or None if `opentelemetry-api` is not installed.
+
+    Spans go to the tracer provider the application configured, `pip install eyepop[otel]`.
+    """
+    try:
+        from opentelemetry import trace
+    except ImportError:
+        log.warning("OpenTelemetry tracing requires opentelemetry-api, "
+                    "install it with `pip install eyepop[otel]`")
+        return None
+    return trace.get_tracer('eyepop', importlib.metadata.version('eyepop'))
+
+
+def add_event(name: str, attributes: dict[str, Any]) -> None:
+    """Add an event to the current span, a no-op outside of a recording span."""
+    from opentelemetry import trace
+
+    trace.get_current_span().add_event(name, attributes)
+
+
+class _JobSpans:
+    __slots__ = ('job', 'execute', 'token')
+
+    def __init__(self, job: Any):
+        self.job = job
+        self.execute: Any = None
+        self.token: Any = None
+
+
+class JobTracer(JobStateCallback):
+    """Job state callback that traces each job as a span from creation until its results are drained.
+
+    `Job.execute` runs in a child span which is the current span of the job's task, so the HTTP
+    requests of the job, including each retry attempt, become its children. Other state callbacks,
+    e.g. the metric collector, are chained through `inner`.
+    """
+
+    def __init__(self, tracer: Any, inner: JobStateCallback | None = None):
+        self._tracer = tracer
+        self._inner = inner if inner is not None else JobStateCallback()
+        self._spans: dict[int, _JobSpans] = {}
+
+    def created(self, job):
+        self._inner.created(job)
+        span = self._tracer.start_span(type(job).__name__, attributes={'eyepop.job.type': type(job).__name__})
+        self._spans[id(job)] = _JobSpans(span)
+
+    def started(self, job):
+        self._inner.started(job)
+        spans = self._spans.get(id(job))
+        if spans is None:
+            return
+        from opentelemetry import context, trace
+
+        spans.job.add_event('started')
+        spans.execute = self._tracer.start_span('execute', context=trace.set_span_in_context(spans.job))
+        spans.token = context.attach(trace.set_span_in_context(spans.execute))
+
+    def first_result(self, job):
+        self._inner.first_result(job)
+        spans = self._spans.get(id(job))
+        if spans is not None:
+            spans.job.add_event('first_result')
+
+    def failed(self, job):
+        self._inner.failed(job)
+        spans = self._spans.get(id(job))
+        if spans is not None:
+            from opentelemetry.trace import StatusCode
+
+            spans.job.set_status(StatusCode.ERROR)
+            if spans.execute is not None:
+                spans.execute.set_status(StatusCode.ERROR)
+
+    def finished(self, job):
+        self._inner.finished(job)
+        spans = self._spans.get(id(job))
+        if spans is not None:
+            self._end_execute(spans)
+
+    def drained(self, job):
+        self._inner.drained(job)
+        spans = self._spans.pop(id(job), None)
+        if spans is not None:
+            spans.job.add_event('drained')
+            self._end_execute(spans)
+            spans.job.end()
+
+    def finalized(self, job):
+        self._inner.finalized(job)
+        spans = self._spans.pop(id(job), None)
+        if spans is not None:
+            # never drained, e.g. abandoned by its consumer
+            if spans.execute is not None:
+                spans.execute.end()
+            spans.job.end()
+
+    @staticmethod
+    def _end_execute(spans: _JobSpans) -> None:
+        if spans.execute is None or spans.token is None:
+            return
+        from opentelemetry import context
+
+        # finished() runs in the same task as started(), where the context was attached
+        context.detach(spans.token)
+        spans.token = None
+        spans.execute.end()
+
+
+def get_trace_config(tracer: Any) -> aiohttp.TraceConfig:
+    """An aiohttp trace config with a client span per request, propagated as W3C `traceparent` header."""
+    from opentelemetry import propagate, trace
+    from opentelemetry.trace import SpanKind, StatusCode
+
+    async def on_request_start(session, trace_config_ctx: SimpleNamespace, params: aiohttp.TraceRequestStartParams):
+        route = route_of(params.url.path)
+        attributes: dict[str, Any] = {
+            'http.request.method': params.method.upper(),
+            'http.route': route,
+            'server.address': params.url.host or '',
+        }
+        if params.url.port is not None:
+            attributes['server.port'] = params.url.port
+        span = tracer.start_span(f'{params.method.upper()} {route}', kind=SpanKind.CLIENT, attributes=attributes)
+        propagate.inject(params.headers, context=trace.set_span_in_context(span))
+        trace_config_ctx.otel_span = span
+
+    async def on_request_end(session, trace_config_ctx: SimpleNamespace, params: aiohttp.TraceRequestEndParams):
+        span = trace_config_ctx.otel_span
+        trace_config_ctx.otel_span = None
+        if span is None:
+            return
+        status = params.response.status
+        span.set_attribute('http.response.status_code', status)
+        if status >= 400:
+            span.set_status(StatusCode.ERROR)
+        span.end()
+
+    async def on_request_exception(session, trace_config_ctx: SimpleNamespace,
+                                   params: aiohttp.TraceRequestExceptionParams):
+        span = trace_config_ctx.otel_span
+        trace_config_ctx.otel_span = None
+        if span is None:
+            return
+        if isinstance(params.exception, aiohttp.ClientResponseError):
+            span.set_attribute('http.response.status_code', params.exception.status)
+        span.record_exception(params.exception)
+        span.set_status(StatusCode.ERROR, type(params.exception).__name__)
+        span.end()
+
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_request_start.append(on_request_start)
+    trace_config.on_request_end.append(on_request_end)
+    trace_config.on_request_exception.append(on_request_exception)
+    return trace_config
@@ -0,0 +1,3 @@
+from .server import MockServer, MockServerThread, PredictionGenerator, RouteBehavior, simple_prediction
+
+__all__ = ["MockServer", "MockServerThread", "PredictionGenerator", "RouteBehavior", "simple_prediction"]
@@ -0,0 +1,40 @@
+import argparse
+import asyncio
+import logging
+
+from eyepop.testing.server import MockServer, RouteBehavior
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run a local mock EyePop worker, compute and Data API server.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds before each response.")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Uniform +/- seconds added to the latency.")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Probability of a 503 per request.")
+    parser.add_argument("--frames-per-video", type=int, default=30)
+    parser.add_argument("--frame-interval", type=float, default=0.0, help="Seconds between video frames.")
+    parser.add_argument("--seed", type=int, default=None)
+    return parser.parse_args()
+
+
+async def serve(args: argparse.Namespace) -> None:
+    server = MockServer(
+        host=args.host,
+        port=args.port,
+        default=RouteBehavior(latency_secs=args.latency, jitter_secs=args.jitter, error_rate=args.error_rate),
+        frames_per_video=args.frames_per_video,
+        frame_interval_secs=args.frame_interval,
+        seed=args.seed,
+    )
+    async with server:
+        print(f"serving on {server.url}, use it as eyepop_url; Ctrl-C to stop")
+        await asyncio.Event().wait()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    try:
+        asyncio.run(serve(parse_args()))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,450 @@
+import asyncio
+import json
+import logging
+import random
+import threading
+import time
+import uuid
+from typing import Any, Callable
+
+from aiohttp import web
+
+log = logging.getLogger('eyepop.testing')
+
+PredictionGenerator = Callable[[str, int, float], dict[str, Any]]
+
+_VIDEO_SUFFIXES = ('.mp4', '.mov', '.webm', '.mkv', '.avi', '.m4v')
+
+
+def simple_prediction(source_id: str, frame: int, seconds: float) -> dict[str, Any]:
+    """One person per frame, moving right, in a 1280x720 source."""
+    return {
+        'source_id': source_id,
+        'source_width': 1280,
+        'source_height': 720,
+        'seconds': seconds,
+        'timestamp': int(seconds * 1_000_000_000),
+        'system_timestamp': time.time_ns(),
+        'objects': [{
+            'id': 1,
+            'classLabel': 'person',
+            'category': 'person',
+            'confidence': 0.9,
+            'x': float(frame % 1000),
+            'y': 100.0,
+            'width': 200.0,
+            'height': 400.0,
+        }],
+    }
+
+
+class RouteBehavior:
+    """Latency and failures of one mock route.
+
+    Each request waits `latency_secs` plus a uniform jitter of up to `jitter_secs` before its
+    response, and fails with `error_status` with probability `error_rate`.
+    """
+
+    def __init__(self, latency_secs: float = 0.0, jitter_secs: float = 0.0, error_rate: float = 0.0,
+                 error_status: int = 503):
+        self.latency_secs = latency_secs
+        self.jitter_secs = jitter_secs
+        self.error_rate = error_rate
+        self.error_status = error_status
+
+
+class MockServer:
+    """Local aiohttp stand-in for the EyePop worker, compute and Data APIs, on real sockets.
+
+    Serves the routes the SDK uses: authentication and worker config, pipeline creation and
+    `/pipelines/{id}/source` (sync uploads, URL/asset loads and the full duplex `prepareSource`
+    flow) with streamed JSONL predictions, compute `/v1/sessions` and `/health`, Data API
+    `/configs`, paged `/assets`, Arrow `/exports/assets` and `/imports/assets`, and VLM
+    `/api/v1/infer` with accepted (202) requests for slow inference. The websocket change events
+    of the Data API are not served, connect the Data API endpoint with `disable_ws=True`.
+
+    Route names for `routes` are: `auth`, `config`, `pipeline`, `source`, `prepare_source`,
+    `sessions`, `health`, `assets`, `export_assets`, `import_assets`, `infer` and `events`. Every
+    source yields one prediction per frame from `prediction_generator`; videos have
+    `frames_per_video` frames `frame_interval_secs` apart, everything else has one. Inference
+    requests are held up to their `timeout` query, or `infer_wait_secs` if shorter, before they
+    are answered as accepted.
+    """
+
+    def __init__(
+            self,
+            host: str = '127.0.0.1',
+            port: int = 0,
+            default: RouteBehavior | None = None,
+            routes: dict[str, RouteBehavior] | None = None,
+            prediction_generator: PredictionGenerator = simple_prediction,
+            frames_per_video: int = 30,
+            frame_interval_secs: float = 0.0,
+            num_assets: int = 100,
+            infer_wait_secs: float | None = None,
+            seed: int | None = None,
+    ):
+        self.host = host
+        self.port = port
+        self.default = default if default is not None else RouteBehavior()
+        self.routes = routes if routes is not None else {}
+        self.prediction_generator = prediction_generator
+        self.frames_per_video = frames_per_video
+        self.frame_interval_secs = frame_interval_secs
+        self.num_assets = num_assets
+        self.infer_wait_secs = infer_wait_secs
+        self.requests: dict[str, int] = {}
+        self.errors: dict[str, int] = {}
+        self.bytes_received = 0
+        self.pipelines: set[str] = set()
+        self._random = random.Random(seed)
+        self._prepared_sources: dict[str, asyncio.Queue] = {}
+        self._infer_results: dict[str, asyncio.Task] = {}
+        self._exports: dict[tuple[str, int], bytes] = {}
+        self._runner: web.AppRunner | None = None
+
+    @property
+    def url(self) -> str:
+        return f'http://{self.host}:{self.port}'
+
+    async def __aenter__(self) -> "MockServer":
+        """Start the server."""
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Stop the server."""
+        await self.stop()
+
+    async def start(self) -> None:
+        app = web.Application(client_max_size=0)
+        router = app.router
+        router.add_post('/authentication/token', self._auth_token)
+        router.add_post('/v1/auth/authenticate', self._auth_token)
+        router.add_get('/workers/config', self._worker_config)
+        router.add_get('/pops/{pop_id}/config', self._worker_config)
+        router.add_post('/pipelines', self._create_pipeline)
+        router.add_get('/pipelines/{pipeline_id}', self._get_pipeline)
+        router.add_delete('/pipelines/{pipeline_id}', self._delete_pipeline)
+        router.add_patch('/pipelines/{pipeline_id}/pop', self._set_pop)
+        router.add_patch('/pipelines/{pipeline_id}/source', self._load_source)
+        router.add_post('/pipelines/{pipeline_id}/source', self._upload_source)
+        router.add_post('/pipelines/{pipeline_id}/prepareSource', self._prepare_source)
+        router.add_get('/v1/sessions', self._list_sessions)
+        router.add_post('/v1/sessions', self._create_session)
+        router.add_get('/health', self._health)
+        router.add_get('/configs', self._data_config)
+        router.add_get('/v1/configs', self._data_config)
+        router.add_get('/assets', self._list_assets)
+        router.add_get('/exports/assets', self._export_assets)
+        router.add_post('/imports/assets', self._import_assets)
+        router.add_post('/api/v1/infer', self._infer)
+        router.add_get('/api/v1/infer/{request_id}', self._infer_status)
+        router.add_post('/events', self._events)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        if self.port == 0 and self._runner.addresses:
+            self.port = self._runner.addresses[0][1]
+        log.info('mock EyePop server on %s', self.url)
+
+    async def stop(self) -> None:
+        for task in self._infer_results.values():
+            task.cancel()
+        self._infer_results.clear()
+        runner = self._runner
+        self._runner = None
+        if runner is not None:
+            await runner.cleanup()
+
+    async def _behave(self, route: str) -> web.Response | None:
+        """Count the request, wait for its latency and return an error response if it fails."""
+        self.requests[route] = self.requests.get(route, 0) + 1
+        behavior = self.routes.get(route, self.default)
+        delay = behavior.latency_secs
+        if behavior.jitter_secs > 0.0:
+            delay += self._random.uniform(-behavior.jitter_secs, behavior.jitter_secs)
+        if delay > 0.0:
+            await asyncio.sleep(delay)
+        if behavior.error_rate > 0.0 and self._random.random() < behavior.error_rate:
+            self.errors[route] = self.errors.get(route, 0) + 1
+            return web.Response(status=behavior.error_status, text=f'mock {route} failure')
+        return None
+
+    def _session_body(self) -> dict[str, Any]:
+        return {
+            'session_uuid': 'mock-session',
+            'session_endpoint': self.url,
+            'access_token': 'mock-access-token',
+            'access_token_expires_in': 3600,
+            'pipelines': [{'pipeline_id': pipeline_id} for pipeline_id in sorted(self.pipelines)],
+            'session_status': 'running',
+            'session_active': True,
+        }
+
+    def _new_pipeline(self) -> str:
+        pipeline_id = uuid.uuid4().hex
+        self.pipelines.add(pipeline_id)
+        return pipeline_id
+
+    def _check_pipeline(self, request: web.Request) -> None:
+        if request.match_info['pipeline_id'] not in self.pipelines:
+            raise web.HTTPNotFound(text='unknown pipeline')
+
+    async def _stream_predictions(self, request: web.Request, source_id: str, num_frames: int,
+                                  events: list[dict[str, Any]] | None = None) -> web.StreamResponse:
+        response = web.StreamResponse(headers={'Content-Type': 'application/jsonl'})
+        await response.prepare(request)
+        for event in events or ():
+            await response.write(json.dumps(event).encode() + b'\n')
+        await self._write_predictions(response, source_id, num_frames)
+        await response.write_eof()
+        return response
+
+    async def _write_predictions(self, response: web.StreamResponse, source_id: str, num_frames: int) -> None:
+        for frame in range(num_frames):
+            if frame > 0 and self.frame_interval_secs > 0.0:
+                await asyncio.sleep(self.frame_interval_secs)
+            prediction = self.prediction_generator(source_id, frame, frame * self.frame_interval_secs)
+            # awaits the socket drain, so a slow reader holds back the stream
+            await response.write(json.dumps(prediction).encode() + b'\n')
+
+    def _num_frames(self, is_video: bool) -> int:
+        return self.frames_per_video if is_video else 1
+
+    async def _read_body(self, request: web.Request) -> bool:
+        """Consume an upload body, returns whether it contained a video."""
+        is_video = request.content_type.startswith('video/')
+        if request.content_type.startswith('multipart/'):
+            reader = await request.multipart()
+            while (part := await reader.next()) is not None:
+                if part.headers.get('Content-Type', '').startswith('video/'):
+                    is_video = True
+                while chunk := await part.read_chunk():  # type: ignore[union-attr]
+                    self.bytes_received += len(chunk)
+        else:
+            async for chunk in request.content.iter_any():
+                self.bytes_received += len(chunk)
+        return is_video
+
+    async def _auth_token(self, request: web.Request) -> web.StreamResponse:
+        if (error := await self._behave('auth')) is not None:
+            return error
+        return web.json_response({'expires_in': 3600, 'token_type': 'Bearer', 'access_token': 'mock-access-token'})
+
+    async def _worker_config(self, request: web.Request) -> web.StreamResponse:
+        if (error := await self._behave('config')) is not None:
+            return error
+        if 'pop_id' not in request.match_info:
+            # transient pops create their pipeline
+            return web.json_response({'base_url': self.url})
+        return web.json_response({'base_url': self.url, 'status': 'active_dev', 'pipeline_id': self._new_pipeline()})
+
+    async def _create_pipeline(self, request: web.Request) -> web.StreamResponse:
+        if (error := await self._behave('pipeline')) is not None:
+            return error
+        await request.read()
+        return web.json_response({'id': self._new_pipeline()})
+
+    async def _get_pipeline(self, request: web.Request) -> web.StreamResponse:
+        self._check_pipeline(request)
+        if (error := await self._behave('pipeline')) is not None:
+            return error
+        return web.json_response({'id': request.match_info['pipeline_id'], 'pop': None})
+
+    async def _delete_pipeline(self, request: web.Request) -> web.StreamResponse:
+        self.pipelines.discard(request.match_info['pipeline_id'])
+        return web.Response(status=204)
+
+    async def _set_pop(self, request: web.Request) -> web.StreamResponse:
+        self._check_pipeline(request)
+        if (error := await self._behave('pipeline')) is not None:
+            return error
+        return web.json_response(await request.json())
+
+    async def _load_source(self, request: web.Request) -> web.StreamResponse:
+        self._check_pipeline(request)
+        body = await request.json()
+        if request.query.get('mode') == 'preempt':
+            return web.Response(status=204)
+        if (error := await self._behave('source')) is not None:
+            return error
+        source_type = body.get('sourceType')
+        is_video = source_type == 'URL' and body.get('url', '').lower().endswith(_VIDEO_SUFFIXES)
+        return await self._stream_predictions(request, uuid.uuid4().hex, self._num_frames(is_video))
+
+    async def _upload_source(self, request: web.Request) -> web.StreamResponse:
+        self._check_pipeline(request)
+        source_id = request.query.get('sourceId')
+        if source_id is not None:
+            # second half of the full duplex flow, predictions go to the prepareSource response
+            prepared = self._prepared_sources.get(source_id)
+            if prepared is None:
+                raise web.HTTPNotFound(text='unknown source')
+            is_video = await self._read_body(request)
+            await prepared.put(self._num_frames(is_video))
+            return web.Response(status=204)
+        if (error := await self._behave('source')) is not None:
+            await request.read()
+            return error
+        is_video = await self._read_body(request)
+        return await self._stream_predictions(request, uuid.uuid4().hex, self._num_frames(is_video))
+
+    async def _prepare_source(self, request: web.Request) -> web.StreamResponse:
+        self._check_pipeline(request)
+        if (error := await self._behave('prepare_source')) is not None:
+            return error
+        source_id = uuid.uuid4().hex
+        prepared: asyncio.Queue = asyncio.Queue(maxsize=1)
+        self._prepared_sources[source_id] = prepared
+        response = web.StreamResponse(headers={'Content-Type': 'application/jsonl'})
+        await response.prepare(request)
+        try:
+            await response.write(json.dumps({'event': {'type': 'prepared', 'source_id': source_id}}).encode() + b'\n')
+            num_frames = await prepared.get()
+            await self._write_predictions(response, source_id, num_frames)
+        finally:
+            del self._prepared_sources[source_id]
+        await response.write_eof()
+        return response
+
+    async def _list_sessions(self, request: web.Request) -> web.StreamResponse:
+        if (error := await self._behave('sessions')) is not None:
+            return error
+        if not self.pipelines:
+            return web.json_response([])
+        return web.json_response([self._session_body()])
+
+    async def _create_session(self, request: web.Request) -> web.StreamResponse:
+        if (error := await self._behave('sessions')) is not None:
+            return error
+        if request.can_read_body:
+            await request.read()
+        if not self.pipelines:
+            self._new_pipeline()
+        return web.json_response(self._session_body())
+
+    async def _health(self, request: web.Request) -> web.StreamResponse:
+        if (error := await self._behave('health')) is not None:
+            return error
+        return web.json_response(self._session_body())
+
+    async def _data_config(self, request: web.Request) -> web.StreamResponse:
+        if (error := await self._behave('config')) is not None:
+            return error
+        return web.json_response({'dataset_api_url': self.url, 'vlm_api_url': self.url})
+
+    def _assets(self, dataset_uuid: str) -> list[dict[str, Any]]:
+        return [{
+            'uuid': f'{dataset_uuid}-asset-{i}',
+            'mime_type': 'image/jpeg',
+            'status': 'accepted',
+            'original_image_width': 1280,
+            'original_image_height': 720,
+        } for i in range(self.num_assets)]
+
+    async def _list_assets(self, request: web.Request) -> web.StreamResponse:
+        if (error := await self._behave('assets')) is not None:
+            return error
+        assets = self._assets(request.query.get('dataset_uuid', 'dataset'))
+        offset = int(request.query.get('offset', 0))
+        limit = int(request.query.get('limit', len(assets)))
+        return web.json_response(assets[offset:offset + limit])
+
+    async def _export_assets(self, request: web.Request) -> web.StreamResponse:
+        if (error := await self._behave('export_assets')) is not None:
+            return error
+        from eyepop.data.arrow.schema import MIME_TYPE_APACHE_ARROW_FILE_VERSIONED
+
+        dataset_uuid = request.query.get('dataset_uuid', 'dataset')
+        key = (dataset_uuid, self.num_assets)
+        body = self._exports.get(key)
+        if body is None:
+            # built once per dataset, so repeated exports measure the client rather than the mock
+            body = self._exports[key] = self._export_body(dataset_uuid)
+        return web.Response(body=body, headers={'Content-Type': MIME_TYPE_APACHE_ARROW_FILE_VERSIONED})
+
+    def _export_body(self, dataset_uuid: str) -> bytes:
+        import pyarrow as pa
+
+        from eyepop.data.arrow.eyepop.assets import table_from_eyepop_assets
+        from eyepop.data.data_types import Asset
+
+        table = table_from_eyepop_assets([Asset.model_validate(asset) for asset in self._assets(dataset_uuid)])
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+        return sink.getvalue().to_pybytes()
+
+    async def _import_assets(self, request: web.Request) -> web.StreamResponse:
+        if (error := await self._behave('import_assets')) is not None:
+            await request.read()
+            return error
+        await self._read_body(request)
+        return web.Response(status=204)
+
+    async def _run_inference(self, infer_request: dict[str, Any]) -> dict[str, Any]:
+        error = await self._behave('infer')
+        if error is not None:
+            raise web.HTTPServiceUnavailable(text='mock infer failure')
+        source_id = infer_request.get('url') or infer_request.get('asset_uuid') or 'source'
+        return {
+            'raw_output': 'mock',
+            'predictions': [self.prediction_generator(source_id, 0, 0.0)],
+        }
+
+    async def _infer(self, request: web.Request) -> web.StreamResponse:
+        form = await request.post()
+        infer_request = json.loads(form.get('infer_request', '{}'))  # type: ignore[arg-type]
+        request_id = uuid.uuid4().hex
+        self._infer_results[request_id] = asyncio.create_task(self._run_inference(infer_request))
+        return await self._infer_status(request, request_id)
+
+    async def _infer_status(self, request: web.Request, request_id: str | None = None) -> web.StreamResponse:
+        if request_id is None:
+            request_id = request.match_info['request_id']
+            self.requests['infer_status'] = self.requests.get('infer_status', 0) + 1
+        task = self._infer_results.get(request_id)
+        if task is None:
+            raise web.HTTPNotFound(text='unknown request')
+        timeout = float(request.query.get('timeout', 0))
+        if self.infer_wait_secs is not None:
+            timeout = min(timeout, self.infer_wait_secs)
+        done, _ = await asyncio.wait({task}, timeout=timeout)
+        if not done:
+            return web.json_response({'request_id': request_id}, status=202)
+        del self._infer_results[request_id]
+        return web.json_response(task.result())
+
+    async def _events(self, request: web.Request) -> web.StreamResponse:
+        if (error := await self._behave('events')) is not None:
+            return error
+        self.bytes_received += len(await request.read())
+        return web.Response(status=204)
+
+
+class MockServerThread:
+    """Runs a `MockServer` on its own event loop thread.
+
+    For sync clients or for load generators that should not share their event loop with the
+    server. Use as context manager, it returns the started server.
+    """
+
+    def __init__(self, server: MockServer):
+        self.server = server
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name='eyepop-mock-server', daemon=True)
+
+    def __enter__(self) -> MockServer:
+        """Start the loop thread and the server on it."""
+        self._thread.start()
+        asyncio.run_coroutine_threadsafe(self.server.start(), self._loop).result()
+        return self.server
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Stop the server and its loop thread."""
+        asyncio.run_coroutine_threadsafe(self.server.stop(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
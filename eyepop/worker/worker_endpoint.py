@@ -16,10 +16,12 @@ from eyepop.exceptions import (
     PopNotReachableException,
     PopNotStartedException,
 )
+from eyepop.jobs import current_timings
 from eyepop.settings import settings
 from eyepop.worker.load_balancer import EndpointLoadBalancer
 from eyepop.worker.worker_client_session import WorkerClientSession
 from eyepop.worker.worker_jobs import (
+    JobTemplate,
     WorkerJob,
     _LoadFromAssetUuidJob,
     _LoadFromJob,
@@ -28,7 +30,14 @@ from eyepop.worker.worker_jobs import (
     _UploadStreamGroupJob,
     _UploadStreamJob,
 )
-from eyepop.worker.worker_types import ComponentParams, MotionDetectConfig, Pop, VideoMode
+from eyepop.worker.worker_types import (
+    DEFAULT_PREDICTION_VERSION,
+    ComponentParams,
+    MotionDetectConfig,
+    Pop,
+    PredictionVersion,
+    VideoMode,
+)
 
 log = logging.getLogger('eyepop')
 log_requests = logging.getLogger('eyepop.requests')
@@ -106,6 +115,21 @@ class WorkerEndpoint(Endpoint, WorkerClientSession):
         self.last_fetch_config_error_time = None
 
         self.add_retry_handler(404, self._retry_404)
+        if self.metrics is not None:
+            self.metrics.add_gauge('load_balancer_entry_healthy',
+                                   'Worker endpoints eligible for requests (1) or backing off after errors (0).',
+                                   self._load_balancer_health)
+
+    def _load_balancer_health(self) -> list[tuple[dict[str, str], float]]:
+        load_balancer = getattr(self, 'load_balancer', None)
+        if load_balancer is None:
+            return []
+        error_threshold = time.time() - (settings.max_retry_time_secs + 1)
+        return [
+            ({'base_url': entry.base_url, 'pipeline_id': entry.pipeline_id},
+             1.0 if entry.last_error_time is None or entry.last_error_time < error_threshold else 0.0)
+            for entry in load_balancer.entries
+        ]
 
     def _is_compute_transient(self) -> bool:
         return self.compute_ctx is not None and self.permanent_session_uuid is None
@@ -156,6 +180,11 @@ class WorkerEndpoint(Endpoint, WorkerClientSession):
         if self.worker_config is not None:
             return
 
+        with self._start_span('eyepop.reconnect'):
+            await self._fetch_worker_config()
+
+    async def _fetch_worker_config(self):
+        assert self.client_session is not None
         if self.last_fetch_config_error_time is not None and self.last_fetch_config_error_time > time.time() - settings.min_config_reconnect_secs:
             if self.last_fetch_config_error is not None:
                 raise self.last_fetch_config_error
@@ -344,6 +373,30 @@ class WorkerEndpoint(Endpoint, WorkerClientSession):
             await self._ensure_pipeline_started()
         return f'{base_url}/pipelines/{self.worker_config["pipeline_id"]}'
 
+    def job_template(
+            self,
+            params: list[ComponentParams] | None = None,
+            motion_detect: MotionDetectConfig | None = None,
+            roi: Area | None = None,
+            fps: str | None = None,
+            media_cache_seconds: int | None = None,
+            version: PredictionVersion = DEFAULT_PREDICTION_VERSION,
+    ) -> JobTemplate:
+        """Serializes params, motion_detect, roi, fps and the prediction version once for many jobs.
+
+        Pass the template as `template=` to `upload`, `load_from`, `load_asset` and the group
+        variants instead of the individual arguments; each job then only serializes its own
+        location, asset uuid or media.
+        """
+        return JobTemplate(
+            component_params=params,
+            motion_detect=motion_detect,
+            roi=roi,
+            fps=fps,
+            media_cache_seconds=media_cache_seconds,
+            version=version,
+        )
+
     async def upload(
             self,
             location: str,
@@ -353,7 +406,8 @@ class WorkerEndpoint(Endpoint, WorkerClientSession):
             roi: Area | None = None,
             fps: str | None = None,
             media_cache_seconds: int | None = None,
-            on_ready: Callable[[WorkerJob], None] | None = None
+            on_ready: Callable[[WorkerJob], None] | None = None,
+            template: JobTemplate | None = None,
     ) -> WorkerJob:
         job = _UploadFileJob(
             location=location,
@@ -364,7 +418,8 @@ class WorkerEndpoint(Endpoint, WorkerClientSession):
             fps=fps,
             media_cache_seconds=media_cache_seconds,
             session=self, on_ready=on_ready,
-            callback=self.metrics_collector
+            callback=self.job_callback,
+            template=template,
         )
         await  self._task_start(job.execute())
         return job
@@ -381,7 +436,8 @@ class WorkerEndpoint(Endpoint, WorkerClientSession):
             roi: Area | None = None,
             fps: str | None = None,
             media_cache_seconds: int | None = None,
-            on_ready: Callable[[WorkerJob], None] | None = None
+            on_ready: Callable[[WorkerJob], None] | None = None,
+            template: JobTemplate | None = None,
     ) -> WorkerJob:
         job = _UploadStreamJob(
             stream=stream,
@@ -396,7 +452,8 @@ class WorkerEndpoint(Endpoint, WorkerClientSession):
             media_cache_seconds=media_cache_seconds,
             session=self,
             on_ready=on_ready,
-            callback=self.metrics_collector
+            callback=self.job_callback,
+            template=template,
         )
         await self._task_start(job.execute())
         return job
@@ -408,7 +465,8 @@ class WorkerEndpoint(Endpoint, WorkerClientSession):
             params: list[ComponentParams] | None = None,
             roi: Area | None = None,
             media_cache_seconds: int | None = None,
-            on_ready: Callable[[WorkerJob], None] | None = None
+            on_ready: Callable[[WorkerJob], None] | None = None,
+            template: JobTemplate | None = None,
     ) -> WorkerJob:
         """Uploads multiple in-memory streams as a single image group (one inference unit).
 
@@ -426,7 +484,8 @@ class WorkerEndpoint(Endpoint, WorkerClientSession):
             media_cache_seconds=media_cache_seconds,
             session=self,
             on_ready=on_ready,
-            callback=self.metrics_collector
+            callback=self.job_callback,
+            template=template,
         )
         await self._task_start(job.execute())
         return job
@@ -437,7 +496,8 @@ class WorkerEndpoint(Endpoint, WorkerClientSession):
             params: list[ComponentParams] | None = None,
             roi: Area | None = None,
             media_cache_seconds: int | None = None,
-            on_ready: Callable[[WorkerJob], None] | None = None
+            on_ready: Callable[[WorkerJob], None] | None = None,
+            template: JobTemplate | None = None,
     ) -> WorkerJob:
         """Uploads multiple local images as a single image group (one inference unit).
 
@@ -452,7 +512,8 @@ class WorkerEndpoint(Endpoint, WorkerClientSession):
             roi=roi,
             media_cache_seconds=media_cache_seconds,
             session=self, on_ready=on_ready,
-            callback=self.metrics_collector
+            callback=self.job_callback,
+            template=template,
         )
         await self._task_start(job.execute())
         return job
@@ -465,7 +526,8 @@ class WorkerEndpoint(Endpoint, WorkerClientSession):
             roi: Area | None = None,
             fps: str | None = None,
             media_cache_seconds: int | None = None,
-            on_ready: Callable[[WorkerJob], None] | None = None
+            on_ready: Callable[[WorkerJob], None] | None = None,
+            template: JobTemplate | None = None,
     ) -> WorkerJob:
         job = _LoadFromJob(
             locations=[location],
@@ -476,7 +538,8 @@ class WorkerEndpoint(Endpoint, WorkerClientSession):
             media_cache_seconds=media_cache_seconds,
             session=self,
             on_ready=on_ready,
-            callback=self.metrics_collector
+            callback=self.job_callback,
+            template=template,
         )
         await self._task_start(job.execute())
         return job
@@ -487,7 +550,8 @@ class WorkerEndpoint(Endpoint, WorkerClientSession):
             params: list[ComponentParams] | None = None,
             roi: Area | None = None,
             media_cache_seconds: int | None = None,
-            on_ready: Callable[[WorkerJob], None] | None = None
+            on_ready: Callable[[WorkerJob], None] | None = None,
+            template: JobTemplate | None = None,
     ) -> WorkerJob:
         """Loads multiple server-fetched URLs as a single image group (one inference unit).
 
@@ -505,7 +569,8 @@ class WorkerEndpoint(Endpoint, WorkerClientSession):
             media_cache_seconds=media_cache_seconds,
             session=self,
             on_ready=on_ready,
-            callback=self.metrics_collector
+            callback=self.job_callback,
+            template=template,
         )
         await self._task_start(job.execute())
         return job
@@ -518,7 +583,8 @@ class WorkerEndpoint(Endpoint, WorkerClientSession):
             roi: Area | None = None,
             fps: str | None = None,
             media_cache_seconds: int | None = None,
-            on_ready: Callable[[WorkerJob], None] | None = None
+            on_ready: Callable[[WorkerJob], None] | None = None,
+            template: JobTemplate | None = None,
     ) -> WorkerJob:
         job = _LoadFromAssetUuidJob(
             asset_uuid=asset_uuid,
@@ -529,7 +595,8 @@ class WorkerEndpoint(Endpoint, WorkerClientSession):
             media_cache_seconds=media_cache_seconds,
             session=self,
             on_ready=on_ready,
-            callback=self.metrics_collector
+            callback=self.job_callback,
+            template=template,
         )
         await self._task_start(job.execute())
         return job
@@ -665,6 +732,7 @@ class WorkerEndpoint(Endpoint, WorkerClientSession):
         if self.last_fetch_config_success_time is not None and self.last_fetch_config_success_time < time.time() - settings.force_refresh_config_secs:
             self.worker_config = None
 
+        timings = current_timings()
         failed_attempts = 0
         retried_re_config = False
         start_time = time.time()
@@ -698,6 +766,8 @@ class WorkerEndpoint(Endpoint, WorkerClientSession):
             if content_type is not None:
                 headers['Content-Type'] = content_type
             try:
+                if timings is not None:
+                    timings.attempt_started()
                 if open_data is not None:
                     data = open_data()
                     if isinstance(data, StringIO):
@@ -715,6 +785,8 @@ class WorkerEndpoint(Endpoint, WorkerClientSession):
                 else:
                     response = await self.client_session.request(method, url, headers=headers, timeout=timeout)
 
+                if timings is not None:
+                    timings.response_received()
                 entry.mark_success()
 
                 return response
@@ -722,16 +794,18 @@ class WorkerEndpoint(Endpoint, WorkerClientSession):
                 if e.status == 404:
                     # in load balanced configuration, we overwrite the standard 404 handler
                     entry.mark_error()
+                    self._record_retry(404, failed_attempts)
                 else:
                     failed_attempts += 1
                     if e.status not in self.retry_handlers:
                         log_requests.exception('unexpected error: %s', e)
                         raise e
-                    if not await self.retry_handlers[e.status](e.status, failed_attempts):
+                    if not await self._retry(e.status, failed_attempts):
                         log_requests.exception('unexpected error')
                         raise e
             except aiohttp.ClientConnectionError:
                 entry.mark_error()
+                self._record_retry('connection', failed_attempts)
             except Exception as e:
                 log_requests.exception('unexpected error')
                 raise e
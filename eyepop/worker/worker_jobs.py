@@ -1,9 +1,10 @@
 import asyncio
+import functools
 import json
 import logging
 import mimetypes
 from asyncio import Queue
-from typing import Any, AsyncIterable, BinaryIO, Callable, cast
+from typing import Any, AsyncIterable, AsyncIterator, BinaryIO, Callable, cast
 from urllib.parse import urlencode
 
 import aiohttp
@@ -22,6 +23,157 @@ from eyepop.worker.worker_types import (
 
 log_requests = logging.getLogger('eyepop.requests')
 
+_COMPONENT_PARAMS_ADAPTER = TypeAdapter(list[ComponentParams])
+
+# members of an image group read ahead of the part currently on the wire
+_GROUP_PREFETCH_MEMBERS = 4
+
+
+class JobTemplate:
+    """Request parts shared by many worker jobs, serialized once.
+
+    Build one with `WorkerEndpoint.job_template()` and pass it as `template=` when submitting
+    jobs; each job then only serializes its own url, asset uuid or media.
+    """
+    component_params: list[ComponentParams] | None
+    motion_detect: MotionDetectConfig | None
+    roi: Area | None
+    fps: str | None
+    media_cache_seconds: int | None
+    version: PredictionVersion
+
+    def __init__(
+            self,
+            component_params: list[ComponentParams] | None = None,
+            motion_detect: MotionDetectConfig | None = None,
+            roi: Area | None = None,
+            fps: str | None = None,
+            media_cache_seconds: int | None = None,
+            version: PredictionVersion = DEFAULT_PREDICTION_VERSION,
+    ):
+        self.component_params = component_params
+        self.motion_detect = motion_detect
+        self.roi = roi
+        self.fps = fps
+        self.media_cache_seconds = media_cache_seconds
+        self.version = version
+        self._upload_urls: dict[tuple, str] = {}
+
+    def load_from_body(self, locations: list[str]) -> str:
+        if len(locations) == 1:
+            return f'{{"sourceType": "URL", "url": {json.dumps(locations[0])}, {self._url_body_tail}'
+        # Two or more URLs: one image group (no video/motion/fps).
+        sources = json.dumps([{"sourceType": "URL", "url": location} for location in locations])
+        return f'{{"sourceType": "GROUP", "sources": {sources}, {self._group_body_tail}'
+
+    def load_asset_body(self, asset_uuid: str) -> str:
+        return f'{{"sourceType": "ASSET_UUID", "assetUuid": {json.dumps(asset_uuid)}, {self._asset_body_tail}'
+
+    def upload_url(
+            self,
+            video_mode: VideoMode | None,
+            is_live: bool | None,
+            captured_at_offset_ns: int | None,
+            processing: str,
+            source_id: str | None = None,
+    ) -> str:
+        key = (video_mode, is_live, captured_at_offset_ns, processing)
+        upload_url = self._upload_urls.get(key) if source_id is None else None
+        if upload_url is None:
+            query_params: dict[str, Any] = {
+                "mode": "queue",
+            }
+            if video_mode is not None:
+                query_params['videoMode'] = video_mode.value
+            if is_live is not None:
+                query_params["isLive"] = is_live
+            if captured_at_offset_ns is not None:
+                query_params['capturedAtOffsetNs'] = captured_at_offset_ns
+            if self.version is not None:
+                query_params['version'] = self.version
+            if self.motion_detect is not None:
+                query_params.update(self.motion_detect.model_dump(exclude_none=True))
+            if self.media_cache_seconds is not None:
+                query_params['mediaCacheSeconds'] = self.media_cache_seconds
+            query_params['processing'] = processing
+            if source_id is not None:
+                query_params['sourceId'] = source_id
+                return f'source?{urlencode(query_params)}'
+            upload_url = f'source?{urlencode(query_params)}'
+            self._upload_urls[key] = upload_url
+        return upload_url
+
+    @functools.cached_property
+    def multipart_json_parts(self) -> list[tuple[str, bytes]]:
+        json_parts = []
+        if self.component_params is not None:
+            json_parts.append(('params', json.dumps(
+                _COMPONENT_PARAMS_ADAPTER.dump_python(self.component_params)).encode()))
+        if self.roi is not None:
+            json_parts.append(('roi', json.dumps(self.roi.model_dump(exclude_none=True)).encode()))
+        if self.fps is not None:
+            json_parts.append(('fps', json.dumps(self.fps).encode()))
+        return json_parts
+
+    # The *_body_tail properties are the serialized body fields after the per-job leading ones,
+    # without the opening brace; field order matches the bodies built per job before.
+
+    @functools.cached_property
+    def _url_body_tail(self) -> str:
+        tail: dict[str, Any] = {"version": self.version}
+        if self.motion_detect is not None:
+            tail.update(self.motion_detect.model_dump(exclude_none=True))
+        if self.component_params is not None:
+            tail['params'] = _COMPONENT_PARAMS_ADAPTER.dump_python(self.component_params)
+        if self.roi is not None:
+            tail['roi'] = self.roi.model_dump(exclude_none=True)
+        if self.fps is not None:
+            tail['fps'] = self.fps
+        if self.media_cache_seconds is not None:
+            tail['mediaCacheSeconds'] = self.media_cache_seconds
+        return json.dumps(tail)[1:]
+
+    @functools.cached_property
+    def _group_body_tail(self) -> str:
+        tail: dict[str, Any] = {"version": self.version}
+        if self.component_params is not None:
+            tail['params'] = _COMPONENT_PARAMS_ADAPTER.dump_python(self.component_params)
+        if self.roi is not None:
+            tail['roi'] = self.roi.model_dump(exclude_none=True)
+        if self.media_cache_seconds is not None:
+            tail['mediaCacheSeconds'] = self.media_cache_seconds
+        return json.dumps(tail)[1:]
+
+    @functools.cached_property
+    def _asset_body_tail(self) -> str:
+        tail: dict[str, Any] = {"version": self.version}
+        if self.motion_detect is not None:
+            tail.update(self.motion_detect.model_dump())
+        if self.roi is not None:
+            tail['roi'] = self.roi.model_dump(exclude_none=True)
+        if self.component_params is not None:
+            tail['params'] = _COMPONENT_PARAMS_ADAPTER.dump_python(self.component_params)
+        if self.media_cache_seconds is not None:
+            tail['mediaCacheSeconds'] = self.media_cache_seconds
+        return json.dumps(tail)[1:]
+
+
+def _is_prediction(result: dict[str, Any]) -> bool:
+    """True for a prediction, False for an event to skip; raises for error events."""
+    event = result.get('event', None)
+    if event is None:
+        return True
+    if event == 'error':
+        source_id = result.get('source_id', None)
+        message = result.get('message', None)
+        raise ValueError(f"Error in source {source_id}: {message}")
+    type_ = event.get('type', None)
+    if type_ == 'error':
+        source_id = event.get('source_id', None)
+        message = event.get('message', None)
+        raise ValueError(f"Error in source {source_id}: {message}")
+    return False
+
 
 class WorkerJob(Job):
     """Abstract Job submitted to an EyePop.ai WorkerEndpoint."""
@@ -31,6 +183,7 @@ class WorkerJob(Job):
     _fps: str | None
     _version: PredictionVersion
     _media_cache_seconds: int | None
+    _template: JobTemplate
 
     def __init__(
             self,
@@ -42,35 +195,30 @@ class WorkerJob(Job):
             media_cache_seconds: int | None,
             on_ready: Callable[["WorkerJob"], None] | None,
             callback: JobStateCallback | None = None,
-            version: PredictionVersion = DEFAULT_PREDICTION_VERSION,
+            version: PredictionVersion | None = None,
+            template: JobTemplate | None = None,
     ):
         super().__init__(session, cast(Callable[[Job], Any] | None, on_ready), callback)
-        self._component_params = component_params
-        self._motion_detect = motion_detect
-        self._roi = roi
-        self._fps = fps
-        self._media_cache_seconds = media_cache_seconds
-        self._version = version
+        if template is None:
+            template = JobTemplate(component_params, motion_detect, roi, fps, media_cache_seconds,
+                                   version if version is not None else DEFAULT_PREDICTION_VERSION)
+        elif any(arg is not None for arg in (component_params, motion_detect, roi, fps, media_cache_seconds)):
+            raise ValueError("pass either a template or params, motion_detect, roi, fps and media_cache_seconds")
+        elif version is not None and version != template.version:
+            raise ValueError(f"version {version} conflicts with version {template.version} of the template")
+        self._template = template
+        self._component_params = template.component_params
+        self._motion_detect = template.motion_detect
+        self._roi = template.roi
+        self._fps = template.fps
+        self._media_cache_seconds = template.media_cache_seconds
+        self._version = template.version
 
     async def predict(self) -> dict[str, Any] | None:
         while True:
             result = await self.pop_result()
-            if result is None:
-                return None
-            else:
-                event = result.get('event', None)
-                if event is not None:
-                    if event == 'error':
-                        source_id = result.get('source_id', None)
-                        message = result.get('message', None)
-                        raise ValueError(f"Error in source {source_id}: {message}")
-                    type_ = event.get('type', None)
-                    if type_ == 'error':
-                        source_id = event.get('source_id', None)
-                        message = event.get('message', None)
-                        raise ValueError(f"Error in source {source_id}: {message}")
-                else:
-                    return result
+            if result is None or _is_prediction(result):
+                return result
 
     async def _do_read_response(self, queue: Queue) -> bool:
         got_results = False
@@ -98,13 +246,66 @@ class _UploadSource:
 
     mime_type may be None when it cannot be derived (a raw stream group with no
     caller-supplied mime); the server no longer requires a per-member content type.
+    location is set for local files, which a group upload can read ahead.
     """
     open_stream: Callable[[], BinaryIO | AsyncIterable[bytes]]
     mime_type: str | None
+    location: str | None
 
-    def __init__(self, open_stream: Callable[[], BinaryIO | AsyncIterable[bytes]], mime_type: str | None):
+    def __init__(
+            self,
+            open_stream: Callable[[], BinaryIO | AsyncIterable[bytes]],
+            mime_type: str | None,
+            location: str | None = None,
+    ):
         self.open_stream = open_stream
         self.mime_type = mime_type
+        self.location = location
+
+
+def _read_file(location: str) -> bytes:
+    with open(location, 'rb') as f:
+        return f.read()
+
+
+class _GroupPrefetcher:
+    """Reads the local files of an image group in worker threads while earlier members are sent.
+
+    At most `max_buffered` members are read ahead, a member's bytes are dropped once its part
+    has been written.
+    """
+    def __init__(self, locations: list[str], max_buffered: int):
+        self.locations = locations
+        self.max_buffered = max_buffered
+        self.reads: list[asyncio.Future | None] = [None] * len(locations)
+        for i in range(min(max_buffered, len(locations))):
+            self._schedule(i)
+
+    def _schedule(self, i: int) -> None:
+        if i < len(self.locations) and self.reads[i] is None:
+            self.reads[i] = asyncio.ensure_future(asyncio.to_thread(_read_file, self.locations[i]))
+
+    async def member(self, i: int) -> AsyncIterator[bytes]:
+        self._schedule(i)
+        read = self.reads[i]
+        assert read is not None
+        data = await read
+        self.reads[i] = None
+        self._schedule(i + self.max_buffered)
+        yield data
+
+    def close(self) -> None:
+        """Cancel the reads not consumed by a failed attempt, so no read is left behind."""
+        for i, read in enumerate(self.reads):
+            if read is None:
+                continue
+            if read.done():
+                if not read.cancelled():
+                    # retrieve a failed read, its error surfaced or is moot for the attempt
+                    read.exception()
+            else:
+                read.cancel()
+            self.reads[i] = None
 
 
 class _UploadJob(WorkerJob):
@@ -121,6 +322,7 @@ class _UploadJob(WorkerJob):
     is_live: bool | None
     captured_at_offset_ns: int | None
     needs_full_duplex: bool
+    _prefetcher: _GroupPrefetcher | None
 
     def __init__(
             self,
@@ -136,7 +338,8 @@ class _UploadJob(WorkerJob):
             session: WorkerClientSession,
             on_ready: Callable[[WorkerJob], None] | None = None,
             callback: JobStateCallback | None = None,
-            version: PredictionVersion = DEFAULT_PREDICTION_VERSION,
+            version: PredictionVersion | None = None,
+            template: JobTemplate | None = None,
     ):
         super().__init__(
             session=session,
@@ -147,14 +350,18 @@ class _UploadJob(WorkerJob):
             media_cache_seconds=media_cache_seconds,
             on_ready=on_ready,
             callback=callback,
-            version=version
+            version=version,
+            template=template
         )
         if not sources:
             raise ValueError("upload requires at least one source")
+        if len(sources) > 1 and (self._motion_detect is not None or self._fps is not None):
+            raise ValueError("an image group does not support motion_detect or fps")
         self.sources = sources
         self.video_mode = video_mode
         self.is_live = is_live
         self.captured_at_offset_ns = captured_at_offset_ns
+        self._prefetcher = None
         # Full duplex is only used for a single video upload; an image group is
         # always posted as one sync multipart request.
         self.needs_full_duplex = (
@@ -165,44 +372,39 @@ class _UploadJob(WorkerJob):
 
     def open_mp_writer(self):
         mp_writer = aiohttp.MultipartWriter('form-data')
-        if self._component_params is not None:
-            component_params_part = mp_writer.append_json(
-                TypeAdapter(list[ComponentParams]).dump_python(self._component_params))
-            component_params_part.set_content_disposition(
-                'form-data', name='params', filename='blob')
-        if self._roi is not None:
-            roi_part = mp_writer.append_json(self._roi.model_dump(exclude_none=True))
-            roi_part.set_content_disposition('form-data', name='roi', filename='blob')
-        if self._fps is not None:
-            fps_part = mp_writer.append_json(self._fps)
-            fps_part.set_content_disposition('form-data', name='fps', filename='blob')
-
-        for source in self.sources:
+        for name, json_bytes in self._template.multipart_json_parts:
+            json_part = mp_writer.append(json_bytes, {'Content-Type': 'application/json'})
+            json_part.set_content_disposition('form-data', name=name, filename='blob')
+
+        # called again for each retry, the reads of the failed attempt are not awaited anymore
+        self._close_prefetcher()
+        prefetcher = None
+        if len(self.sources) > 1 and all(source.location is not None for source in self.sources):
+            prefetcher = _GroupPrefetcher(
+                [cast(str, source.location) for source in self.sources], _GROUP_PREFETCH_MEMBERS
+            )
+        self._prefetcher = prefetcher
+        for i, source in enumerate(self.sources):
+            data = prefetcher.member(i) if prefetcher is not None else source.open_stream()
             if source.mime_type is not None:
-                file_part = mp_writer.append(source.open_stream(), {'Content-Type': source.mime_type})
+                file_part = mp_writer.append(data, {'Content-Type': source.mime_type})
             else:
-                file_part = mp_writer.append(source.open_stream())
+                file_part = mp_writer.append(data)
             file_part.set_content_disposition('form-data', name='file', filename='blob')
         return mp_writer
 
+    def _close_prefetcher(self) -> None:
+        if self._prefetcher is not None:
+            self._prefetcher.close()
+            self._prefetcher = None
 
     async def _do_execute_job(self, queue: Queue, session: WorkerClientSession):
-        query_params: dict[str, Any] = {
-            "mode": "queue",
-        }
-        if self.video_mode is not None:
-            query_params['videoMode'] = self.video_mode.value
-        if self.is_live is not None:
-            query_params["isLive"] = self.is_live
-        if self.captured_at_offset_ns is not None:
-            query_params['capturedAtOffsetNs'] = self.captured_at_offset_ns
-        if self._version is not None:
-            query_params['version'] = self._version
-        if self._motion_detect is not None:
-            query_params.update(self._motion_detect.model_dump(exclude_none=True))
-        if self._media_cache_seconds is not None:
-            query_params['mediaCacheSeconds'] = self._media_cache_seconds
+        try:
+            await self._do_upload(queue, session)
+        finally:
+            self._close_prefetcher()
 
+    async def _do_upload(self, queue: Queue, session: WorkerClientSession):
         # A single item with no extra parts can stream its raw body; anything
         # else (extra parts, or a multi-item image group) is sent as multipart.
         single_source = self.sources[0] if len(self.sources) == 1 else None
@@ -226,9 +428,9 @@ class _UploadJob(WorkerJob):
                         source_id = event.get('source_id', None)
             if source_id is None:
                 raise ValueError("did not get a prepared sourceId to simulate full duplex")
-            query_params['processing'] = 'async'
-            query_params['sourceId'] = source_id
-            upload_url = f'source?{urlencode(query_params)}'
+            upload_url = self._template.upload_url(
+                self.video_mode, self.is_live, self.captured_at_offset_ns, 'async', source_id
+            )
             if single_source is not None and no_extra_parts:
                 upload_coro = session.pipeline_post(upload_url,
                                                     accept='application/jsonl',
@@ -243,8 +445,7 @@ class _UploadJob(WorkerJob):
             read_coro = self._do_read_response(queue)
             _, got_result = await asyncio.gather(upload_coro, read_coro)
         else:
-            query_params['processing'] = 'sync'
-            upload_url = f'source?{urlencode(query_params)}'
+            upload_url = self._template.upload_url(self.video_mode, self.is_live, self.captured_at_offset_ns, 'sync')
             if single_source is not None and no_extra_parts:
                 self._response = await session.pipeline_post(upload_url,
                                                              accept='application/jsonl',
@@ -292,7 +493,8 @@ class _UploadFileJob(_UploadJob):
             session: WorkerClientSession,
             on_ready: Callable[[WorkerJob], None] | None = None,
             callback: JobStateCallback | None = None,
-            version: PredictionVersion = DEFAULT_PREDICTION_VERSION,
+            version: PredictionVersion | None = None,
+            template: JobTemplate | None = None,
     ):
         self.location = location
         super().__init__(
@@ -310,7 +512,8 @@ class _UploadFileJob(_UploadJob):
             session=session,
             on_ready=on_ready,
             callback=callback,
-            version=version
+            version=version,
+            template=template
         )
 
 
@@ -330,7 +533,8 @@ class _UploadStreamJob(_UploadJob):
             session: WorkerClientSession,
             on_ready: Callable[[WorkerJob], None] | None = None,
             callback: JobStateCallback | None = None,
-            version: PredictionVersion = DEFAULT_PREDICTION_VERSION,
+            version: PredictionVersion | None = None,
+            template: JobTemplate | None = None,
     ):
         self.stream = stream
         super().__init__(
@@ -346,7 +550,8 @@ class _UploadStreamJob(_UploadJob):
             session=session,
             on_ready=on_ready,
             callback=callback,
-            version=version
+            version=version,
+            template=template
         )
 
     def _get_opened_stream(self):
@@ -372,12 +577,14 @@ class _UploadFileGroupJob(_UploadJob):
             session: WorkerClientSession,
             on_ready: Callable[[WorkerJob], None] | None = None,
             callback: JobStateCallback | None = None,
-            version: PredictionVersion = DEFAULT_PREDICTION_VERSION,
+            version: PredictionVersion | None = None,
+            template: JobTemplate | None = None,
     ):
         sources = [
             _UploadSource(
                 _file_stream_opener(location),
-                _guess_mime_type_from_location(location) or 'application/octet-stream')
+                _guess_mime_type_from_location(location) or 'application/octet-stream',
+                location)
             for location in locations
         ]
         super().__init__(
@@ -393,7 +600,8 @@ class _UploadFileGroupJob(_UploadJob):
             session=session,
             on_ready=on_ready,
             callback=callback,
-            version=version
+            version=version,
+            template=template
         )
 
 
@@ -416,7 +624,8 @@ class _UploadStreamGroupJob(_UploadJob):
             session: WorkerClientSession,
             on_ready: Callable[[WorkerJob], None] | None = None,
             callback: JobStateCallback | None = None,
-            version: PredictionVersion = DEFAULT_PREDICTION_VERSION,
+            version: PredictionVersion | None = None,
+            template: JobTemplate | None = None,
     ):
         sources = [_UploadSource(_stream_opener(stream), None) for stream in streams]
         super().__init__(
@@ -432,7 +641,8 @@ class _UploadStreamGroupJob(_UploadJob):
             session=session,
             on_ready=on_ready,
             callback=callback,
-            version=version
+            version=version,
+            template=template
         )
         # Validate/apply mime types after super().__init__ so a bad call does not
         # leave a half-constructed Job behind.
@@ -463,7 +673,8 @@ class _LoadFromJob(WorkerJob):
             session: WorkerClientSession,
             on_ready: Callable[[WorkerJob], None] | None = None,
             callback: JobStateCallback | None = None,
-            version: PredictionVersion = DEFAULT_PREDICTION_VERSION,
+            version: PredictionVersion | None = None,
+            template: JobTemplate | None = None,
     ):
         super().__init__(
             session=session,
@@ -474,49 +685,23 @@ class _LoadFromJob(WorkerJob):
             media_cache_seconds=media_cache_seconds,
             on_ready=on_ready,
             callback=callback,
-            version=version
+            version=version,
+            template=template
         )
         if not locations:
             raise ValueError("load_from requires at least one url")
+        if len(locations) > 1 and (self._motion_detect is not None or self._fps is not None):
+            raise ValueError("an image group does not support motion_detect or fps")
         self.locations = list(locations)
         self.target_url = 'source?mode=queue&processing=sync'
-        if len(self.locations) == 1:
-            # Single URL: unchanged body (field order preserved for compatibility).
-            self.body: dict[str, Any] = {
-                "sourceType": "URL",
-                "url": self.locations[0],
-                "version": self._version,
-            }
-            if self._motion_detect is not None:
-                self.body.update(self._motion_detect.model_dump(exclude_none=True))
-            if self._component_params is not None:
-                self.body['params'] = TypeAdapter(list[ComponentParams]).dump_python(self._component_params)
-            if self._roi is not None:
-                self.body['roi'] = self._roi.model_dump(exclude_none=True)
-            if self._fps is not None:
-                self.body['fps'] = self._fps
-            if self._media_cache_seconds is not None:
-                self.body['mediaCacheSeconds'] = self._media_cache_seconds
-        else:
-            # Two or more URLs: one image group (no video/motion/fps).
-            self.body = {
-                "sourceType": "GROUP",
-                "sources": [{"sourceType": "URL", "url": location} for location in self.locations],
-                "version": self._version,
-            }
-            if self._component_params is not None:
-                self.body['params'] = TypeAdapter(list[ComponentParams]).dump_python(self._component_params)
-            if self._roi is not None:
-                self.body['roi'] = self._roi.model_dump(exclude_none=True)
-            if self._media_cache_seconds is not None:
-                self.body['mediaCacheSeconds'] = self._media_cache_seconds
+        self.body = self._template.load_from_body(self.locations)
 
         self.timeouts = aiohttp.ClientTimeout(total=None, sock_read=600)
 
     async def _do_execute_job(self, queue: Queue, session: WorkerClientSession):
         self._response = await session.pipeline_patch(self.target_url,
                                                       accept='application/jsonl',
-                                                      data=json.dumps(self.body),
+                                                      data=self.body,
                                                       content_type='application/json',
                                                       timeout=self.timeouts)
         await self._do_read_response(queue)
@@ -534,7 +719,8 @@ class _LoadFromAssetUuidJob(WorkerJob):
             session: WorkerClientSession,
             on_ready: Callable[[WorkerJob], None] | None = None,
             callback: JobStateCallback | None = None,
-            version: PredictionVersion = DEFAULT_PREDICTION_VERSION,
+            version: PredictionVersion | None = None,
+            template: JobTemplate | None = None,
     ):
         super().__init__(
             session=session,
@@ -545,30 +731,19 @@ class _LoadFromAssetUuidJob(WorkerJob):
             media_cache_seconds=media_cache_seconds,
             on_ready=on_ready,
             callback=callback,
-            version=version
+            version=version,
+            template=template
         )
         self.asset_uuid = asset_uuid
         self.target_url = 'source?mode=queue&processing=sync'
-        self.body: dict[str, Any] = {
-            "sourceType": "ASSET_UUID",
-            "assetUuid": self.asset_uuid,
-            "version": self._version
-        }
-        if self._motion_detect is not None:
-            self.body.update(self._motion_detect.model_dump())
-        if self._roi is not None:
-            self.body['roi'] = self._roi.model_dump(exclude_none=True)
-        if self._component_params is not None:
-            self.body['params'] = TypeAdapter(list[ComponentParams]).dump_python(self._component_params)
-        if self._media_cache_seconds is not None:
-            self.body['mediaCacheSeconds'] = self._media_cache_seconds
+        self.body = self._template.load_asset_body(self.asset_uuid)
 
         self.timeouts = aiohttp.ClientTimeout(total=None, sock_read=600)
 
     async def _do_execute_job(self, queue: Queue, session: WorkerClientSession):
         self._response = await session.pipeline_patch(self.target_url,
                                                       accept='application/jsonl',
-                                                      data=json.dumps(self.body),
+                                                      data=self.body,
                                                       content_type='application/json',
                                                       timeout=self.timeouts)
         await self._do_read_response(queue)
@@ -1,10 +1,19 @@
+import collections
 import logging
 import typing
 
 from eyepop.data.types.asset import Area
-from eyepop.syncify import SyncEndpoint, run_coro_thread_save
-from eyepop.worker.worker_jobs import WorkerJob
-from eyepop.worker.worker_types import ComponentParams, MotionDetectConfig, Pop, VideoMode
+from eyepop.jobs import JobTimings
+from eyepop.syncify import SYNC_RESULT_BATCH, SyncEndpoint, run_coro_thread_save
+from eyepop.worker.worker_jobs import JobTemplate, WorkerJob, _is_prediction
+from eyepop.worker.worker_types import (
+    DEFAULT_PREDICTION_VERSION,
+    ComponentParams,
+    MotionDetectConfig,
+    Pop,
+    PredictionVersion,
+    VideoMode,
+)
 
 if typing.TYPE_CHECKING:
     from eyepop.worker.worker_endpoint import WorkerEndpoint
@@ -16,12 +25,25 @@ class SyncWorkerJob:
     def __init__(self, job: WorkerJob, event_loop):
         self.job = job
         self.event_loop = event_loop
+        self._results: collections.deque[dict | None] = collections.deque()
+
+    @property
+    def timings(self) -> JobTimings:
+        return self.job.timings
 
     def predict(self) -> dict | None:
-        prediction = run_coro_thread_save(self.event_loop, self.job.predict())
-        return prediction
+        # results that arrived together cross from the event loop thread in one round trip
+        while True:
+            if not self._results:
+                self._results.extend(run_coro_thread_save(
+                    self.event_loop, self.job.pop_results(SYNC_RESULT_BATCH)
+                ))
+            result = self._results.popleft()
+            if result is None or _is_prediction(result):
+                return result
 
     def cancel(self):
+        self._results.clear()
         run_coro_thread_save(self.event_loop, self.job.cancel())
 
 
@@ -29,6 +51,24 @@ class SyncWorkerEndpoint(SyncEndpoint):
     def __init__(self, endpoint: "WorkerEndpoint"):
         super().__init__(endpoint)
 
+    def job_template(
+            self,
+            params: list[ComponentParams] | None = None,
+            motion_detect: MotionDetectConfig | None = None,
+            roi: Area | None = None,
+            fps: str | None = None,
+            media_cache_seconds: int | None = None,
+            version: PredictionVersion = DEFAULT_PREDICTION_VERSION,
+    ) -> JobTemplate:
+        return self.endpoint.job_template(
+            params=params,
+            motion_detect=motion_detect,
+            roi=roi,
+            fps=fps,
+            media_cache_seconds=media_cache_seconds,
+            version=version,
+        )
+
     def upload(
             self,
             location: str,
@@ -40,7 +80,8 @@ class SyncWorkerEndpoint(SyncEndpoint):
             roi: Area | None = None,
             fps: str | None = None,
             media_cache_seconds: int | None = None,
-            on_ready: typing.Callable[[WorkerJob], None] | None = None
+            on_ready: typing.Callable[[WorkerJob], None] | None = None,
+            template: JobTemplate | None = None,
     ) -> SyncWorkerJob:
         if on_ready is not None:
             raise TypeError(
@@ -54,7 +95,8 @@ class SyncWorkerEndpoint(SyncEndpoint):
             roi=roi,
             fps=fps,
             media_cache_seconds=media_cache_seconds,
-            on_ready=None
+            on_ready=None,
+            template=template,
         ))
         return SyncWorkerJob(job, self.event_loop)
 
@@ -68,7 +110,8 @@ class SyncWorkerEndpoint(SyncEndpoint):
             roi: Area | None = None,
             fps: str | None = None,
             media_cache_seconds: int | None = None,
-            on_ready: typing.Callable[[WorkerJob], None] | None = None
+            on_ready: typing.Callable[[WorkerJob], None] | None = None,
+            template: JobTemplate | None = None,
     ) -> SyncWorkerJob:
         if on_ready is not None:
             raise TypeError(
@@ -83,7 +126,8 @@ class SyncWorkerEndpoint(SyncEndpoint):
             roi=roi,
             fps=fps,
             media_cache_seconds=media_cache_seconds,
-            on_ready=None
+            on_ready=None,
+            template=template,
         ))
         return SyncWorkerJob(job, self.event_loop)
 
@@ -94,7 +138,8 @@ class SyncWorkerEndpoint(SyncEndpoint):
             params: list[ComponentParams] | None = None,
             roi: Area | None = None,
             media_cache_seconds: int | None = None,
-            on_ready: typing.Callable[[WorkerJob], None] | None = None
+            on_ready: typing.Callable[[WorkerJob], None] | None = None,
+            template: JobTemplate | None = None,
     ) -> SyncWorkerJob:
         if on_ready is not None:
             raise TypeError(
@@ -106,7 +151,8 @@ class SyncWorkerEndpoint(SyncEndpoint):
             params=params,
             roi=roi,
             media_cache_seconds=media_cache_seconds,
-            on_ready=None
+            on_ready=None,
+            template=template,
         ))
         return SyncWorkerJob(job, self.event_loop)
 
@@ -116,7 +162,8 @@ class SyncWorkerEndpoint(SyncEndpoint):
             params: list[ComponentParams] | None = None,
             roi: Area | None = None,
             media_cache_seconds: int | None = None,
-            on_ready: typing.Callable[[WorkerJob], None] | None = None
+            on_ready: typing.Callable[[WorkerJob], None] | None = None,
+            template: JobTemplate | None = None,
     ) -> SyncWorkerJob:
         if on_ready is not None:
             raise TypeError(
@@ -127,7 +174,8 @@ class SyncWorkerEndpoint(SyncEndpoint):
             params=params,
             roi=roi,
             media_cache_seconds=media_cache_seconds,
-            on_ready=None
+            on_ready=None,
+            template=template,
         ))
         return SyncWorkerJob(job, self.event_loop)
 
@@ -139,7 +187,8 @@ class SyncWorkerEndpoint(SyncEndpoint):
             roi: Area | None = None,
             fps: str | None = None,
             media_cache_seconds: int | None = None,
-            on_ready: typing.Callable[[WorkerJob], None] | None = None
+            on_ready: typing.Callable[[WorkerJob], None] | None = None,
+            template: JobTemplate | None = None,
     ) -> SyncWorkerJob:
         if on_ready is not None:
             raise TypeError(
@@ -152,7 +201,8 @@ class SyncWorkerEndpoint(SyncEndpoint):
             roi=roi,
             fps=fps,
             media_cache_seconds=media_cache_seconds,
-            on_ready=None
+            on_ready=None,
+            template=template,
         ))
         return SyncWorkerJob(job, self.event_loop)
 
@@ -162,7 +212,8 @@ class SyncWorkerEndpoint(SyncEndpoint):
             params: list[ComponentParams] | None = None,
             roi: Area | None = None,
             media_cache_seconds: int | None = None,
-            on_ready: typing.Callable[[WorkerJob], None] | None = None
+            on_ready: typing.Callable[[WorkerJob], None] | None = None,
+            template: JobTemplate | None = None,
     ) -> SyncWorkerJob:
         if on_ready is not None:
             raise TypeError(
@@ -173,7 +224,8 @@ class SyncWorkerEndpoint(SyncEndpoint):
             params=params,
             roi=roi,
             media_cache_seconds=media_cache_seconds,
-            on_ready=None
+            on_ready=None,
+            template=template,
         ))
         return SyncWorkerJob(job, self.event_loop)
 
@@ -185,7 +237,8 @@ class SyncWorkerEndpoint(SyncEndpoint):
             roi: Area | None = None,
             fps: str | None = None,
             media_cache_seconds: int | None = None,
-            on_ready: typing.Callable[[WorkerJob], None] | None = None
+            on_ready: typing.Callable[[WorkerJob], None] | None = None,
+            template: JobTemplate | None = None,
     ) -> SyncWorkerJob:
         if on_ready is not None:
             raise TypeError(
@@ -198,7 +251,8 @@ class SyncWorkerEndpoint(SyncEndpoint):
             roi=roi,
             fps=fps,
             media_cache_seconds=media_cache_seconds,
-            on_ready=None
+            on_ready=None,
+            template=template,
         ))
         return SyncWorkerJob(job, self.event_loop)
 
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+import time
+from types import SimpleNamespace
+from typing import cast
+
+from aiohttp import (
+    ClientResponse,
+    TraceRequestChunkSentParams,
+    TraceRequestEndParams,
+    TraceRequestStartParams,
+    TraceResponseChunkReceivedParams,
+)
+from multidict import CIMultiDict
+from yarl import URL
+
+from eyepop.request_tracer import RequestTracer
+
+URL_SOURCE = URL("https://worker.test:443/pipelines/0123456789abcdef0123456789abcdef/source")
+
+DESCRIPTION = "Microbenchmark of the RequestTracer hooks per request and per body chunk, and of the event encoding."
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=DESCRIPTION)
+    parser.add_argument(
+        "--chunks",
+        type=int,
+        default=200_000,
+        help="Body chunks per chunk hook measurement.",
+    )
+    parser.add_argument(
+        "--events",
+        type=int,
+        default=1204,
+        help="Events per encoded record, the default tracer buffer size.",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="Timing repetitions; the fastest is reported.",
+    )
+    return parser.parse_args()
+
+
+async def time_chunk_hook(tracer: RequestTracer, hook_name: str, chunks: int) -> float:
+    """Seconds per call of a chunk hook on one request, as for a large streamed upload."""
+    ctx = SimpleNamespace()
+    await tracer.on_request_start(None, ctx, TraceRequestStartParams("POST", URL_SOURCE, CIMultiDict()))
+    chunk = b"x" * 65536
+    start = time.perf_counter()
+    if hook_name == "on_request_chunk_sent":
+        sent = TraceRequestChunkSentParams("POST", URL_SOURCE, chunk)
+        for _ in range(chunks):
+            await tracer.on_request_chunk_sent(None, ctx, sent)
+    else:
+        received = TraceResponseChunkReceivedParams("POST", URL_SOURCE, chunk)
+        for _ in range(chunks):
+            await tracer.on_response_chunk_received(None, ctx, received)
+    return (time.perf_counter() - start) / chunks
+
+
+async def time_requests(tracer: RequestTracer, requests: int) -> float:
+    """Seconds per traced request with one chunk each way and a response."""
+    chunk = b"x" * 1024
+    sent = TraceRequestChunkSentParams("PATCH", URL_SOURCE, chunk)
+    # the tracer only reads the status of the response
+    response = cast(ClientResponse, SimpleNamespace(status=200))
+    end = TraceRequestEndParams("PATCH", URL_SOURCE, CIMultiDict(), response)
+    received = TraceResponseChunkReceivedParams("PATCH", URL_SOURCE, chunk)
+    start = time.perf_counter()
+    for _ in range(requests):
+        ctx = SimpleNamespace()
+        # fresh headers per request, on_request_start adds the X-Request-Id
+        await tracer.on_request_start(None, ctx, TraceRequestStartParams("PATCH", URL_SOURCE, CIMultiDict()))
+        await tracer.on_request_chunk_sent(None, ctx, sent)
+        await tracer.on_request_end(None, ctx, end)
+        await tracer.on_response_chunk_received(None, ctx, received)
+    return (time.perf_counter() - start) / requests
+
+
+async def run(args: argparse.Namespace) -> None:
+    tracer = RequestTracer(max_events=args.events)
+    for hook_name in ("on_request_chunk_sent", "on_response_chunk_received"):
+        secs = min([await time_chunk_hook(tracer, hook_name, args.chunks) for _ in range(args.repeat)])
+        print(f"{hook_name:28s} {secs * 1e9:10.0f} ns/chunk")
+
+    secs = min([await time_requests(tracer, args.events) for _ in range(args.repeat)])
+    print(f"{'request hooks':28s} {secs * 1e6:10.2f} us/request")
+
+    events = list(tracer.events)
+    timings = []
+    buf = b""
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        buf = tracer.encode(events)
+        timings.append(time.perf_counter() - start)
+    print(f"{'encode':28s} {min(timings) * 1e3:10.2f} ms/{len(events)} events, {len(buf)} bytes")
+
+
+def main() -> int:
+    asyncio.run(run(parse_args()))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
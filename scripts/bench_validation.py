@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import timeit
+import warnings
+from typing import Any, Callable
+
+from pydantic import TypeAdapter
+
+from eyepop.data.data_types import Asset, ChangeEvent, Prediction
+
+DESCRIPTION = "Microbenchmark of pydantic validation for the main Data API response types."
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=DESCRIPTION)
+    parser.add_argument(
+        "--objects",
+        type=int,
+        default=20,
+        help="Predicted objects per prediction.",
+    )
+    parser.add_argument(
+        "--assets",
+        type=int,
+        default=100,
+        help="Assets in the asset list response.",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="Timing repetitions; the fastest is reported.",
+    )
+    return parser.parse_args()
+
+
+def prediction_payload(num_objects: int) -> dict[str, Any]:
+    return {
+        "source_width": 1920.0,
+        "source_height": 1080.0,
+        "timestamp": 0,
+        "source_id": "asset_0",
+        "objects": [{
+            "id": i, "confidence": 0.9, "classLabel": "person", "category": "people",
+            "x": 10.0 * i, "y": 20.0, "width": 50.0, "height": 120.0,
+            "keyPoints": [{"type": "body", "points": [
+                {"x": 1.0 * k, "y": 2.0 * k, "classLabel": f"k{k}", "confidence": 0.8} for k in range(5)
+            ]}],
+        } for i in range(num_objects)],
+    }
+
+
+def asset_payload(index: int, num_objects: int) -> dict[str, Any]:
+    return {
+        "uuid": f"asset_{index}",
+        "created_at": "2024-01-01T00:00:00Z",
+        "mime_type": "image/jpeg",
+        "status": "accepted",
+        "original_image_width": 1920,
+        "original_image_height": 1080,
+        "annotations": [{
+            "type": "ground_truth",
+            "user_review": "approved",
+            "predictions": [prediction_payload(num_objects)],
+        }],
+    }
+
+
+def change_event_payload() -> dict[str, Any]:
+    return {
+        "change_type": "asset_status_modified", "account_uuid": "account_0", "dataset_uuid": "dataset_0",
+        "dataset_version": 1, "asset_uuid": "asset_0", "mdl_uuid": None, "workflow_id": None,
+        "message": None, "workflow_task_name": None,
+    }
+
+
+def variants(response_type: Any, body: bytes) -> dict[str, Callable[[], Any]]:
+    """Each way the SDK has parsed a response body, from the per-call validator to the cached one."""
+    from pydantic.tools import parse_obj_as
+
+    adapter = TypeAdapter(response_type)
+    return {
+        "parse_obj_as(json.loads)": lambda: parse_obj_as(response_type, json.loads(body)),
+        "TypeAdapter per call": lambda: TypeAdapter(response_type).validate_python(json.loads(body)),
+        "cached validate_python": lambda: adapter.validate_python(json.loads(body)),
+        "cached validate_json": lambda: adapter.validate_json(body),
+    }
+
+
+def main() -> int:
+    args = parse_args()
+    warnings.simplefilter("ignore", DeprecationWarning)
+    cases = {
+        "ChangeEvent": (ChangeEvent, json.dumps(change_event_payload()).encode()),
+        "Prediction": (Prediction, json.dumps(prediction_payload(args.objects)).encode()),
+        "list[Asset]": (list[Asset], json.dumps(
+            [asset_payload(i, args.objects) for i in range(args.assets)]).encode()),
+    }
+    for name, (response_type, body) in cases.items():
+        print(f"{name} ({len(body)} bytes)")
+        baseline = None
+        for variant, parse in variants(response_type, body).items():
+            number = max(1, timeit.Timer(parse).autorange()[0] // 4)
+            secs = min(timeit.repeat(parse, number=number, repeat=args.repeat)) / number
+            baseline = baseline or secs
+            print(f"  {variant:28s} {secs * 1e6:10.1f} us  {baseline / secs:5.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+DESCRIPTION = "Measure the cold import time of the SDK with `python -X importtime`."
+HEAVY_MODULES = ("pyarrow", "pandas", "matplotlib")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=DESCRIPTION)
+    parser.add_argument(
+        "--module",
+        default="eyepop",
+        help="Module to import, e.g. eyepop or eyepop.worker.worker_endpoint.",
+    )
+    parser.add_argument(
+        "--runs",
+        type=int,
+        default=5,
+        help="Number of fresh interpreters; the fastest run is reported.",
+    )
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=10,
+        help="Number of slowest modules (cumulative) to list.",
+    )
+    parser.add_argument(
+        "--max-ms",
+        type=float,
+        default=None,
+        help="Fail when the import takes longer than this many milliseconds.",
+    )
+    parser.add_argument(
+        "--json",
+        type=Path,
+        default=None,
+        help="Optional path to write the measurement as JSON.",
+    )
+    return parser.parse_args()
+
+
+def measure(module: str) -> list[tuple[str, int, int]]:
+    """One cold import in a fresh interpreter, as (module, self_us, cumulative_us) rows."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    rows = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        if not self_us.strip().isdigit():
+            continue  # the header line
+        rows.append((name.strip(), int(self_us), int(cumulative_us)))
+    return rows
+
+
+def main() -> int:
+    args = parse_args()
+    runs = [measure(args.module) for _ in range(args.runs)]
+    best = min(runs, key=lambda rows: sum(self_us for _, self_us, _ in rows))
+    total_ms = sum(self_us for _, self_us, _ in best) / 1000
+    loaded = {name for name, _, _ in best}
+    heavy = [name for name in HEAVY_MODULES if name in loaded]
+    slowest = sorted(best, key=lambda row: row[2], reverse=True)[:args.top]
+
+    print(f"import {args.module}: {total_ms:.1f} ms, {len(best)} modules (best of {args.runs})")
+    print(f"heavy modules loaded: {', '.join(heavy) if heavy else 'none'}")
+    for name, _, cumulative_us in slowest:
+        print(f"  {cumulative_us / 1000:8.1f} ms  {name}")
+
+    if args.json is not None:
+        args.json.write_text(json.dumps({
+            "module": args.module,
+            "total_ms": total_ms,
+            "num_modules": len(best),
+            "heavy_modules": heavy,
+            "slowest": [{"module": name, "cumulative_ms": cumulative_us / 1000}
+                        for name, _, cumulative_us in slowest],
+        }, indent=2))
+
+    if args.max_ms is not None and total_ms > args.max_ms:
+        print(f"import took {total_ms:.1f} ms, more than --max-ms {args.max_ms}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,114 @@
+import asyncio
+import itertools
+import json
+import re
+import unittest
+
+from aioresponses import CallbackResult, aioresponses
+from yarl import URL
+
+from eyepop import EyePopSdk
+from eyepop.data.data_completion import CompletionTracker
+from eyepop.data.data_types import InferRequest
+from tests.data.base_endpoint_test import BaseEndpointTest
+
+
+class _NeverCompletes:
+    status = 202
+
+    async def __aenter__(self):
+        await asyncio.sleep(0.01)
+        return self
+
+    async def __aexit__(self, *args):
+        return None
+
+
+class _PendingSession:
+    def __init__(self):
+        self.num_requests = 0
+
+    async def request_with_retry(self, method: str, url: str, **kwargs):
+        self.num_requests += 1
+        return _NeverCompletes()
+
+
+class TestCompletionTracker(BaseEndpointTest):
+    test_vlm_url = 'http://example-vlm.test'
+
+    async def test_timeout_and_close(self):
+        tracker = CompletionTracker(max_pollers=1)
+        session = _PendingSession()
+        with self.assertRaises(TimeoutError):
+            await tracker.wait(session, '/api/v1/infer/r0', timeout=0.05)  # type: ignore[arg-type]
+
+        waiting = asyncio.create_task(tracker.wait(session, '/api/v1/infer/r1'))  # type: ignore[arg-type]
+        await asyncio.sleep(0.02)
+        self.assertEqual(tracker.num_pollers, 1)
+        await tracker.close()
+        with self.assertRaises(ConnectionError):
+            await waiting
+        self.assertEqual(tracker.num_pollers, 0)
+
+    async def test_pollers_bounded_by_pending_requests(self):
+        for max_pollers, expected_pollers in ((8, 8), (64, 20), (None, 20)):
+            tracker = CompletionTracker(max_pollers=max_pollers)
+            session = _PendingSession()
+            waiting = [asyncio.create_task(tracker.wait(session, f'/api/v1/infer/r{i}'))  # type: ignore[arg-type]
+                       for i in range(20)]
+            await asyncio.sleep(0.02)
+            self.assertEqual(tracker.num_pollers, expected_pollers)
+            await tracker.close()
+            for task in waiting:
+                with self.assertRaises(ConnectionError):
+                    await task
+
+    @aioresponses()
+    async def test_infer_jobs_share_pollers(self, mock: aioresponses):
+        self.setup_base_mock(mock)
+        mock.post(f'{self.test_eyepop_url}/authentication/token', status=200, body=json.dumps(
+            {'expires_in': 1000 * 1000, 'token_type': 'Bearer', 'access_token': self.test_access_token}), repeat=True)
+        request_ids = itertools.count()
+        num_polls: dict[str, int] = {}
+        poll_timeouts = set()
+        open_polls = 0
+        max_open_polls = 0
+
+        def post_infer(url, **kwargs) -> CallbackResult:
+            return CallbackResult(status=202, body=json.dumps({'request_id': f'r{next(request_ids)}'}))
+
+        async def get_infer(url, **kwargs) -> CallbackResult:
+            nonlocal open_polls, max_open_polls
+            request_id = URL(url).path.split('/')[-1]
+            poll_timeouts.add(URL(url).query['timeout'])
+            num_polls[request_id] = num_polls.get(request_id, 0) + 1
+            open_polls += 1
+            max_open_polls = max(max_open_polls, open_polls)
+            await asyncio.sleep(0.01)
+            open_polls -= 1
+            if num_polls[request_id] < 3:
+                return CallbackResult(status=202, body=json.dumps({'request_id': request_id}))
+            return CallbackResult(status=200, body=json.dumps({
+                'raw_output': request_id,
+                'predictions': [{'source_width': 1, 'source_height': 1}],
+            }))
+
+        mock.post(f'{self.test_vlm_url}/api/v1/infer?timeout=20', callback=post_infer, repeat=True)
+        mock.get(re.compile(rf'^{re.escape(self.test_vlm_url)}/api/v1/infer/r\d+\?.*$'),
+                 callback=get_infer, repeat=True)
+
+        async with EyePopSdk.dataEndpoint(eyepop_url=self.test_eyepop_url, secret_key=self.test_eyepop_secret_key,
+                                          account_id=self.test_eyepop_account_id, is_async=True,
+                                          completion_pollers=2) as endpoint:
+            endpoint.vlm_api_url = self.test_vlm_url
+            jobs = [await endpoint.infer_asset(f'asset_{i}', InferRequest(text_prompt='?')) for i in range(6)]
+            results = await asyncio.gather(*[job.predict() for job in jobs])
+
+        self.assertEqual(results, [{'source_width': 1, 'source_height': 1}] * 6)
+        self.assertEqual(sorted(num_polls.values()), [3] * 6)
+        self.assertLessEqual(max_open_polls, 2)
+        self.assertIn('1', poll_timeouts)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+import json
+import re
+import unittest
+
+import aiohttp
+import pyarrow as pa
+from aioresponses import CallbackResult, aioresponses
+
+from eyepop import EyePopSdk
+from eyepop.data.arrow.eyepop.assets import eyepop_assets_from_table
+from eyepop.data.data_types import PredictedClass, Prediction, UserReview
+from tests.data.base_endpoint_test import BaseEndpointTest
+
+TEST_PREDICTIONS = (Prediction(source_width=1.0, source_height=1.0,
+                               classes=[PredictedClass(classLabel='test', confidence=1.0)]),)
+
+
+class TestEndpointAnnotationsBatch(BaseEndpointTest):
+
+    def setup_annotations_mock(self, mock: aioresponses):
+        self.setup_base_mock(mock)
+        mock.post(f'{self.test_eyepop_url}/authentication/token', status=200, body=json.dumps(
+            {'expires_in': 1000 * 1000, 'token_type': 'Bearer', 'access_token': self.test_access_token}), repeat=True)
+        self.requests: list[tuple[str, str]] = []
+
+        def annotations(url, method='POST', **kwargs) -> CallbackResult:
+            asset_uuid = str(url).split('/assets/')[1].split('/')[0]
+            self.requests.append((method, asset_uuid))
+            if asset_uuid == 'asset_bad':
+                return CallbackResult(status=400, reason='test failure')
+            return CallbackResult(status=204)
+
+        annotations_url = re.compile(rf'^{re.escape(self.test_data_url)}/assets/[^/]+/annotations\?.*$')
+        mock.post(annotations_url, callback=annotations, repeat=True)
+        mock.patch(annotations_url, callback=lambda url, **kwargs: annotations(url, method='PATCH', **kwargs),
+                   repeat=True)
+
+    @aioresponses()
+    def test_add_asset_annotations(self, mock: aioresponses):
+        self.setup_annotations_mock(mock)
+        with EyePopSdk.dataEndpoint(eyepop_url=self.test_eyepop_url, secret_key=self.test_eyepop_secret_key,
+                                    account_id=self.test_eyepop_account_id) as endpoint:
+            results = endpoint.add_asset_annotations(
+                {asset_uuid: TEST_PREDICTIONS for asset_uuid in ('asset_0', 'asset_bad', 'asset_1')},
+                auto_annotate='ep_coco', source='test', concurrency=2)
+
+        self.assertEqual(list(results.keys()), ['asset_0', 'asset_bad', 'asset_1'])
+        self.assertIsNone(results['asset_0'])
+        self.assertIsNone(results['asset_1'])
+        self.assertIsInstance(results['asset_bad'], aiohttp.ClientResponseError)
+        self.assertEqual(sorted(self.requests), [('POST', 'asset_0'), ('POST', 'asset_1'), ('POST', 'asset_bad')])
+
+    @aioresponses()
+    def test_update_asset_annotation_approvals(self, mock: aioresponses):
+        self.setup_annotations_mock(mock)
+        with EyePopSdk.dataEndpoint(eyepop_url=self.test_eyepop_url, secret_key=self.test_eyepop_secret_key,
+                                    account_id=self.test_eyepop_account_id) as endpoint:
+            results = endpoint.update_asset_annotation_approvals(
+                ['asset_bad', 'asset_0'], source='test', user_review=UserReview.approved)
+
+        self.assertIsNone(results['asset_0'])
+        self.assertIsInstance(results['asset_bad'], aiohttp.ClientResponseError)
+        self.assertEqual(sorted(self.requests), [('PATCH', 'asset_0'), ('PATCH', 'asset_bad')])
+
+    @aioresponses()
+    def test_add_asset_annotations_import(self, mock: aioresponses):
+        self.setup_base_mock(mock)
+        mock.post(f'{self.test_eyepop_url}/authentication/token', status=200, body=json.dumps(
+            {'expires_in': 1000 * 1000, 'token_type': 'Bearer', 'access_token': self.test_access_token}), repeat=True)
+        imported = []
+
+        async def import_assets(url, **kwargs) -> CallbackResult:
+            body = b''.join([chunk async for chunk in kwargs['data']])
+            imported.extend(eyepop_assets_from_table(pa.ipc.open_stream(body).read_all()))
+            return CallbackResult(status=204)
+
+        mock.post(re.compile(rf'^{re.escape(self.test_data_url)}/imports/assets\?.*$'), callback=import_assets)
+        with EyePopSdk.dataEndpoint(eyepop_url=self.test_eyepop_url, secret_key=self.test_eyepop_secret_key,
+                                    account_id=self.test_eyepop_account_id) as endpoint:
+            results = endpoint.add_asset_annotations(
+                {'asset_0': TEST_PREDICTIONS, 'asset_1': TEST_PREDICTIONS},
+                source='test', dataset_uuid=self.test_dataset_id, use_import=True)
+
+        self.assertEqual(results, {'asset_0': None, 'asset_1': None})
+        self.assertEqual([asset.uuid for asset in imported], ['asset_0', 'asset_1'])
+        self.assertEqual(imported[0].annotations[0].source, 'test')
+        self.assertEqual(imported[0].annotations[0].predictions[0].classes[0].classLabel, 'test')
+
+
+if __name__ == '__main__':
+    unittest.main()
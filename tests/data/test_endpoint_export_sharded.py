@@ -0,0 +1,115 @@
+import io
+import json
+import os
+import re
+import tempfile
+import unittest
+
+import aiohttp
+import pyarrow as pa
+import pyarrow.parquet as pq
+from aioresponses import CallbackResult, aioresponses
+from yarl import URL
+
+from eyepop import EyePopSdk
+from eyepop.data.data_export import (
+    ExportFileFormat,
+    ExportShardStatus,
+    read_arrow_table,
+    read_manifest,
+)
+from tests.data.base_endpoint_test import BaseEndpointTest
+
+TEST_ASSET_UUIDS = [f'asset_{i}' for i in range(5)]
+
+
+def arrow_file_bytes(asset_uuids: list[str]) -> bytes:
+    table = pa.table({'uuid': pa.array(asset_uuids, type=pa.string())})
+    buffer = io.BytesIO()
+    with pa.ipc.new_file(buffer, table.schema) as writer:
+        writer.write_table(table)
+    return buffer.getvalue()
+
+
+class TestEndpointExportSharded(BaseEndpointTest):
+
+    def setup_export_mock(self, mock: aioresponses, fail_shard_with: str | None = None):
+        self.setup_base_mock(mock)
+        mock.post(f'{self.test_eyepop_url}/authentication/token', status=200, body=json.dumps(
+            {'expires_in': 1000 * 1000, 'token_type': 'Bearer', 'access_token': self.test_access_token}), repeat=True)
+        mock.get(re.compile(rf'^{re.escape(self.test_data_url)}/assets\?.*$'), status=200, repeat=True,
+                 body=json.dumps([{'uuid': asset_uuid} for asset_uuid in reversed(TEST_ASSET_UUIDS)]))
+        self.exported_shards: list[list[str]] = []
+
+        def export(url, **kwargs) -> CallbackResult:
+            asset_uuids = URL(url).query.getall('asset_uuid')
+            if fail_shard_with is not None and fail_shard_with in asset_uuids:
+                return CallbackResult(status=400, reason='test failure')
+            self.exported_shards.append(asset_uuids)
+            return CallbackResult(status=200, body=arrow_file_bytes(asset_uuids))
+
+        mock.get(re.compile(rf'^{re.escape(self.test_data_url)}/exports/assets\?.*$'), callback=export, repeat=True)
+
+    @aioresponses()
+    def test_export_sharded_arrow(self, mock: aioresponses):
+        self.setup_export_mock(mock)
+        with tempfile.TemporaryDirectory() as output_dir:
+            with EyePopSdk.dataEndpoint(eyepop_url=self.test_eyepop_url, secret_key=self.test_eyepop_secret_key,
+                                        account_id=self.test_eyepop_account_id) as endpoint:
+                manifest = endpoint.export_assets_sharded(output_dir, self.test_dataset_id, shard_size=2)
+
+            self.assertTrue(manifest.completed)
+            self.assertEqual(len(manifest.shards), 3)
+            self.assertEqual(sorted(map(sorted, self.exported_shards)),
+                             [['asset_0', 'asset_1'], ['asset_2', 'asset_3'], ['asset_4']])
+            exported = []
+            for path in manifest.shard_paths(output_dir):
+                exported.extend(read_arrow_table(path).column('uuid').to_pylist())
+            self.assertEqual(exported, TEST_ASSET_UUIDS)
+            self.assertEqual(read_manifest(output_dir), manifest)
+
+    @aioresponses()
+    def test_export_sharded_resume(self, mock: aioresponses):
+        self.setup_export_mock(mock, fail_shard_with='asset_2')
+        with tempfile.TemporaryDirectory() as output_dir:
+            with EyePopSdk.dataEndpoint(eyepop_url=self.test_eyepop_url, secret_key=self.test_eyepop_secret_key,
+                                        account_id=self.test_eyepop_account_id) as endpoint:
+                with self.assertRaises(aiohttp.ClientResponseError):
+                    endpoint.export_assets_sharded(output_dir, self.test_dataset_id, shard_size=2,
+                                                   file_format=ExportFileFormat.parquet)
+
+            manifest = read_manifest(output_dir)
+            self.assertEqual([shard.status for shard in manifest.shards],
+                             [ExportShardStatus.completed, ExportShardStatus.failed, ExportShardStatus.completed])
+
+            self.setup_export_mock(mock)
+            with EyePopSdk.dataEndpoint(eyepop_url=self.test_eyepop_url, secret_key=self.test_eyepop_secret_key,
+                                        account_id=self.test_eyepop_account_id) as endpoint:
+                manifest = endpoint.export_assets_sharded(output_dir, self.test_dataset_id, shard_size=2,
+                                                          file_format=ExportFileFormat.parquet)
+
+            self.assertTrue(manifest.completed)
+            self.assertEqual(self.exported_shards, [['asset_2', 'asset_3']])
+            self.assertEqual(pq.read_table(os.path.join(output_dir, manifest.shards[1].file_name))
+                             .column('uuid').to_pylist(), ['asset_2', 'asset_3'])
+
+    @aioresponses()
+    def test_export_sharded_filters_changed(self, mock: aioresponses):
+        self.setup_export_mock(mock)
+        with tempfile.TemporaryDirectory() as output_dir:
+            with EyePopSdk.dataEndpoint(eyepop_url=self.test_eyepop_url, secret_key=self.test_eyepop_secret_key,
+                                        account_id=self.test_eyepop_account_id) as endpoint:
+                endpoint.export_assets_sharded(output_dir, self.test_dataset_id, shard_size=2)
+                self.exported_shards.clear()
+                endpoint.export_assets_sharded(output_dir, self.test_dataset_id, shard_size=2)
+                self.assertEqual(self.exported_shards, [])
+                manifest = endpoint.export_assets_sharded(output_dir, self.test_dataset_id, shard_size=2,
+                                                          include_external_ids=True)
+
+            self.assertTrue(manifest.completed)
+            self.assertEqual(len(self.exported_shards), 3)
+            self.assertTrue(read_manifest(output_dir).filters['include_external_ids'])
+
+
+if __name__ == '__main__':
+    unittest.main()
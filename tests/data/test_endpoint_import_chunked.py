@@ -0,0 +1,91 @@
+import asyncio
+import json
+import os
+import re
+import tempfile
+import unittest
+
+import aiohttp
+import pyarrow as pa
+import pyarrow.parquet as pq
+from aioresponses import CallbackResult, aioresponses
+
+from eyepop import EyePopSdk
+from tests.data.base_endpoint_test import BaseEndpointTest
+
+TEST_TABLE = pa.table({'uuid': pa.array([f'asset_{i}' for i in range(10)], type=pa.string())})
+
+
+class TestEndpointImportChunked(BaseEndpointTest):
+
+    def setup_import_mock(self, mock: aioresponses, fail_chunk_with: str | None = None):
+        self.setup_base_mock(mock)
+        mock.post(f'{self.test_eyepop_url}/authentication/token', status=200, body=json.dumps(
+            {'expires_in': 1000 * 1000, 'token_type': 'Bearer', 'access_token': self.test_access_token}), repeat=True)
+        self.imported_chunks: list[list[str]] = []
+
+        def import_chunk(url, **kwargs) -> CallbackResult:
+            asset_uuids = pa.ipc.open_stream(kwargs['data']).read_all().column('uuid').to_pylist()
+            if fail_chunk_with is not None and fail_chunk_with in asset_uuids:
+                return CallbackResult(status=400, reason='test failure')
+            self.imported_chunks.append(asset_uuids)
+            return CallbackResult(status=204)
+
+        import_url = re.compile(rf'^{re.escape(self.test_data_url)}/imports/assets\?.*$')
+        mock.post(import_url, exception=aiohttp.ServerDisconnectedError())
+        mock.post(import_url, callback=import_chunk, repeat=True)
+
+    @aioresponses()
+    def test_import_chunked_table(self, mock: aioresponses):
+        self.setup_import_mock(mock, fail_chunk_with='asset_5')
+        progress = []
+        with EyePopSdk.dataEndpoint(eyepop_url=self.test_eyepop_url, secret_key=self.test_eyepop_secret_key,
+                                    account_id=self.test_eyepop_account_id) as endpoint:
+            result = endpoint.import_assets_chunked(TEST_TABLE, dataset_uuid=self.test_dataset_id,
+                                                    max_chunk_rows=4, callback=progress.append)
+
+        self.assertEqual(result.num_chunks, 3)
+        self.assertEqual(result.num_rows, 6)
+        self.assertEqual(sorted(progress), [2, 4])
+        self.assertEqual(len(result.failed_chunks), 1)
+        self.assertEqual((result.failed_chunks[0].index, result.failed_chunks[0].row_offset,
+                          result.failed_chunks[0].num_rows), (1, 4, 4))
+        self.assertEqual(sorted(map(sorted, self.imported_chunks)),
+                         [['asset_0', 'asset_1', 'asset_2', 'asset_3'], ['asset_8', 'asset_9']])
+
+    @aioresponses()
+    def test_import_chunked_parquet(self, mock: aioresponses):
+        self.setup_import_mock(mock)
+        with tempfile.TemporaryDirectory() as source_dir:
+            pq.write_table(TEST_TABLE.slice(0, 5), os.path.join(source_dir, 'part-0.parquet'))
+            pq.write_table(TEST_TABLE.slice(5), os.path.join(source_dir, 'part-1.parquet'))
+            with EyePopSdk.dataEndpoint(eyepop_url=self.test_eyepop_url, secret_key=self.test_eyepop_secret_key,
+                                        account_id=self.test_eyepop_account_id) as endpoint:
+                result = endpoint.import_assets_chunked(source_dir, dataset_uuid=self.test_dataset_id,
+                                                        max_chunk_rows=3, concurrency=2)
+
+        self.assertEqual(result.failed_chunks, [])
+        self.assertEqual(result.num_rows, 10)
+        self.assertTrue(all(len(chunk) <= 3 for chunk in self.imported_chunks))
+        self.assertEqual(sorted(sum(self.imported_chunks, [])), sorted(TEST_TABLE.column('uuid').to_pylist()))
+
+    @aioresponses()
+    async def test_import_chunked_source_error(self, mock: aioresponses):
+        self.setup_import_mock(mock)
+        with tempfile.TemporaryDirectory() as source_dir:
+            pq.write_table(TEST_TABLE, os.path.join(source_dir, 'part-0.parquet'))
+            with open(os.path.join(source_dir, 'part-1.parquet'), 'wb') as f:
+                f.write(b'not parquet')
+            async with EyePopSdk.dataEndpoint(eyepop_url=self.test_eyepop_url,
+                                              secret_key=self.test_eyepop_secret_key,
+                                              account_id=self.test_eyepop_account_id, is_async=True) as endpoint:
+                with self.assertRaises(pa.ArrowInvalid):
+                    await endpoint.import_assets_chunked(source_dir, dataset_uuid=self.test_dataset_id,
+                                                         max_chunk_rows=3, concurrency=2)
+                in_flight = [task for task in asyncio.all_tasks()
+                             if task.get_coro().__qualname__.endswith('import_chunk')]  # type: ignore[union-attr]
+                self.assertEqual(in_flight, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
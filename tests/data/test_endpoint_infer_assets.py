@@ -0,0 +1,78 @@
+import json
+import unittest
+
+import aiohttp
+from aioresponses import CallbackResult, aioresponses
+
+from eyepop import EyePopSdk
+from eyepop.data.data_types import InferRequest
+from tests.data.base_endpoint_test import BaseEndpointTest
+
+
+class TestEndpointInferAssets(BaseEndpointTest):
+    test_vlm_url = 'http://example-vlm.test'
+
+    def setup_infer_mock(self, mock: aioresponses, fail_asset_uuids: set[str],
+                         throttle_asset_uuids: set[str] | None = None):
+        throttle_asset_uuids = set(throttle_asset_uuids or ())
+        self.setup_base_mock(mock)
+        mock.post(f'{self.test_eyepop_url}/authentication/token', status=200, body=json.dumps(
+            {'expires_in': 1000 * 1000, 'token_type': 'Bearer', 'access_token': self.test_access_token}), repeat=True)
+        self.num_posts = 0
+
+        def post_infer(url, **kwargs) -> CallbackResult:
+            self.num_posts += 1
+            infer_request = json.loads(kwargs['data']._parts[0][0]._value)
+            asset_uuid = infer_request['url'].split('/')[-1].split('?')[0]
+            if asset_uuid in fail_asset_uuids:
+                return CallbackResult(status=400, reason='test bad asset')
+            if asset_uuid in throttle_asset_uuids:
+                throttle_asset_uuids.discard(asset_uuid)
+                return CallbackResult(status=429, reason='test throttled')
+            return CallbackResult(status=200, body=json.dumps({
+                'raw_output': asset_uuid,
+                'predictions': [{'source_width': 1, 'source_height': 1}],
+                'run_info': {'total_tokens': 10, 'visual_tokens': 8, 'text_tokens': 2, 'output_tokens': 1},
+            }))
+
+        mock.post(f'{self.test_vlm_url}/api/v1/infer?timeout=20', callback=post_infer, repeat=True)
+
+    @aioresponses()
+    async def test_infer_assets_async(self, mock: aioresponses):
+        self.setup_infer_mock(mock, fail_asset_uuids={'asset_3'}, throttle_asset_uuids={'asset_4'})
+        async with EyePopSdk.dataEndpoint(eyepop_url=self.test_eyepop_url, secret_key=self.test_eyepop_secret_key,
+                                          account_id=self.test_eyepop_account_id, is_async=True) as endpoint:
+            endpoint.vlm_api_url = self.test_vlm_url
+            job = await endpoint.infer_assets((f'asset_{i}' for i in range(6)), InferRequest(text_prompt='?'),
+                                              concurrency=2, max_retries=2)
+            results = {result.asset_uuid: result async for result in job}
+
+        self.assertEqual(len(results), 6)
+        self.assertIsNotNone(results['asset_3'].error)
+        self.assertIsNone(results['asset_3'].predictions)
+        self.assertEqual(results['asset_5'].raw_output, 'asset_5')
+        self.assertEqual(len(results['asset_5'].predictions), 1)
+        self.assertEqual(results['asset_4'].raw_output, 'asset_4')
+        self.assertEqual(self.num_posts, 7)
+        self.assertEqual(job.usage.num_assets, 6)
+        self.assertEqual(job.usage.num_failed, 1)
+        self.assertEqual(job.usage.num_retries, 1)
+        self.assertEqual(job.usage.total_tokens, 50)
+        self.assertEqual(job.usage.output_tokens, 5)
+
+    @aioresponses()
+    def test_infer_assets_sync(self, mock: aioresponses):
+        self.setup_infer_mock(mock, fail_asset_uuids=set())
+        mock.post(f'{self.test_vlm_url}/api/v1/infer?timeout=20', exception=aiohttp.ServerDisconnectedError())
+        with EyePopSdk.dataEndpoint(eyepop_url=self.test_eyepop_url, secret_key=self.test_eyepop_secret_key,
+                                    account_id=self.test_eyepop_account_id) as endpoint:
+            endpoint.endpoint.vlm_api_url = self.test_vlm_url
+            job = endpoint.infer_assets(['asset_0', 'asset_1'], InferRequest(text_prompt='?'))
+            results = sorted(job, key=lambda result: result.asset_uuid)
+
+        self.assertEqual([result.raw_output for result in results], ['asset_0', 'asset_1'])
+        self.assertEqual(job.usage.visual_tokens, 16)
+
+
+if __name__ == '__main__':
+    unittest.main()
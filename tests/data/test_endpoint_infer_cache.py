@@ -0,0 +1,91 @@
+import json
+import tempfile
+import unittest
+
+from aioresponses import CallbackResult, aioresponses
+
+from eyepop import EyePopSdk
+from eyepop.data.data_infer_cache import DiskInferCache, InferCache, MemoryInferCache
+from eyepop.data.data_types import InferRequest
+from tests.data.base_endpoint_test import BaseEndpointTest
+
+
+class TestEndpointInferCache(BaseEndpointTest):
+    test_vlm_url = 'http://example-vlm.test'
+
+    def setup_infer_mock(self, mock: aioresponses):
+        self.setup_base_mock(mock)
+        mock.post(f'{self.test_eyepop_url}/authentication/token', status=200, body=json.dumps(
+            {'expires_in': 1000 * 1000, 'token_type': 'Bearer', 'access_token': self.test_access_token}), repeat=True)
+        self.num_posts = 0
+
+        def post_infer(url, **kwargs) -> CallbackResult:
+            self.num_posts += 1
+            return CallbackResult(status=200, body=json.dumps({
+                'raw_output': str(self.num_posts),
+                'predictions': [{'source_width': 1, 'source_height': 1, 'source_id': str(self.num_posts)}],
+                'run_info': {'total_tokens': 10},
+            }))
+
+        mock.post(f'{self.test_vlm_url}/api/v1/infer?timeout=20', callback=post_infer, repeat=True)
+
+    async def infer(self, infer_cache: InferCache, requests: list[tuple[str, InferRequest]]) -> list[str]:
+        async with EyePopSdk.dataEndpoint(eyepop_url=self.test_eyepop_url, secret_key=self.test_eyepop_secret_key,
+                                          account_id=self.test_eyepop_account_id, is_async=True,
+                                          infer_cache=infer_cache) as endpoint:
+            endpoint.vlm_api_url = self.test_vlm_url
+            results = []
+            for asset_uuid, infer_request in requests:
+                job = await endpoint.infer_asset(asset_uuid, infer_request)
+                results.append((await job.predict())['source_id'])
+            return results
+
+    @aioresponses()
+    async def test_memory_cache(self, mock: aioresponses):
+        self.setup_infer_mock(mock)
+        cache = MemoryInferCache()
+        results = await self.infer(cache, [
+            ('asset_0', InferRequest(text_prompt='a')),
+            ('asset_0', InferRequest(text_prompt='a')),
+            ('asset_0', InferRequest(text_prompt='b')),
+            ('asset_1', InferRequest(text_prompt='a')),
+            ('asset_0', InferRequest(text_prompt='a', refresh=True)),
+            ('asset_0', InferRequest(text_prompt='a')),
+        ])
+        self.assertEqual(results, ['1', '1', '2', '3', '4', '4'])
+        self.assertEqual(self.num_posts, 4)
+        self.assertEqual(cache.hits, 2)
+        self.assertEqual(len(cache), 3)
+
+    @aioresponses()
+    async def test_disk_cache(self, mock: aioresponses):
+        self.setup_infer_mock(mock)
+        with tempfile.TemporaryDirectory() as directory:
+            first = await self.infer(DiskInferCache(directory), [('asset_0', InferRequest(text_prompt='a'))])
+            second_cache = DiskInferCache(directory)
+            second = await self.infer(second_cache, [('asset_0', InferRequest(text_prompt='a'))])
+
+        self.assertEqual(first, second)
+        self.assertEqual(self.num_posts, 1)
+        self.assertEqual(second_cache.hits, 1)
+
+    @aioresponses()
+    async def test_cache_hits_spend_no_tokens(self, mock: aioresponses):
+        self.setup_infer_mock(mock)
+        async with EyePopSdk.dataEndpoint(eyepop_url=self.test_eyepop_url, secret_key=self.test_eyepop_secret_key,
+                                          account_id=self.test_eyepop_account_id, is_async=True,
+                                          infer_cache=MemoryInferCache()) as endpoint:
+            endpoint.vlm_api_url = self.test_vlm_url
+            job = await endpoint.infer_assets(['asset_0', 'asset_0', 'asset_1'], InferRequest(text_prompt='a'),
+                                              concurrency=1)
+            results = [result async for result in job]
+
+        self.assertEqual([result.cached for result in results], [False, True, False])
+        self.assertEqual(self.num_posts, 2)
+        self.assertEqual(job.usage.num_assets, 3)
+        self.assertEqual(job.usage.num_cached, 1)
+        self.assertEqual(job.usage.total_tokens, 20)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+import json
+import re
+import unittest
+
+import pyarrow as pa
+from aioresponses import CallbackResult, aioresponses
+from yarl import URL
+
+from eyepop import EyePopSdk
+from eyepop.data.data_types import Asset, AssetResultFormat
+from tests.data.base_endpoint_test import BaseEndpointTest
+
+
+class TestEndpointIterAssets(BaseEndpointTest):
+
+    def setup_assets_mock(self, mock: aioresponses, num_assets: int, paging: bool = True):
+        self.setup_base_mock(mock)
+        mock.post(f'{self.test_eyepop_url}/authentication/token', status=200, body=json.dumps(
+            {'expires_in': 1000 * 1000, 'token_type': 'Bearer', 'access_token': self.test_access_token}), repeat=True)
+        assets = [{'uuid': f'asset_{i}', 'external_id': f'external_{i}'} for i in range(num_assets)]
+        self.requested_pages: list[tuple[int, int]] = []
+
+        def list_assets(url, **kwargs) -> CallbackResult:
+            offset, limit = int(URL(url).query['offset']), int(URL(url).query['limit'])
+            self.requested_pages.append((offset, limit))
+            page = assets[offset:offset + limit] if paging else assets
+            return CallbackResult(status=200, body=json.dumps(page))
+
+        mock.get(re.compile(rf'^{re.escape(self.test_data_url)}/assets\?.*$'), callback=list_assets, repeat=True)
+
+    @aioresponses()
+    def test_iter_assets_pages(self, mock: aioresponses):
+        self.setup_assets_mock(mock, num_assets=5)
+        with EyePopSdk.dataEndpoint(eyepop_url=self.test_eyepop_url, secret_key=self.test_eyepop_secret_key,
+                                    account_id=self.test_eyepop_account_id) as endpoint:
+            assets = list(endpoint.iter_assets(self.test_dataset_id, page_size=2))
+
+        self.assertTrue(all(isinstance(asset, Asset) for asset in assets))
+        self.assertEqual([asset.uuid for asset in assets], [f'asset_{i}' for i in range(5)])
+        self.assertEqual(self.requested_pages, [(0, 2), (2, 2), (4, 2)])
+
+    @aioresponses()
+    def test_iter_assets_formats(self, mock: aioresponses):
+        self.setup_assets_mock(mock, num_assets=4)
+        with EyePopSdk.dataEndpoint(eyepop_url=self.test_eyepop_url, secret_key=self.test_eyepop_secret_key,
+                                    account_id=self.test_eyepop_account_id) as endpoint:
+            dicts = list(endpoint.iter_assets(self.test_dataset_id, page_size=3,
+                                              result_format=AssetResultFormat.dict))
+            batches = list(endpoint.iter_assets(self.test_dataset_id, page_size=3,
+                                                result_format=AssetResultFormat.arrow))
+
+        self.assertEqual(dicts[3], {'uuid': 'asset_3', 'external_id': 'external_3'})
+        self.assertEqual([batch.num_rows for batch in batches], [3, 1])
+        self.assertEqual(pa.Table.from_batches(batches).column('external_id').to_pylist(),
+                         [f'external_{i}' for i in range(4)])
+
+    @aioresponses()
+    def test_iter_assets_without_server_paging(self, mock: aioresponses):
+        self.setup_assets_mock(mock, num_assets=2, paging=False)
+        with EyePopSdk.dataEndpoint(eyepop_url=self.test_eyepop_url, secret_key=self.test_eyepop_secret_key,
+                                    account_id=self.test_eyepop_account_id) as endpoint:
+            small_pages = list(endpoint.iter_assets(self.test_dataset_id, page_size=1))
+            exact_pages = list(endpoint.iter_assets(self.test_dataset_id, page_size=2))
+
+        self.assertEqual([asset.uuid for asset in small_pages], ['asset_0', 'asset_1'])
+        self.assertEqual([asset.uuid for asset in exact_pages], ['asset_0', 'asset_1'])
+        self.assertEqual(self.requested_pages, [(0, 1), (0, 2), (2, 2)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+import json
+import re
+import unittest
+
+from aioresponses import CallbackResult, aioresponses
+
+from eyepop import EyePopSdk
+from eyepop.data.data_cache import MISSING, MetadataCache, dataset_tag
+from eyepop.data.data_types import ChangeEvent, ChangeType, DatasetUpdate
+from tests.data.base_endpoint_test import BaseEndpointTest
+
+
+def change_event(change_type: ChangeType, dataset_uuid: str | None = None, mdl_uuid: str | None = None) -> ChangeEvent:
+    return ChangeEvent(change_type=change_type, account_uuid='test_account_id', dataset_uuid=dataset_uuid,
+                       dataset_version=None, asset_uuid=None, mdl_uuid=mdl_uuid, workflow_id=None, message=None,
+                       workflow_task_name=None)
+
+
+class TestMetadataCache(unittest.TestCase):
+
+    def test_ttl_and_tags(self):
+        cache = MetadataCache(ttl_secs=60.0)
+        cache.put('a', 1, [dataset_tag('d1')], cache.generation)
+        cache.put('b', 2, [dataset_tag('d2')], cache.generation)
+        self.assertEqual(cache.get('a'), 1)
+
+        cache.on_change_event(change_event(ChangeType.dataset_modified, dataset_uuid='d1'))
+        self.assertIs(cache.get('a'), MISSING)
+        self.assertEqual(cache.get('b'), 2)
+
+        expired = MetadataCache(ttl_secs=-1.0)
+        expired.put('a', 1, [], expired.generation)
+        self.assertIs(expired.get('a'), MISSING)
+
+    def test_put_after_invalidation_is_dropped(self):
+        cache = MetadataCache(ttl_secs=60.0)
+        generation = cache.generation
+        cache.invalidate(dataset_tag('d1'))
+        cache.put('stale', 1, [dataset_tag('d1')], generation)
+        cache.put('unrelated', 2, [dataset_tag('d2')], generation)
+        self.assertIs(cache.get('stale'), MISSING)
+        self.assertEqual(cache.get('unrelated'), 2)
+
+        cache.on_change_event(change_event(ChangeType.events_lost))
+        self.assertEqual(len(cache), 0)
+
+    def test_max_entries(self):
+        cache = MetadataCache(ttl_secs=60.0, max_entries=2)
+        for key in ('a', 'b', 'c'):
+            cache.put(key, key, [], cache.generation)
+        self.assertIs(cache.get('a'), MISSING)
+        self.assertEqual(cache.get('c'), 'c')
+
+
+class TestEndpointMetadataCache(BaseEndpointTest):
+
+    @aioresponses()
+    async def test_get_dataset_cached(self, mock: aioresponses):
+        self.setup_base_mock(mock)
+        mock.post(f'{self.test_eyepop_url}/authentication/token', status=200, body=json.dumps(
+            {'expires_in': 1000 * 1000, 'token_type': 'Bearer', 'access_token': self.test_access_token}), repeat=True)
+        num_gets = 0
+
+        def get_dataset(url, **kwargs) -> CallbackResult:
+            nonlocal num_gets
+            num_gets += 1
+            return CallbackResult(status=200, body=self.test_dataset.model_dump_json())
+
+        mock.get(re.compile(rf'^{re.escape(self.test_data_url)}/datasets/{self.test_dataset_id}\?.*$'),
+                 callback=get_dataset, repeat=True)
+        mock.patch(re.compile(rf'^{re.escape(self.test_data_url)}/datasets/{self.test_dataset_id}\?.*$'),
+                   status=200, body=self.test_dataset.model_dump_json())
+
+        async with EyePopSdk.dataEndpoint(eyepop_url=self.test_eyepop_url, secret_key=self.test_eyepop_secret_key,
+                                          account_id=self.test_eyepop_account_id, is_async=True,
+                                          metadata_cache_ttl_secs=60.0) as endpoint:
+            await endpoint.get_dataset(self.test_dataset_id)
+            await endpoint.get_dataset(self.test_dataset_id)
+            self.assertEqual(num_gets, 1)
+
+            await endpoint._dispatch_change_event(
+                change_event(ChangeType.dataset_modified, dataset_uuid=self.test_dataset_id))
+            await endpoint.get_dataset(self.test_dataset_id)
+            self.assertEqual(num_gets, 2)
+
+            await endpoint.update_dataset(self.test_dataset_id, DatasetUpdate(name='updated'))
+            await endpoint.get_dataset(self.test_dataset_id)
+            self.assertEqual(num_gets, 3)
+            self.assertEqual(endpoint.metadata_cache.hits, 1)
+
+        async with EyePopSdk.dataEndpoint(eyepop_url=self.test_eyepop_url, secret_key=self.test_eyepop_secret_key,
+                                          account_id=self.test_eyepop_account_id, is_async=True) as endpoint:
+            self.assertIsNone(endpoint.metadata_cache)
+            await endpoint.get_dataset(self.test_dataset_id)
+            await endpoint.get_dataset(self.test_dataset_id)
+            self.assertEqual(num_gets, 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+import hashlib
+import json
+import os
+import re
+import tempfile
+import unittest
+
+import aiohttp
+from aioresponses import CallbackResult, aioresponses
+from yarl import URL
+
+from eyepop import EyePopSdk
+from eyepop.data.data_upload import read_upload_journal
+from tests.data.base_endpoint_test import BaseEndpointTest
+
+
+def sha256(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()
+
+
+class TestEndpointUploadAssets(BaseEndpointTest):
+
+    @aioresponses()
+    def test_upload_assets_dedup_and_resume(self, mock: aioresponses):
+        self.setup_base_mock(mock)
+        mock.post(f'{self.test_eyepop_url}/authentication/token', status=200, body=json.dumps(
+            {'expires_in': 1000 * 1000, 'token_type': 'Bearer', 'access_token': self.test_access_token}), repeat=True)
+        mock.get(re.compile(rf'^{re.escape(self.test_data_url)}/assets\?.*$'), status=200, repeat=True,
+                 body=json.dumps([{'uuid': 'existing', 'external_id': sha256(b'in dataset')}]))
+        uploaded_external_ids = []
+
+        def upload(url, **kwargs) -> CallbackResult:
+            external_id = URL(url).query['external_id']
+            uploaded_external_ids.append(external_id)
+            return CallbackResult(status=200, body=json.dumps({'uuid': f'uuid_{external_id[:8]}'}))
+
+        upload_url = re.compile(rf'^{re.escape(self.test_data_url)}/assets\?.*$')
+        mock.post(upload_url, exception=aiohttp.ServerDisconnectedError())
+        mock.post(upload_url, callback=upload, repeat=True)
+
+        with tempfile.TemporaryDirectory() as source_dir:
+            contents = {'new.jpg': b'new', 'copy.jpg': b'new', 'dataset.jpg': b'in dataset',
+                        'journaled.jpg': b'journaled', 'other.png': b'other'}
+            paths = []
+            for file_name, content in contents.items():
+                paths.append(os.path.join(source_dir, file_name))
+                with open(paths[-1], 'wb') as f:
+                    f.write(content)
+            journal_path = os.path.join(source_dir, 'journal.jsonl')
+            with open(journal_path, 'w') as f:
+                f.write(json.dumps({'path': 'x', 'external_id': sha256(b'journaled'), 'asset_uuid': 'j'}) + '\n')
+                f.write('{"path": "trunc')
+
+            with EyePopSdk.dataEndpoint(eyepop_url=self.test_eyepop_url, secret_key=self.test_eyepop_secret_key,
+                                        account_id=self.test_eyepop_account_id) as endpoint:
+                result = endpoint.upload_assets(paths, dataset_uuid=self.test_dataset_id,
+                                                journal_path=journal_path, concurrency=2, dedup_by_hash=True)
+
+            self.assertEqual(result.num_failed, 0)
+            self.assertEqual(result.num_uploaded, 2)
+            self.assertEqual(result.num_skipped, 3)
+            self.assertEqual(sorted(uploaded_external_ids), sorted([sha256(b'new'), sha256(b'other')]))
+            self.assertEqual(read_upload_journal(journal_path), {
+                sha256(b'journaled'): 'j',
+                sha256(b'new'): f'uuid_{sha256(b"new")[:8]}',
+                sha256(b'other'): f'uuid_{sha256(b"other")[:8]}',
+            })
+
+    @aioresponses()
+    def test_upload_assets_keeps_external_ids(self, mock: aioresponses):
+        self.setup_base_mock(mock)
+        mock.post(f'{self.test_eyepop_url}/authentication/token', status=200, body=json.dumps(
+            {'expires_in': 1000 * 1000, 'token_type': 'Bearer', 'access_token': self.test_access_token}), repeat=True)
+        mock.get(re.compile(rf'^{re.escape(self.test_data_url)}/assets\?.*$'), status=200, repeat=True,
+                 body=json.dumps([{'uuid': 'existing', 'external_id': 'in-dataset'}]))
+        uploaded = []
+
+        def upload(url, **kwargs) -> CallbackResult:
+            uploaded.append(URL(url).query.get('external_id'))
+            return CallbackResult(status=200, body=json.dumps({'uuid': f'uuid_{len(uploaded)}'}))
+
+        mock.post(re.compile(rf'^{re.escape(self.test_data_url)}/assets\?.*$'), callback=upload, repeat=True)
+
+        with tempfile.TemporaryDirectory() as source_dir:
+            paths = []
+            for file_name in ('a.jpg', 'b.jpg', 'c.jpg'):
+                paths.append(os.path.join(source_dir, file_name))
+                with open(paths[-1], 'wb') as f:
+                    f.write(b'same content')
+            journal_path = os.path.join(source_dir, 'journal.jsonl')
+
+            with EyePopSdk.dataEndpoint(eyepop_url=self.test_eyepop_url, secret_key=self.test_eyepop_secret_key,
+                                        account_id=self.test_eyepop_account_id) as endpoint:
+                external_ids = {paths[0]: 'camera-1-a', paths[1]: 'in-dataset'}
+                result = endpoint.upload_assets(paths, dataset_uuid=self.test_dataset_id,
+                                                journal_path=journal_path, external_ids=external_ids)
+                resumed = endpoint.upload_assets(paths, dataset_uuid=self.test_dataset_id,
+                                                 journal_path=journal_path, external_ids=external_ids)
+
+        self.assertEqual(sorted(result.uploaded), [paths[0], paths[2]])
+        self.assertEqual(result.skipped, [paths[1]])
+        self.assertEqual(sorted(uploaded, key=str), sorted(['camera-1-a', None], key=str))
+        self.assertEqual(resumed.num_uploaded, 0)
+        self.assertEqual(resumed.num_skipped, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
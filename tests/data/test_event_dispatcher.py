@@ -0,0 +1,129 @@
+import asyncio
+import unittest
+
+from eyepop.data.data_endpoint import DataEndpoint
+from eyepop.data.data_events import EventDispatcher, EventOrdering, EventOverflowPolicy
+from eyepop.data.data_types import ChangeEvent, ChangeType
+
+
+def change_event(change_type: ChangeType, dataset_uuid: str | None = None, message: str | None = None) -> ChangeEvent:
+    return ChangeEvent(change_type=change_type, account_uuid='test_account_id', dataset_uuid=dataset_uuid,
+                       dataset_version=None, asset_uuid=None, mdl_uuid=None, workflow_id=None, message=message,
+                       workflow_task_name=None)
+
+
+class TestEventDispatcher(unittest.IsolatedAsyncioTestCase):
+
+    async def test_slow_handler_does_not_block(self):
+        dispatcher = EventDispatcher()
+        release = asyncio.Event()
+        fast_received = []
+
+        async def slow(_: ChangeEvent):
+            await release.wait()
+
+        async def fast(event: ChangeEvent):
+            fast_received.append(event.message)
+
+        await dispatcher.set_account_handlers((slow, fast))
+        for i in range(3):
+            await dispatcher.dispatch(change_event(ChangeType.dataset_added, message=str(i)),
+                                      to_account=True, to_dataset=False)
+        await asyncio.sleep(0.01)
+        self.assertEqual(fast_received, ['0', '1', '2'])
+        stats = {s.handler.split('.')[-1]: s for s in dispatcher.stats()}
+        self.assertEqual(stats['slow'].queued, 2)
+        self.assertEqual(stats['fast'].delivered, 3)
+
+        release.set()
+        await asyncio.sleep(0.01)
+        self.assertEqual(dispatcher.stats()[0].delivered, 3)
+        self.assertGreater(dispatcher.stats()[0].max_lag_secs, 0.0)
+        await dispatcher.close()
+
+    async def test_overflow_policies(self):
+        for policy, expected in ((EventOverflowPolicy.drop_newest, ['0', '1']),
+                                 (EventOverflowPolicy.drop_oldest, ['0', '2'])):
+            dispatcher = EventDispatcher(queue_size=1, overflow_policy=policy)
+            release = asyncio.Event()
+            received = []
+
+            async def handler(event: ChangeEvent, release: asyncio.Event = release, received: list = received):
+                await release.wait()
+                received.append(event.message)
+
+            await dispatcher.set_dataset_handlers('d', (handler,))
+            await dispatcher.dispatch(change_event(ChangeType.asset_added, 'd', '0'), to_account=False, to_dataset=True)
+            await asyncio.sleep(0)
+            for i in (1, 2):
+                await dispatcher.dispatch(change_event(ChangeType.asset_added, 'd', str(i)),
+                                          to_account=False, to_dataset=True)
+            release.set()
+            await asyncio.sleep(0.01)
+            self.assertEqual(received, expected)
+            self.assertEqual(dispatcher.stats()[0].dropped, 1)
+            await dispatcher.close()
+
+    async def test_block_delivers_more_events_than_queue_size(self):
+        dispatcher = EventDispatcher(queue_size=2)
+        received = []
+
+        async def handler(event: ChangeEvent):
+            # never yields, the lane runs empty while a producer still waits on the full queue
+            received.append(event.message)
+
+        await dispatcher.set_account_handlers((handler,))
+        for i in range(5):
+            await dispatcher.dispatch(change_event(ChangeType.dataset_added, message=str(i)),
+                                      to_account=True, to_dataset=False)
+        await asyncio.sleep(0.01)
+        self.assertEqual(received, ['0', '1', '2', '3', '4'])
+        self.assertEqual(dispatcher.stats()[0].dropped, 0)
+        await dispatcher.close()
+
+    async def test_per_dataset_ordering(self):
+        dispatcher = EventDispatcher(ordering=EventOrdering.dataset)
+        release = asyncio.Event()
+        received = []
+
+        async def handler(event: ChangeEvent):
+            if event.dataset_uuid == 'slow':
+                await release.wait()
+            received.append((event.dataset_uuid, event.message))
+
+        await dispatcher.set_account_handlers((handler,))
+        for dataset_uuid, message in (('slow', '0'), ('fast', '1'), ('slow', '2'), ('fast', '3')):
+            await dispatcher.dispatch(change_event(ChangeType.dataset_modified, dataset_uuid, message),
+                                      to_account=True, to_dataset=False)
+        await asyncio.sleep(0.01)
+        self.assertEqual(received, [('fast', '1'), ('fast', '3')])
+        release.set()
+        await asyncio.sleep(0.01)
+        self.assertEqual(received[2:], [('slow', '0'), ('slow', '2')])
+        await dispatcher.close()
+
+    async def test_endpoint_routes_account_events(self):
+        endpoint = DataEndpoint(secret_key='secret', access_token=None, eyepop_url='http://example.test',
+                                account_id='test_account_id', job_queue_length=1, request_tracer_max_buffer=1,
+                                disable_ws=False)
+        account_received = []
+        dataset_received = []
+
+        async def on_account(event: ChangeEvent):
+            account_received.append(event.change_type)
+
+        async def on_dataset(event: ChangeEvent):
+            dataset_received.append(event.change_type)
+
+        await endpoint.add_account_event_handler(on_account)
+        await endpoint.add_dataset_event_handler('d', on_dataset)
+        await endpoint._dispatch_change_event(change_event(ChangeType.dataset_modified, 'd'))
+        await endpoint._dispatch_change_event(change_event(ChangeType.asset_added, 'd'))
+        await asyncio.sleep(0.01)
+        self.assertEqual(account_received, [ChangeType.dataset_modified])
+        self.assertEqual(dataset_received, [ChangeType.dataset_modified, ChangeType.asset_added])
+        await endpoint.event_dispatcher.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import itertools
+import json
+import random
+
+import pytest
+
+from eyepop import EyePopSdk
+from eyepop.bench import Arrival, Media, arrival_gaps, main, parse_mix, run_load
+from eyepop.testing import MockServer, RouteBehavior
+
+
+def test_arrival_gaps() -> None:
+    assert list(itertools.islice(arrival_gaps(Arrival.constant, 4.0), 3)) == [0.0, 0.25, 0.25]
+    assert list(itertools.islice(arrival_gaps(Arrival.burst, 10.0, burst_size=3), 7)) == [
+        0.0, 0.0, 0.0, 0.3, 0.0, 0.0, 0.3]
+    gaps = list(itertools.islice(arrival_gaps(Arrival.poisson, 100.0, rng=random.Random(1)), 10_001))
+    assert sum(gaps) / 10_000 == pytest.approx(0.01, rel=0.05)
+
+
+def test_parse_mix() -> None:
+    assert parse_mix('image=3,url') == {'image': 3.0, 'url': 1.0}
+    with pytest.raises(ValueError, match='unknown media kind'):
+        parse_mix('audio=1')
+    with pytest.raises(ValueError, match='requires --video'):
+        Media(images=['a.jpg']).check(parse_mix('image=1,video=1'))
+
+
+async def test_run_load_counts_errors() -> None:
+    async with MockServer(routes={'source': RouteBehavior(error_rate=0.5, error_status=400)}, seed=3) as server:
+        async with EyePopSdk.async_worker(eyepop_url=server.url, secret_key='secret', pop_id='transient') as endpoint:
+            report = await run_load(endpoint, Media(images=['tests/test.jpg'], urls=['http://media.test/a.jpg']),
+                                    {'image': 1.0, 'url': 1.0}, rate=1000.0, jobs=40, seed=3)
+
+    summary = report.summary()
+    assert sum(report.submitted.values()) == 40
+    assert sum(report.completed.values()) + summary['failed'] == 40
+    assert summary['errors'] == {'HTTP 400': server.errors['source']}
+    assert report.time_to_first_result.count == sum(report.completed.values())
+    assert set(summary['time_to_first_result']) == {'p50', 'p95', 'p99'}
+
+
+def test_main_against_mock(tmp_path, capsys) -> None:
+    report_path = tmp_path / 'report.json'
+    assert main(['--mock', '--mock-frames-per-video', '3', '--url', 'http://media.test/a.mp4', '--mix', 'url',
+                 '--arrival', 'burst', '--burst-size', '5', '--rate', '500', '--jobs', '10',
+                 '--json', str(report_path)]) == 0
+    summary = json.loads(report_path.read_text())
+    assert summary['completed'] == {'url': 10}
+    assert summary['results_per_sec'] == pytest.approx(3 * summary['jobs_per_sec'])
+    assert 'time_to_first_result' in capsys.readouterr().out
+
+    assert main(['--mock', '--mix', 'video']) == 2
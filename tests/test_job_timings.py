@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import os
+
+from eyepop import EyePopSdk
+from eyepop.data.types.vlm import InferRequest
+from eyepop.jobs import JobTimings
+from eyepop.testing import MockServer, MockServerThread, RouteBehavior
+
+
+async def _drain(job) -> None:
+    while await job.predict() is not None:
+        pass
+
+
+def test_stages_of_unfinished_timings_are_none() -> None:
+    timings = JobTimings()
+    assert timings.queued_secs is None
+    assert timings.as_dict()['total_secs'] is None
+    timings.attempt_started()
+    timings.attempt_started()
+    assert timings.attempts == 2
+    timings.response_received()
+    assert timings.request_secs is not None and timings.request_secs >= 0.0
+
+
+async def test_worker_job_timings() -> None:
+    async with MockServer(routes={'source': RouteBehavior(latency_secs=0.1)}) as server:
+        async with EyePopSdk.async_worker(eyepop_url=server.url, secret_key='secret', pop_id='transient',
+                                          job_queue_length=1) as endpoint:
+            first = await endpoint.upload('tests/test.jpg')
+            second = await endpoint.upload('tests/test.jpg')
+            await _drain(first)
+            await _drain(second)
+
+    for job in (first, second):
+        timings = job.timings
+        assert timings.attempts == 1
+        assert timings.request_secs >= 0.1
+        assert timings.processing_secs >= 0.0
+        assert timings.total_secs >= timings.queued_secs + timings.request_secs + timings.processing_secs
+        assert timings.bytes_sent >= os.path.getsize('tests/test.jpg')
+        assert timings.bytes_received > 0
+    # the second job waited for the only slot of the job queue
+    assert second.timings.queued_secs >= 0.1 > first.timings.queued_secs
+
+
+async def test_infer_job_timings() -> None:
+    async with MockServer() as server:
+        async with EyePopSdk.dataEndpoint(eyepop_url=server.url, secret_key='secret', is_async=True,
+                                          disable_ws=True) as endpoint:
+            job = await endpoint.infer_asset('asset', InferRequest(text_prompt='what is it?'))
+            assert await job.predict() is not None
+
+    assert job.timings.attempts == 1
+    assert job.timings.first_result is not None
+    assert job.timings.bytes_received > 0
+
+
+def test_sync_worker_job_timings() -> None:
+    with MockServerThread(MockServer()) as server:
+        with EyePopSdk.sync_worker(eyepop_url=server.url, secret_key='secret', pop_id='transient') as endpoint:
+            job = endpoint.load_from('http://media.test/image.jpg')
+            while job.predict() is not None:
+                pass
+
+    assert job.timings.attempts == 1
+    assert job.timings.total_secs is not None
+    assert job.timings.bytes_received > 0
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+HEAVY_MODULES = ("pyarrow", "pandas", "matplotlib")
+
+
+def loaded_heavy_modules(statement: str) -> list[str]:
+    """Heavy modules in sys.modules after running `statement` in a fresh interpreter."""
+    completed = subprocess.run(
+        [sys.executable, "-c", f"import json, sys\n{statement}\n"
+                               f"print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(completed.stdout.splitlines()[-1])
+
+
+@pytest.mark.parametrize("statement", [
+    "import eyepop",
+    "from eyepop import EyePopSdk",
+    "import eyepop.worker.worker_endpoint",
+    "import eyepop.data.data_endpoint",
+    "import eyepop.data.data_syncify",
+])
+def test_import_without_heavy_modules(statement: str) -> None:
+    assert loaded_heavy_modules(statement) == []
+
+
+def test_lazy_attributes_resolve() -> None:
+    import eyepop
+    from eyepop.eyepopsdk import EyePopSdk
+    from eyepop.worker.worker_jobs import WorkerJob
+
+    assert eyepop.EyePopSdk is EyePopSdk
+    assert eyepop.Job is WorkerJob
+    assert eyepop.eyepopsdk.EyePopSdk is EyePopSdk
+    assert "Plot" in dir(eyepop)
+    with pytest.raises(AttributeError):
+        _ = eyepop.NoSuchAttribute
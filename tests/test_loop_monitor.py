@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from unittest import mock
+
+from eyepop import EyePopSdk
+from eyepop.loop_monitor import LoopLagMonitor, call_site
+from eyepop.settings import settings
+from eyepop.testing import MockServer
+from eyepop.worker import worker_jobs
+
+
+def _block(secs: float) -> None:
+    time.sleep(secs)
+
+
+async def test_blocking_span_outside_sdk_is_attributed_to_innermost_frame() -> None:
+    monitor = LoopLagMonitor(interval_secs=0.01, threshold_secs=0.05)
+    await monitor.start()
+    try:
+        await asyncio.sleep(0.05)
+        _block(0.2)
+        await asyncio.sleep(0.05)
+    finally:
+        await monitor.stop()
+
+    [site] = monitor.blocked
+    assert 'test_loop_monitor.py' in site and '(_block)' in site
+    assert 0.15 < monitor.blocked_secs[site] < 0.5
+    assert monitor.max_lag_secs >= 0.15
+    assert monitor.summary()['lag'][50.0] < 0.05
+
+
+async def test_blocking_span_in_sdk_is_attributed_to_sdk_frame() -> None:
+    loads = json.loads
+
+    def slow_loads(text, *args, **kwargs):
+        time.sleep(0.2)
+        return loads(text, *args, **kwargs)
+
+    async with MockServer() as server:
+        with mock.patch.object(settings, 'loop_lag_probe_secs', 0.01), \
+                mock.patch.object(settings, 'loop_lag_threshold_secs', 0.05):
+            async with EyePopSdk.async_worker(eyepop_url=server.url, secret_key='secret',
+                                              pop_id='transient') as endpoint:
+                with mock.patch.object(worker_jobs.json, 'loads', slow_loads):
+                    job = await endpoint.load_from('http://media.test/image.jpg')
+                    while await job.predict() is not None:
+                        pass
+                await asyncio.sleep(0.05)
+                monitor = endpoint.loop_monitor
+
+    assert list(monitor.blocked) == [f'eyepop/worker/worker_jobs.py:{_line_of("json.loads(line)")} (_do_read_response)']
+
+
+def _line_of(code: str) -> int:
+    with open(worker_jobs.__file__) as f:
+        return next(i for i, line in enumerate(f, 1) if code in line)
+
+
+def test_call_site_without_frame() -> None:
+    assert call_site(None) == 'unknown'
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import pytest
+
+from eyepop.jobs import JobState
+from eyepop.metrics import LatencyHistogram, MetricCollector
+
+
+def test_histogram_percentiles_within_bucket_precision() -> None:
+    histogram = LatencyHistogram()
+    for millis in range(1, 1001):
+        histogram.record(millis / 1000)
+
+    assert histogram.count == 1000
+    assert histogram.mean() == pytest.approx(0.5005)
+    for p, expected in ((50.0, 0.5), (90.0, 0.9), (99.0, 0.99)):
+        assert histogram.percentile(p) == pytest.approx(expected, rel=1 / 16)
+    assert histogram.percentile(0.0) == pytest.approx(0.001, rel=1 / 16)
+    assert histogram.percentile(100.0) == pytest.approx(1.0, rel=1 / 16)
+    assert sum(count for _, count in histogram.buckets()) == 1000
+    assert len(histogram.buckets()) <= 10 * 16
+    with pytest.raises(ValueError):
+        histogram.percentile(101.0)
+
+
+def test_collector_tracks_states_without_holding_jobs() -> None:
+    class FakeJob:
+        pass
+
+    collector = MetricCollector()
+    jobs = [FakeJob() for _ in range(3)]
+    for job in jobs:
+        collector.created(job)
+        collector.started(job)
+    collector.first_result(jobs[0])
+    collector.failed(jobs[1])
+    collector.finished(jobs[1])
+    collector.drained(jobs[1])
+    collector.finished(jobs[1])
+
+    assert collector.total_number_of_jobs == 3
+    assert collector.max_number_of_jobs_by_state[JobState.STARTED] == 3
+    assert collector.number_of_jobs_by_state[JobState.STARTED] == 1
+    assert collector.number_of_jobs_by_state[JobState.IN_PROGRESS] == 1
+    assert collector.number_of_jobs_by_state[JobState.DRAINED] == 1
+    assert collector.number_of_jobs_reached_state[JobState.FAILED] == 1
+    assert collector.time_to_start.count == 3
+    assert collector.time_to_first_result.count == 1
+    assert collector.time_to_drain.count == 1
+
+    for job in jobs:
+        collector.finalized(job)
+    assert sum(collector.number_of_jobs_by_state.values()) == 0
+    assert collector.summary()['max_number_of_jobs_by_state']['STARTED'] == 3
@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import time
+
+from aiohttp import web
+
+from eyepop.events.Record import Record
+from eyepop.events.Result import Result
+from eyepop.request_tracer import RequestTracer, TraceEvent, TraceSpool
+
+
+def _event(tracer: RequestTracer, path: str, start: float, end: float | None) -> TraceEvent:
+    event = TraceEvent(f'id-{path}', time.time(), start, 'worker.test:443', 4, path)
+    if end is not None:
+        event.request_end = end
+        event.status = 200
+        event.result = Result.success
+        event.bytes_sent = 1024
+    tracer.events.append(event)
+    return event
+
+
+def test_take_matured_keeps_pending_and_recent_events() -> None:
+    tracer = RequestTracer(max_events=8)
+    now = time.monotonic()
+    done = _event(tracer, '/done', now - 30.0, now - 29.0)
+    pending = _event(tracer, '/pending', now - 30.0, None)
+    late = _event(tracer, '/late', now - 20.0, now - 1.0)
+    recent = _event(tracer, '/recent', now - 1.0, now - 0.5)
+
+    assert tracer.take_matured(10.0) == [done]
+    assert list(tracer.events) == [pending, late, recent]
+    assert tracer.take_matured(None) == [pending, late, recent]
+    assert len(tracer.events) == 0
+
+
+def test_ring_buffer_drops_oldest() -> None:
+    tracer = RequestTracer(max_events=2)
+    now = time.monotonic()
+    events = [_event(tracer, f'/{i}', now, now) for i in range(3)]
+    assert list(tracer.events) == events[1:]
+
+
+def test_encode_reuses_builder() -> None:
+    tracer = RequestTracer(max_events=8)
+    now = time.monotonic()
+    _event(tracer, '/a', now - 1.0, now - 0.75)
+    _event(tracer, '/b', now - 0.5, None)
+    _event(tracer, '/a', now - 0.25, now)
+    events = tracer.take_matured(None)
+
+    first = tracer.encode(events)
+    assert tracer.encode(events) == first
+
+    record = Record.GetRootAsRecord(first, 0)
+    assert record.HostsLength() == 1
+    assert [record.Paths(i) for i in range(record.PathsLength())] == [b'/a', b'/b']
+    decoded = [record.Events(i) for i in range(record.EventsLength())]
+    assert [event.XRequestId() for event in decoded] == [b'id-/a', b'id-/b', b'id-/a']
+    assert [event.PathIndex() for event in decoded] == [0, 1, 0]
+    assert decoded[0].WaitMs() == 250
+    assert decoded[0].BodyBytesSent() == 1024
+    assert decoded[1].Result() == Result.other
+    assert decoded[1].Status() == 0
+
+
+def test_spool_on_disk_is_bounded_and_survives_restart(tmp_path) -> None:
+    spool = TraceSpool(max_bytes=250, directory=str(tmp_path))
+    assert spool.put(b'a' * 100, 1) == 0
+    assert spool.put(b'b' * 100, 2) == 0
+    assert spool.put(b'c' * 100, 3) == 1
+    assert len(spool) == 2
+
+    reloaded = TraceSpool(max_bytes=250, directory=str(tmp_path))
+    assert reloaded.size == 200
+    assert reloaded.peek() == (2, b'b' * 100)
+    reloaded.pop()
+    assert reloaded.peek() == (3, b'c' * 100)
+    reloaded.pop()
+    assert reloaded.peek() is None
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_spool_skips_records_delivered_by_another_tracer(tmp_path) -> None:
+    spool = TraceSpool(max_bytes=1000, directory=str(tmp_path))
+    spool.put(b'a' * 100, 1)
+    spool.put(b'b' * 100, 2)
+    other = TraceSpool(max_bytes=1000, directory=str(tmp_path))
+    other.pop()
+
+    assert spool.peek() == (2, b'b' * 100)
+    assert len(spool) == 1
+    assert spool.size == 100
+
+
+def test_spool_skips_foreign_record_names(tmp_path, caplog) -> None:
+    spool = TraceSpool(max_bytes=1000, directory=str(tmp_path))
+    spool.put(b'a' * 100, 1)
+    (tmp_path / 'foreign.record').write_bytes(b'x')
+    (tmp_path / '00000000000000000001-.record').write_bytes(b'x')
+
+    reloaded = TraceSpool(max_bytes=1000, directory=str(tmp_path))
+    assert len(reloaded) == 1
+    assert reloaded.size == 100
+    assert reloaded.peek() == (1, b'a' * 100)
+    assert 'foreign.record' in caplog.text
+
+
+async def test_send_spools_while_events_endpoint_fails() -> None:
+    received = []
+    statuses = [503, 200, 200]
+
+    async def events(request: web.Request) -> web.Response:
+        assert request.headers['Content-Encoding'] == 'gzip'
+        # aiohttp.web decompresses the body
+        received.append(await request.read())
+        return web.Response(status=statuses.pop(0))
+
+    app = web.Application()
+    app.router.add_post('/events', events)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    url = f'http://127.0.0.1:{runner.addresses[0][1]}/events'
+
+    tracer = RequestTracer(max_events=8)
+    now = time.monotonic()
+    try:
+        _event(tracer, '/a', now - 1.0, now)
+        await tracer.send_and_reset(url, None, None, timeout=5.0)
+        assert len(tracer.spool) == 1
+        assert tracer.counters['send_failures'] == 1
+
+        _event(tracer, '/b', now - 1.0, now)
+        await tracer.send_and_reset(url, None, None, timeout=5.0)
+    finally:
+        await tracer.close()
+        await runner.cleanup()
+
+    assert len(tracer.spool) == 0
+    assert tracer.counters['events_sent'] == 2
+    paths = [Record.GetRootAsRecord(body, 0).Paths(0) for body in received]
+    assert paths == [b'/a', b'/a', b'/b']
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import io
+
+import aiohttp
+
+from eyepop import EyePopSdk
+from eyepop.data.types.vlm import InferRequest
+from eyepop.testing import MockServer, RouteBehavior
+
+
+async def _frames(job) -> int:
+    frames = 0
+    while await job.predict() is not None:
+        frames += 1
+    return frames
+
+
+async def test_worker_sources() -> None:
+    async with MockServer(frames_per_video=5) as server:
+        async with EyePopSdk.async_worker(eyepop_url=server.url, secret_key='secret', pop_id='transient') as endpoint:
+            assert await _frames(await endpoint.load_from('http://media.test/clip.mp4')) == 5
+            assert await _frames(await endpoint.upload('tests/test.jpg')) == 1
+            job = await endpoint.upload_stream(io.BytesIO(b'x' * 100_000), 'video/mp4')
+            assert await _frames(job) == 5
+
+    assert server.requests['prepare_source'] == 1
+    assert server.bytes_received >= 100_000
+
+
+async def test_compute_session() -> None:
+    async with MockServer() as server:
+        async with EyePopSdk.async_worker(eyepop_url=server.url, api_key='api key') as endpoint:
+            prediction = await (await endpoint.load_from('http://media.test/image.jpg')).predict()
+            assert prediction['objects'][0]['classLabel'] == 'person'
+
+    assert server.requests['sessions'] >= 1
+
+
+async def test_route_errors() -> None:
+    async with MockServer(routes={'health': RouteBehavior(error_rate=1.0, error_status=502)}) as server:
+        async with aiohttp.ClientSession() as session:
+            async with session.get(f'{server.url}/health') as response:
+                assert response.status == 502
+
+    assert server.errors == {'health': 1}
+
+
+async def test_data_endpoint() -> None:
+    async with MockServer(num_assets=25, routes={'infer': RouteBehavior(latency_secs=0.2)},
+                          infer_wait_secs=0.05) as server:
+        async with EyePopSdk.dataEndpoint(eyepop_url=server.url, secret_key='secret', is_async=True,
+                                          disable_ws=True) as endpoint:
+            assert len(await endpoint.list_assets('dataset')) == 25
+            assert len([asset async for asset in endpoint.iter_assets('dataset', page_size=10)]) == 25
+            job = await endpoint.infer_asset('asset', InferRequest(text_prompt='what is it?'))
+            result = await job.predict()
+            assert result['objects'][0]['classLabel'] == 'person'
+
+    assert server.requests['assets'] == 4
+    assert server.requests['infer_status'] >= 1
@@ -0,0 +1,86 @@
+import json
+import time
+from unittest import mock as unittest_mock
+
+import aiohttp
+from aioresponses import CallbackResult, aioresponses
+
+from eyepop import EyePopSdk
+from eyepop.metrics import EndpointMetrics, route_of
+from eyepop.metrics_exporter import MetricsServer, render
+from eyepop.settings import settings
+from eyepop.worker.worker_types import Pop
+from tests.worker.base_endpoint_test import BaseEndpointTest
+
+
+class TestEndpointMetrics(BaseEndpointTest):
+    test_source_id = 'test_source_id'
+
+    def test_route_of(self):
+        self.assertEqual(route_of('/pipelines/0123456789abcdef0123456789abcdef/source'),
+                         '/pipelines/{id}/source')
+        self.assertEqual(route_of('/api/v1/infer/42'), '/api/v1/infer/{id}')
+        self.assertEqual(route_of('/authentication/token'), '/authentication/token')
+
+    def test_render_without_requests(self):
+        metrics = EndpointMetrics()
+        metrics.add_gauge('test_gauge', 'A test gauge.', lambda: [({'name': 'a"b'}, 1.5)])
+        text = render(metrics)
+        self.assertIn('# TYPE eyepop_job_time_to_start_seconds histogram', text)
+        self.assertIn('eyepop_job_time_to_start_seconds_bucket{le="+Inf"} 0', text)
+        self.assertIn('eyepop_test_gauge{name="a\\"b"} 1.5', text)
+
+    async def test_request_metrics(self):
+        metrics = EndpointMetrics()
+        server = MetricsServer(metrics, port=0)
+        await server.start()
+        try:
+            async with aiohttp.ClientSession(trace_configs=[metrics.get_trace_config()]) as session:
+                for path in ('metrics', 'metrics', 'missing'):
+                    async with session.get(f'http://127.0.0.1:{server.port}/{path}') as resp:
+                        await resp.read()
+        finally:
+            await server.stop()
+
+        self.assertEqual(metrics.requests, {('GET', '/metrics', '200'): 2, ('GET', '/missing', '404'): 1})
+        self.assertEqual(metrics.request_latency[('GET', '/metrics')].count, 2)
+        self.assertGreater(metrics.bytes_received[('GET', '/metrics')], 0)
+        text = render(metrics)
+        self.assertIn('eyepop_requests_total{method="GET",route="/metrics",status="200"} 2', text)
+        self.assertIn('eyepop_request_duration_seconds_count{method="GET",route="/metrics"} 2', text)
+
+    @aioresponses(passthrough=['http://127.0.0.1'])
+    async def test_metrics_server(self, mock: aioresponses):
+        self.setup_base_mock(mock)
+        mock.post(f'{self.test_eyepop_url}/authentication/token', status=200, body=json.dumps(
+            {'expires_in': 1000 * 1000, 'token_type': 'Bearer', 'access_token': self.test_access_token}))
+        mock.get(f'{self.test_worker_url}/pipelines/{self.test_pipeline_id}', status=200,
+                 body=json.dumps({'pop': Pop(components=[]).model_dump()}))
+        load_url = f'{self.test_worker_url}/pipelines/{self.test_pipeline_id}/source?mode=queue&processing=sync'
+        mock.patch(load_url, status=503)
+        mock.patch(load_url, callback=lambda url, **kwargs: CallbackResult(status=200, body=json.dumps(
+            {'source_id': self.test_source_id, 'seconds': 0, 'system_timestamp': time.time_ns()})))
+
+        with unittest_mock.patch.object(settings, 'collect_metrics', True):
+            async with EyePopSdk.async_worker(
+                    eyepop_url=self.test_eyepop_url,
+                    secret_key=self.test_eyepop_secret_key,
+                    pop_id=self.test_eyepop_pop_id,
+            ) as endpoint:
+                endpoint.add_retry_handler(503, unittest_mock.AsyncMock(return_value=True))
+                job = await endpoint.load_from('http://example-media.test/test.png')
+                self.assertEqual((await job.predict())['source_id'], self.test_source_id)
+                self.assertIsNone(await job.predict())
+                server = await endpoint.start_metrics_server(port=0)
+                async with aiohttp.ClientSession() as session:
+                    async with session.get(f'http://127.0.0.1:{server.port}/metrics') as resp:
+                        self.assertTrue(resp.headers['Content-Type'].startswith('text/plain'))
+                        text = await resp.text()
+
+        self.assertIn('eyepop_jobs_created_total 1', text)
+        self.assertIn('eyepop_job_time_to_drain_seconds_count 1', text)
+        self.assertIn('eyepop_job_semaphore_wait_seconds_count 1', text)
+        self.assertIn('eyepop_request_retries_total{status="503"} 1', text)
+        self.assertIn(f'eyepop_load_balancer_entry_healthy{{base_url="{self.test_worker_url}",'
+                      f'pipeline_id="{self.test_pipeline_id}"}} 1.0', text)
+        self.assertIn('eyepop_jobs_in_flight 0', text)
@@ -0,0 +1,93 @@
+import json
+import time
+import unittest
+from importlib.util import find_spec
+from unittest import mock as unittest_mock
+
+import aiohttp
+from aiohttp import web
+from aioresponses import CallbackResult, aioresponses
+
+from eyepop import EyePopSdk, telemetry
+from eyepop.settings import settings
+from eyepop.worker.worker_types import Pop
+from tests.worker.base_endpoint_test import BaseEndpointTest
+
+
+@unittest.skipIf(find_spec('opentelemetry.sdk') is None, 'requires opentelemetry-sdk')
+class TestEndpointTracing(BaseEndpointTest):
+    test_source_id = 'test_source_id'
+
+    def setUp(self):
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+        from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+        self.exporter = InMemorySpanExporter()
+        provider = TracerProvider()
+        provider.add_span_processor(SimpleSpanProcessor(self.exporter))
+        self.tracer = provider.get_tracer('eyepop')
+
+    def spans_by_name(self):
+        return {span.name: span for span in self.exporter.get_finished_spans()}
+
+    async def test_trace_config_propagates_traceparent(self):
+        async def echo_traceparent(request: web.Request) -> web.Response:
+            return web.Response(text=request.headers.get('traceparent', ''))
+
+        app = web.Application()
+        app.router.add_get('/pipelines/{pipeline_id}/source', echo_traceparent)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, '127.0.0.1', 0)
+        await site.start()
+        port = runner.addresses[0][1]
+        try:
+            async with aiohttp.ClientSession(trace_configs=[telemetry.get_trace_config(self.tracer)]) as session:
+                with self.tracer.start_as_current_span('parent'):
+                    async with session.get(f'http://127.0.0.1:{port}/pipelines/{"a" * 32}/source') as resp:
+                        traceparent = await resp.text()
+        finally:
+            await runner.cleanup()
+
+        spans = self.spans_by_name()
+        request_span = spans['GET /pipelines/{id}/source']
+        self.assertEqual(request_span.parent.span_id, spans['parent'].context.span_id)
+        self.assertEqual(request_span.attributes['http.response.status_code'], 200)
+        self.assertTrue(traceparent.startswith(
+            f'00-{request_span.context.trace_id:032x}-{request_span.context.span_id:016x}-'))
+
+    @aioresponses()
+    async def test_job_spans(self, mock: aioresponses):
+        self.setup_base_mock(mock)
+        mock.post(f'{self.test_eyepop_url}/authentication/token', status=200, body=json.dumps(
+            {'expires_in': 1000 * 1000, 'token_type': 'Bearer', 'access_token': self.test_access_token}))
+        mock.get(f'{self.test_worker_url}/pipelines/{self.test_pipeline_id}', status=200,
+                 body=json.dumps({'pop': Pop(components=[]).model_dump()}))
+        load_url = f'{self.test_worker_url}/pipelines/{self.test_pipeline_id}/source?mode=queue&processing=sync'
+        mock.patch(load_url, status=503)
+        mock.patch(load_url, callback=lambda url, **kwargs: CallbackResult(status=200, body=json.dumps(
+            {'source_id': self.test_source_id, 'seconds': 0, 'system_timestamp': time.time_ns()})))
+
+        with unittest_mock.patch.object(settings, 'otel_tracing', True), \
+                unittest_mock.patch.object(telemetry, 'get_tracer', return_value=self.tracer):
+            async with EyePopSdk.async_worker(
+                    eyepop_url=self.test_eyepop_url,
+                    secret_key=self.test_eyepop_secret_key,
+                    pop_id=self.test_eyepop_pop_id,
+            ) as endpoint:
+                endpoint.add_retry_handler(503, unittest_mock.AsyncMock(return_value=True))
+                job = await endpoint.load_from('http://example-media.test/test.png')
+                self.assertEqual((await job.predict())['source_id'], self.test_source_id)
+                self.assertIsNone(await job.predict())
+
+        spans = self.spans_by_name()
+        self.assertEqual(spans['eyepop.token_refresh'].parent.span_id, spans['eyepop.reconnect'].context.span_id)
+        job_span = spans['_LoadFromJob']
+        execute_span = spans['execute']
+        self.assertEqual(execute_span.parent.span_id, job_span.context.span_id)
+        self.assertEqual([event.name for event in job_span.events], ['started', 'first_result', 'drained'])
+        retry = execute_span.events[0]
+        self.assertEqual(retry.name, 'retry')
+        self.assertEqual(retry.attributes['http.response.status_code'], '503')
+        self.assertLessEqual(execute_span.end_time, job_span.end_time)
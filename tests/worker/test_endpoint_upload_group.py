@@ -1,4 +1,7 @@
+import asyncio
 import json
+import os
+import tempfile
 import time
 from importlib import resources
 
@@ -7,7 +10,8 @@ from aioresponses import CallbackResult, aioresponses
 
 import tests
 from eyepop import EyePopSdk
-from eyepop.worker.worker_types import Pop
+from eyepop.worker.worker_jobs import _UploadFileGroupJob
+from eyepop.worker.worker_types import ComponentParams, Pop
 from tests.worker.base_endpoint_test import BaseEndpointTest
 
 
@@ -105,3 +109,66 @@ class TestEndpointUploadGroup(BaseEndpointTest):
         ) as endpoint:
             with self.assertRaises(ValueError):
                 await endpoint.upload_group([])
+
+    @pytest.mark.asyncio
+    async def test_group_multipart_prefetch(self):
+        class _Collect:
+            def __init__(self):
+                self.buffer = bytearray()
+
+            async def write(self, chunk: bytes):
+                self.buffer.extend(chunk)
+
+        members = []
+        with tempfile.TemporaryDirectory() as directory:
+            for i in range(6):
+                location = os.path.join(directory, f'member_{i}.jpg')
+                with open(location, 'wb') as f:
+                    f.write(f'member-{i}-'.encode() * 1000)
+                members.append(location)
+            job = _UploadFileGroupJob(
+                locations=members,
+                component_params=[ComponentParams(componentId=1, values={'prompt': 'x'})],
+                roi=None,
+                media_cache_seconds=None,
+                session=None,  # type: ignore[arg-type]
+            )
+            bodies = []
+            for _ in range(2):
+                # a retry re-opens the writer with a fresh boundary
+                collect = _Collect()
+                mp_writer = job.open_mp_writer()
+                await mp_writer.write(collect)
+                bodies.append(bytes(collect.buffer).replace(mp_writer.boundary.encode(), b'BOUNDARY'))
+
+        positions = [bodies[0].index(f'member-{i}-'.encode()) for i in range(6)]
+        self.assertEqual(positions, sorted(positions))
+        self.assertLess(bodies[0].index(b'name="params"'), positions[0])
+        self.assertEqual(bodies[0].count(b'name="file"'), 6)
+        self.assertEqual(bodies[0], bodies[1])
+
+    @pytest.mark.asyncio
+    async def test_group_prefetch_closed_on_retry(self):
+        with tempfile.TemporaryDirectory() as directory:
+            members = []
+            for i in range(6):
+                location = os.path.join(directory, f'member_{i}.jpg')
+                with open(location, 'wb') as f:
+                    f.write(b'member')
+                members.append(location)
+            job = _UploadFileGroupJob(
+                locations=members,
+                component_params=None,
+                roi=None,
+                media_cache_seconds=None,
+                session=None,  # type: ignore[arg-type]
+            )
+            job.open_mp_writer()
+            first_reads = [read for read in job._prefetcher.reads if read is not None]  # type: ignore[union-attr]
+            # a retry re-opens the writer, the reads of the failed attempt are canceled
+            job.open_mp_writer()
+            await asyncio.gather(*first_reads, return_exceptions=True)
+            self.assertEqual(len(first_reads), 4)
+            self.assertTrue(all(read.cancelled() for read in first_reads))
+            job._close_prefetcher()
+            self.assertIsNone(job._prefetcher)
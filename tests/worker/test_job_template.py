@@ -0,0 +1,107 @@
+import json
+import time
+
+import pytest
+from aioresponses import CallbackResult, aioresponses
+
+from eyepop import EyePopSdk
+from eyepop.data.types.asset import RectangleArea
+from eyepop.worker.worker_jobs import JobTemplate, _LoadFromAssetUuidJob, _LoadFromJob
+from eyepop.worker.worker_types import (
+    DEFAULT_PREDICTION_VERSION,
+    ComponentParams,
+    MotionDetectConfig,
+    Pop,
+    PredictionVersion,
+    VideoMode,
+)
+from tests.worker.base_endpoint_test import BaseEndpointTest
+
+
+class TestJobTemplate(BaseEndpointTest):
+    test_source_id = 'test_source_id'
+    test_params = [ComponentParams(componentId=1, values={'prompt': 'person'})]
+    test_motion_detect = MotionDetectConfig(motionSensitivity=0.25)
+    test_roi = RectangleArea(x=0.1, y=0.2, width=0.3, height=0.4)
+
+    def test_bodies_match_per_job_serialization(self):
+        template = JobTemplate(component_params=self.test_params, motion_detect=self.test_motion_detect,
+                               roi=self.test_roi, fps='5', media_cache_seconds=10)
+        params = [param.model_dump() for param in self.test_params]
+        roi = self.test_roi.model_dump(exclude_none=True)
+
+        self.assertEqual(template.load_from_body(['http://a.test/"x".png']), json.dumps({
+            'sourceType': 'URL', 'url': 'http://a.test/"x".png', 'version': DEFAULT_PREDICTION_VERSION,
+            **self.test_motion_detect.model_dump(exclude_none=True),
+            'params': params, 'roi': roi, 'fps': '5', 'mediaCacheSeconds': 10,
+        }))
+        self.assertEqual(template.load_from_body(['http://a.test/1.png', 'http://a.test/2.png']), json.dumps({
+            'sourceType': 'GROUP',
+            'sources': [{'sourceType': 'URL', 'url': 'http://a.test/1.png'},
+                        {'sourceType': 'URL', 'url': 'http://a.test/2.png'}],
+            'version': DEFAULT_PREDICTION_VERSION, 'params': params, 'roi': roi, 'mediaCacheSeconds': 10,
+        }))
+        self.assertEqual(template.load_asset_body('asset_0'), json.dumps({
+            'sourceType': 'ASSET_UUID', 'assetUuid': 'asset_0', 'version': DEFAULT_PREDICTION_VERSION,
+            **self.test_motion_detect.model_dump(), 'roi': roi, 'params': params, 'mediaCacheSeconds': 10,
+        }))
+
+        upload_url = template.upload_url(VideoMode.BUFFER, None, None, 'sync')
+        self.assertIs(template.upload_url(VideoMode.BUFFER, None, None, 'sync'), upload_url)
+        self.assertTrue(upload_url.startswith('source?mode=queue&videoMode=buffer&version='))
+        self.assertTrue(template.upload_url(None, None, None, 'async', 'src').endswith('&processing=async&sourceId=src'))
+
+    def test_template_shared_by_jobs(self):
+        template = JobTemplate(component_params=self.test_params)
+        first = _LoadFromJob(['http://a.test/1.png'], None, None, None, None, None, session=None,  # type: ignore[arg-type]
+                             template=template)
+        second = _LoadFromAssetUuidJob('asset_0', None, None, None, None, None, session=None,  # type: ignore[arg-type]
+                                       template=template)
+        self.assertEqual(json.loads(first.body)['params'], json.loads(second.body)['params'])
+        with self.assertRaises(ValueError):
+            _LoadFromJob(['http://a.test/1.png'], self.test_params, None, None, None, None,
+                         session=None, template=template)  # type: ignore[arg-type]
+        with self.assertRaises(ValueError):
+            _LoadFromJob(['http://a.test/1.png', 'http://a.test/2.png'], None, None, None, None, None,
+                         session=None, template=JobTemplate(fps='5'))  # type: ignore[arg-type]
+        v1_template = JobTemplate(version=PredictionVersion.V1)
+        v1_job = _LoadFromJob(['http://a.test/1.png'], None, None, None, None, None, session=None,  # type: ignore[arg-type]
+                              template=v1_template, version=PredictionVersion.V1)
+        self.assertEqual(json.loads(v1_job.body)['version'], PredictionVersion.V1)
+        with self.assertRaises(ValueError):
+            _LoadFromJob(['http://a.test/1.png'], None, None, None, None, None, session=None,  # type: ignore[arg-type]
+                         template=v1_template, version=PredictionVersion.V2)
+
+    @aioresponses()
+    @pytest.mark.asyncio
+    async def test_async_load_from_with_template(self, mock: aioresponses):
+        self.setup_base_mock(mock)
+        mock.post(f'{self.test_eyepop_url}/authentication/token', status=200, body=json.dumps(
+            {'expires_in': 1000 * 1000, 'token_type': 'Bearer', 'access_token': self.test_access_token}))
+        mock.get(f'{self.test_worker_url}/pipelines/{self.test_pipeline_id}', status=200,
+                 body=json.dumps({'pop': Pop(components=[]).model_dump()}))
+        bodies = []
+
+        def load(url, **kwargs) -> CallbackResult:
+            bodies.append(json.loads(kwargs['data']))
+            return CallbackResult(status=200, body=json.dumps(
+                {'source_id': self.test_source_id, 'seconds': 0, 'system_timestamp': time.time_ns()}))
+
+        mock.patch(f'{self.test_worker_url}/pipelines/{self.test_pipeline_id}/source?mode=queue&processing=sync',
+                   callback=load, repeat=True)
+
+        async with EyePopSdk.async_worker(
+                eyepop_url=self.test_eyepop_url,
+                secret_key=self.test_eyepop_secret_key,
+                pop_id=self.test_eyepop_pop_id,
+        ) as endpoint:
+            template = endpoint.job_template(params=self.test_params, roi=self.test_roi,
+                                             version=PredictionVersion.V1)
+            for i in range(3):
+                job = await endpoint.load_from(f'http://example-media.test/{i}.png', template=template)
+                self.assertEqual((await job.predict())['source_id'], self.test_source_id)
+
+        self.assertEqual([body['url'] for body in bodies], [f'http://example-media.test/{i}.png' for i in range(3)])
+        self.assertTrue(all(body['params'] == bodies[0]['params'] for body in bodies))
+        self.assertEqual(bodies[0]['roi'], self.test_roi.model_dump(exclude_none=True))
+        self.assertTrue(all(body['version'] == PredictionVersion.V1 for body in bodies))
@@ -0,0 +1,61 @@
+import json
+import time
+from unittest import mock as unittest_mock
+
+from aioresponses import CallbackResult, aioresponses
+
+from eyepop import EyePopSdk
+from eyepop.jobs import Job
+from eyepop.worker import worker_syncify
+from eyepop.worker.worker_types import Pop
+from tests.worker.base_endpoint_test import BaseEndpointTest
+
+
+class TestSyncResultBatch(BaseEndpointTest):
+    test_url = 'http://examle-media.test/test.mp4'
+
+    async def test_pop_results_defers_error(self):
+        job = Job(session=None, on_ready=None)  # type: ignore[arg-type]
+        for i in range(3):
+            await job.push_message({'seconds': i})
+        await job._queue.put(ValueError('test failure'))  # type: ignore[union-attr]
+
+        self.assertEqual(await job.pop_results(2), [{'seconds': 0}, {'seconds': 1}])
+        self.assertEqual(await job.pop_results(8), [{'seconds': 2}])
+        with self.assertRaises(ValueError):
+            await job.pop_results(8)
+        self.assertEqual(await job.pop_results(8), [None])
+
+    @aioresponses()
+    def test_sync_predict_batches_round_trips(self, mock: aioresponses):
+        self.setup_base_mock(mock)
+        mock.post(f'{self.test_eyepop_url}/authentication/token', status=200, body=json.dumps(
+            {'expires_in': 1000 * 1000, 'token_type': 'Bearer', 'access_token': self.test_access_token}))
+        mock.get(f'{self.test_worker_url}/pipelines/{self.test_pipeline_id}', status=200,
+                 body=json.dumps({'pop': Pop(components=[]).model_dump()}))
+        lines = [{'source_id': 'test', 'seconds': i} for i in range(100)]
+        lines.insert(50, {'event': {'type': 'info', 'message': 'skipped'}})
+        lines.append({'event': 'error', 'source_id': 'test', 'message': 'test failure'})
+
+        def load_from(url, **kwargs) -> CallbackResult:
+            return CallbackResult(status=200, body='\n'.join(json.dumps(line) for line in lines))
+
+        mock.patch(f'{self.test_worker_url}/pipelines/{self.test_pipeline_id}/source?mode=queue&processing=sync',
+                   callback=load_from)
+
+        with EyePopSdk.sync_worker(
+                eyepop_url=self.test_eyepop_url,
+                secret_key=self.test_eyepop_secret_key,
+                pop_id=self.test_eyepop_pop_id,
+        ) as endpoint:
+            job = endpoint.load_from(self.test_url)
+            time.sleep(0.2)
+            with unittest_mock.patch.object(worker_syncify, 'run_coro_thread_save',
+                                            wraps=worker_syncify.run_coro_thread_save) as round_trips:
+                seconds = []
+                with self.assertRaises(ValueError):
+                    while (result := job.predict()) is not None:
+                        seconds.append(result['seconds'])
+
+        self.assertEqual(seconds, list(range(100)))
+        self.assertLess(round_trips.call_count, 10)